@@ -0,0 +1,57 @@
+import os
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+
+import instrument
+from data_handler import write_patches
+
+
+def autosave_temp_path(workbook_path):
+    # 같은 폴더에 써야 os.replace 로 원자적으로 교체할 수 있다
+    directory, name = os.path.split(os.path.abspath(workbook_path))
+    return os.path.join(directory, f'.{name}.autosave.xlsx')
+
+
+class AutosaveWorker(QObject):
+    # 워커 스레드에서 변경 셀을 원본 통합 문서에 반영, 임시 파일에 저장한 뒤 원본과 교체한다
+    # GUI 스레드에서 만든 값 사본(patches)만 사용하므로 저장 중에도 편집을 계속할 수 있다
+    finished = pyqtSignal(int, object)  # 반영된 마지막 편집 번호, 저장한 {시트 이름: [(row, col, value)]}
+    failed = pyqtSignal(str)
+
+    def __init__(self, workbook_path, patches, seq):
+        super().__init__()
+        self.workbook_path = workbook_path
+        self.patches = patches
+        self.seq = seq
+
+    @pyqtSlot()
+    def run(self):
+        temp_path = autosave_temp_path(self.workbook_path)
+        try:
+            with instrument.span('autosave', cells=sum(len(values) for values in self.patches.values())):
+                write_patches(self.workbook_path, temp_path, self.patches)
+                os.replace(temp_path, self.workbook_path)
+        except Exception as e:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(self.seq, self.patches)
+
+
+def start_autosave(workbook_path, patches, seq, parent=None):
+    # 워커와 스레드를 만들어 자동 저장을 시작, 스레드는 작업이 끝나면 스스로 정리된다
+    thread = QThread(parent)
+    worker = AutosaveWorker(workbook_path, patches, seq)
+    worker.moveToThread(thread)
+
+    thread.started.connect(worker.run)
+    for signal in (worker.finished, worker.failed):
+        signal.connect(thread.quit)
+    thread.finished.connect(worker.deleteLater)
+    thread.finished.connect(thread.deleteLater)
+
+    thread.start()
+    return thread, worker
@@ -0,0 +1,139 @@
+# GUI 없이 여러 엑셀 파일의 사분면 차트를 PNG/SVG/PDF 로 저장하는 명령행 도구
+# 사용법: python batch_render.py backlog1.xlsx backlog2.xlsx --axes Impact:Effort --format png pdf --out charts
+import argparse
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from common import TEXT_COLUMN_LIST
+from data_handler import DataHandler
+from quadrant import draw_quadrant_chart, generate_colors
+
+FORMATS = ('png', 'svg', 'pdf')
+
+
+def default_axes(data):
+    # 축을 지정하지 않으면 GUI 콤보박스에 나오는 첫 두 컬럼 사용
+    columns = [col for col in data.columns if not any(text in str(col) for text in TEXT_COLUMN_LIST)]
+    if len(columns) < 2:
+        raise ValueError("at least two numeric columns are required")
+    return [(columns[0], columns[1])]
+
+
+def output_path(out_dir, file_path, x_column, y_column, fmt):
+    stem = os.path.splitext(os.path.basename(file_path))[0]
+    name = re.sub(r'[^\w.-]+', '_', f"{stem}_{x_column}_vs_{y_column}")
+    return os.path.join(out_dir, f"{name}.{fmt}")
+
+
+def render_file(file_path, axis_pairs, formats, out_dir, options):
+    # 파일 하나를 읽어서 축 조합마다 차트를 저장, 프로세스 풀의 작업 단위
+    timings = {'file': file_path, 'outputs': []}
+
+    start = time.perf_counter()
+    handler = DataHandler()
+    handler.load_data(file_path)
+    handler.calculate_formulas()
+    data = handler.get_data()
+    timings['rows'] = data.shape[0]
+    timings['load'] = time.perf_counter() - start
+
+    # 없는 축 컬럼이 있으면 차트를 하나도 저장하기 전에 파일 이름과 컬럼 이름으로 알린다
+    axis_pairs = axis_pairs or default_axes(data)
+    missing = list(dict.fromkeys(name for pair in axis_pairs for name in (*pair, 'Key') if name not in data.columns))
+    if missing:
+        raise ValueError(f"{os.path.basename(file_path)}: missing columns {', '.join(map(str, missing))}")
+
+    colors = generate_colors(data.shape[0], seed=options['seed'])
+    timings['plot'] = 0.0
+    timings['save'] = 0.0
+
+    for x_column, y_column in axis_pairs:
+        start = time.perf_counter()
+        chart_data = handler.get_table_data([x_column, y_column, 'Key'])
+        figure = Figure(figsize=options['size'], dpi=options['dpi'])
+        FigureCanvasAgg(figure)
+        axes = figure.add_subplot(111)
+        draw_quadrant_chart(axes, chart_data[x_column].to_numpy(dtype=float), chart_data[y_column].to_numpy(dtype=float),
+                            chart_data['Key'].tolist(), colors, x_column, y_column,
+                            x_mid=options['x_mid'], y_mid=options['y_mid'],
+                            is_x_reversed=options['reverse_x'], is_y_reversed=options['reverse_y'])
+        timings['plot'] += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for fmt in formats:
+            path = output_path(out_dir, file_path, x_column, y_column, fmt)
+            figure.savefig(path, format=fmt)
+            timings['outputs'].append(path)
+        timings['save'] += time.perf_counter() - start
+
+    timings['total'] = timings['load'] + timings['plot'] + timings['save']
+    return timings
+
+
+def parse_axes(values):
+    pairs = []
+    for value in values or []:
+        if ':' not in value:
+            raise argparse.ArgumentTypeError(f"axes must look like X:Y, got {value!r}")
+        x_column, y_column = value.split(':', 1)
+        pairs.append((x_column, y_column))
+    return pairs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render quadrant charts from workbooks without the GUI.')
+    parser.add_argument('files', nargs='+', help='workbooks to render')
+    parser.add_argument('--axes', action='append', metavar='X:Y',
+                        help='axis column pair, repeat for several charts per file (default: first two numeric columns)')
+    parser.add_argument('--format', nargs='+', choices=FORMATS, default=['png'], dest='formats')
+    parser.add_argument('--out', default='.', help='output directory')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--reverse-x', action='store_true')
+    parser.add_argument('--reverse-y', action='store_true')
+    parser.add_argument('--x-mid', type=float, default=None, help='vertical midline position')
+    parser.add_argument('--y-mid', type=float, default=None, help='horizontal midline position')
+    parser.add_argument('--size', type=float, nargs=2, default=(12, 9), metavar=('W', 'H'), help='figure size in inches')
+    parser.add_argument('--dpi', type=int, default=100)
+    parser.add_argument('--seed', type=int, default=0, help='seed for label colors')
+    args = parser.parse_args(argv)
+
+    axis_pairs = parse_axes(args.axes)
+    os.makedirs(args.out, exist_ok=True)
+    options = {
+        'reverse_x': args.reverse_x,
+        'reverse_y': args.reverse_y,
+        'x_mid': args.x_mid,
+        'y_mid': args.y_mid,
+        'size': tuple(args.size),
+        'dpi': args.dpi,
+        'seed': args.seed
+    }
+
+    failed = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {executor.submit(render_file, path, axis_pairs, args.formats, args.out, options): path
+                   for path in args.files}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                t = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"FAILED {path}: {e}", file=sys.stderr)
+                continue
+            print(f"{path}: {t['rows']} rows, load {t['load']:.2f}s, plot {t['plot']:.2f}s, "
+                  f"save {t['save']:.2f}s, total {t['total']:.2f}s -> {len(t['outputs'])} file(s)")
+
+    print(f"{len(args.files) - failed}/{len(args.files)} workbooks rendered in {time.perf_counter() - start:.2f}s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
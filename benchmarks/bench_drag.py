@@ -0,0 +1,128 @@
+# 차트 백엔드별 점 드래그 프레임 시간 비교 (matplotlib ChartCanvas, Qt 래스터 QtChartCanvas)
+# offscreen Qt 플랫폼에서 캔버스에 실제 Qt 마우스 이벤트를 보내고, 이벤트 처리부터 화면 갱신(paint)까지를 한 프레임으로 잰다
+# matplotlib 백엔드는 점이 많으면 hexbin 으로 집계하므로 run_suite.py 와 같이 잡은 점 주변을 확대한 뒤 드래그한다
+# 사용법: python benchmarks/bench_drag.py [--points 1000 50000] [--steps 60] [--size 1200 900]
+#
+# 측정 결과 (1200x900, 60 프레임, 두 번 실행한 범위, Linux, Python 3.11, offscreen)
+#   points   backend      frame mean       fps          drag start     release
+#   1,000    matplotlib   7.1 ~ 10.0 ms    100 ~ 140    2.4 ~ 3.2 s    2.4 s     (모든 레이블을 다시 그린다)
+#   1,000    qt raster    0.25 ~ 0.29 ms   3400 ~ 3900  43 ~ 51 ms     41 ~ 44 ms
+#   50,000   matplotlib   8.8 ~ 9.0 ms     112 ~ 114    0.95 ~ 1.0 s   0.7 s     (점 주변 확대, 보이는 점은 몇 개)
+#   50,000   qt raster    0.15 ~ 0.36 ms   2700 ~ 6800  81 ~ 82 ms     76 ~ 93 ms  (전체 50,000개 표시)
+# Qt 래스터는 드래그 중 점과 레이블 item 위치만 바뀌므로 프레임 비용이 점 개수와 관계없고,
+# 정적인 이미지는 드래그 시작과 끝에 한 번씩만 그린다 (50,000개 기준 점 찍기 약 60 ms)
+import argparse
+import os
+import sys
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from PyQt5.QtCore import Qt, QEvent, QPointF  # noqa: E402
+from PyQt5.QtGui import QMouseEvent  # noqa: E402
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+from chart import ChartCanvas  # noqa: E402
+from qt_chart import QtChartCanvas  # noqa: E402
+from quadrant import generate_colors  # noqa: E402
+from run_suite import summarize, timed  # noqa: E402
+
+BACKENDS = {'matplotlib': ChartCanvas, 'qt raster': QtChartCanvas}
+
+
+def make_data(points, seed=0):
+    # generate.py 와 같은 0~100 사이의 소수 첫째 자리 값
+    rng = np.random.default_rng(seed)
+    keys = np.array([f'K-{i}' for i in range(points)], dtype=object)
+    data = pd.DataFrame({'X': np.round(rng.uniform(0, 100, points), 1), 'Y': np.round(rng.uniform(0, 100, points), 1),
+                         'Key': keys, 'Summary': keys})
+    return data
+
+
+def target(canvas):
+    # 이벤트를 받는 위젯
+    return canvas.viewport() if isinstance(canvas, QtChartCanvas) else canvas
+
+
+def to_widget(canvas, x, y):
+    # 데이터 좌표 -> 위젯 좌표
+    if isinstance(canvas, QtChartCanvas):
+        return canvas.to_pixels(x, y)
+    px, py = canvas.axes.transData.transform((x, y))
+    return px / canvas.device_pixel_ratio, canvas.height() - py / canvas.device_pixel_ratio
+
+
+def send(canvas, kind, x, y):
+    buttons = {QEvent.MouseButtonPress: (Qt.LeftButton, Qt.LeftButton),
+               QEvent.MouseMove: (Qt.NoButton, Qt.LeftButton),
+               QEvent.MouseButtonRelease: (Qt.LeftButton, Qt.NoButton)}[kind]
+    event = QMouseEvent(kind, QPointF(*to_widget(canvas, x, y)), *buttons, Qt.NoModifier)
+    QApplication.sendEvent(target(canvas), event)
+
+
+def run_backend(app, backend, data, steps, size):
+    canvas = BACKENDS[backend]()
+    canvas.resize(*size)
+    canvas.show()
+    app.processEvents()
+    canvas.plot(data, 'X', 'Y', generate_colors(len(data)))
+    canvas.scheduler.flush()
+    app.processEvents()
+
+    def frame(kind, x, y):
+        send(canvas, kind, x, y)
+        canvas.scheduler.flush()
+        app.processEvents()
+
+    # 마지막 row 의 점을 누른다, 레이블이 겹쳐 다른 점이 잡히면 그 점을 드래그
+    i = len(data) - 1
+    x, y = data.iat[i, 0], data.iat[i, 1]
+    if isinstance(canvas, ChartCanvas) and canvas.is_lod_active():
+        canvas.axes.set_xlim(x - 0.5, x + 0.5)
+        canvas.axes.set_ylim(y - 0.5, y + 0.5)
+        canvas.draw()
+        app.processEvents()
+
+    frame(QEvent.MouseButtonPress, x, y)
+    if canvas.selected_index is None:
+        canvas.close()
+        return None
+    x, y = data.iat[canvas.selected_index, 0], data.iat[canvas.selected_index, 1]
+
+    # 첫 이동에서 드래그를 시작하고(정적인 배경 준비), 이후 프레임은 움직이는 요소만 다시 그린다
+    x1 = max(canvas.axes.get_xlim()) if isinstance(canvas, ChartCanvas) else max(canvas.xlim)
+    y1 = max(canvas.axes.get_ylim()) if isinstance(canvas, ChartCanvas) else max(canvas.ylim)
+    path = [(x + (x1 - x) * 0.3 * step / steps, y + (y1 - y) * 0.3 * step / steps) for step in range(steps + 1)]
+    start = timed(frame, QEvent.MouseMove, *path[0])
+    frames = [timed(frame, QEvent.MouseMove, px, py) for px, py in path[1:]]
+    release = timed(frame, QEvent.MouseButtonRelease, *path[-1])
+    canvas.close()
+    return {'frames': summarize(frames), 'start': start, 'release': release}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--points', type=int, nargs='+', default=[1_000, 50_000])
+    parser.add_argument('--steps', type=int, default=60)
+    parser.add_argument('--size', type=int, nargs=2, default=[1200, 900])
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    for points in args.points:
+        data = make_data(points)
+        print(f'{points} points')
+        for backend in BACKENDS:
+            result = run_backend(app, backend, data, args.steps, args.size)
+            if result is None:
+                print(f'  {backend:>10}: point not picked')
+                continue
+            frames = result['frames']
+            print(f"  {backend:>10}: frame mean {frames['mean'] * 1000:.2f} ms, p95 {frames['p95'] * 1000:.2f} ms, "
+                  f"{1 / frames['mean']:.0f} fps, drag start {result['start'] * 1000:.0f} ms, "
+                  f"release {result['release'] * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
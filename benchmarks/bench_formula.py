@@ -0,0 +1,74 @@
+# 기존 셀 단위 수식 계산(정규식 + 문자열 치환 + eval)과 컬럼 단위 Formula 엔진 비교
+# 사용법: python benchmarks/bench_formula.py <file.xlsx>
+# 다른 수식 컬럼을 참조하는 수식(generate.py 의 =G2-E2 등)은 결과가 의도적으로 달라진다
+# 기존 구현은 참조한 셀의 수식 문자열("=C2+D2")을 그대로 넣어 eval 이 실패하고 0 을 반환했지만, Formula 엔진은 연쇄 수식을 계산한다
+# 그래서 불일치는 컬럼별로 세고, 연쇄 수식 컬럼은 따로 표시한다 (원본 값만 참조하는 수식 컬럼은 불일치가 0 이어야 한다)
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_handler import DataHandler  # noqa: E402
+
+
+def calculate_formula_per_cell(data, column_info, row, col):
+    # MainWindow.calculate_formula 의 기존 구현
+    formula = column_info[col]['formula']
+    formula = formula.lstrip('=')
+    formula = re.sub(r'\d+', '', formula)
+
+    variables = {}
+    for char in formula:
+        if char.isalpha():
+            if char not in variables:
+                index_by_alphabet = None
+                for index, details in column_info.items():
+                    if details.get('alphabet') == char:
+                        index_by_alphabet = index
+                        break
+                variables[char] = data.iat[row, index_by_alphabet]
+
+    for var, value in variables.items():
+        formula = formula.replace(var, str(value))
+
+    try:
+        return round(eval(formula), 1)
+    except Exception:
+        return 0
+
+
+def main(file_path):
+    handler = DataHandler()
+    handler.load_data(file_path)
+    data = handler.get_data()
+    column_info = handler.get_column_info()
+    formula_indices = [index for index, details in column_info.items() if details['is_formula']]
+    cells = data.shape[0] * len(formula_indices)
+
+    start = time.perf_counter()
+    per_cell = {col: [calculate_formula_per_cell(data, column_info, row, col) for row in range(data.shape[0])]
+                for col in formula_indices}
+    per_cell_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    vectorized = handler.calculate_formulas()
+    vectorized_seconds = time.perf_counter() - start
+
+    # 다른 수식 컬럼을 참조하는 연쇄 수식 컬럼
+    chained = {col for col in formula_indices if handler.formulas[col].references & set(formula_indices)}
+    mismatches = {col: sum(1 for a, b in zip(per_cell[col], vectorized[col]) if a != b) for col in formula_indices}
+
+    print(f"{file_path}: {cells} formula cells")
+    print(f"  per-cell : {per_cell_seconds:.3f} s")
+    print(f"  vectorized: {vectorized_seconds:.4f} s ({per_cell_seconds / max(vectorized_seconds, 1e-9):.0f}x)")
+    for col in formula_indices:
+        details = column_info[col]
+        note = ' (chained formula, per-cell returned 0: intended change)' if col in chained and mismatches[col] else ''
+        print(f"  {details['alphabet']} {details['name']} {details['formula']}: {mismatches[col]} mismatching cells{note}")
+    print(f"  mismatching cells in non-chained columns: {sum(mismatches[col] for col in formula_indices if col not in chained)}")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1])
@@ -0,0 +1,71 @@
+# 성능 측정용 가상 엑셀 파일 생성
+# Key, Summary 컬럼 + 숫자 컬럼 N개 + 수식 컬럼 M개, 숫자는 0~100 사이의 소수 첫째 자리 값
+# 사용법: python benchmarks/generate.py <rows> <out.xlsx> [--numeric 4] [--formulas 2] [--seed 0]
+import argparse
+import os
+import random
+
+import openpyxl
+from openpyxl.utils import get_column_letter
+
+SUMMARY_WORDS = ('payments', 'login', 'search', 'export', 'billing', 'report', 'sync', 'profile', 'upload', 'alerts')
+
+
+def column_names(numeric, formulas):
+    return ['Key', 'Summary'] + [f'Metric{i + 1}' for i in range(numeric)] + [f'Formula{i + 1}' for i in range(formulas)]
+
+
+def formula_templates(numeric, formulas):
+    # 수식 i 는 숫자 컬럼 두 개를 사칙연산으로 조합, 두 번째 수식부터는 앞 수식을 참조하는 연쇄 수식
+    # row 번호 자리는 {r} 로 남겨둔다
+    letters = [get_column_letter(3 + i) for i in range(numeric)]
+    operators = ('+', '-', '*', '/')
+    templates = []
+    for i in range(formulas):
+        left = letters[i % numeric] if i == 0 else get_column_letter(3 + numeric + i - 1)
+        right = letters[(i + 1) % numeric]
+        templates.append(f'={left}{{r}}{operators[i % len(operators)]}{right}{{r}}')
+    return templates
+
+
+def generate(path, rows, numeric=4, formulas=2, seed=0):
+    if numeric < 2:
+        raise ValueError("at least two numeric columns are required")
+    rng = random.Random(seed)
+    templates = formula_templates(numeric, formulas)
+
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet('Sheet1')
+    ws.append(column_names(numeric, formulas))
+    for i in range(rows):
+        r = i + 2
+        summary = f'{SUMMARY_WORDS[i % len(SUMMARY_WORDS)]} item {i}'
+        values = [round(rng.uniform(0, 100), 1) for _ in range(numeric)]
+        ws.append([f'K-{i}', summary] + values + [template.format(r=r) for template in templates])
+    wb.save(path)
+    return path
+
+
+def cached_workbook(directory, rows, numeric=4, formulas=2, seed=0):
+    # 같은 조건의 파일이 이미 있으면 다시 만들지 않는다
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f'synthetic_{rows}_{numeric}n_{formulas}f_{seed}.xlsx')
+    if not os.path.exists(path):
+        generate(path + '.tmp.xlsx', rows, numeric, formulas, seed)
+        os.replace(path + '.tmp.xlsx', path)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic workbook for benchmarks')
+    parser.add_argument('rows', type=int)
+    parser.add_argument('out')
+    parser.add_argument('--numeric', type=int, default=4, help='number of numeric columns')
+    parser.add_argument('--formulas', type=int, default=2, help='number of formula columns')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    generate(args.out, args.rows, args.numeric, args.formulas, args.seed)
+
+
+if __name__ == "__main__":
+    main()
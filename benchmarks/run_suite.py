@@ -0,0 +1,214 @@
+# 로드, 수식 계산, 테이블 표시, 차트 갱신, 점 드래그 단계별 성능 측정
+# offscreen Qt 플랫폼에서 MainWindow 를 실제로 만들어서 측정하고, 결과는 JSON 으로 저장하여 실행 간 비교한다
+# 사용법: python benchmarks/run_suite.py [--sizes 100 1000 10000] [--out result.json] [--compare old.json]
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import matplotlib  # noqa: E402
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+from matplotlib.backend_bases import MouseButton, MouseEvent  # noqa: E402
+from PyQt5.QtWidgets import QApplication, QMessageBox  # noqa: E402
+
+import instrument  # noqa: E402
+from data_handler import DataHandler  # noqa: E402
+from generate import cached_workbook  # noqa: E402
+
+SIZES = (100, 1_000, 10_000, 100_000, 1_000_000)
+DRAG_STEPS = 30  # 드래그 한 번에 발생시키는 마우스 이동 이벤트 수
+FORMULA_SAMPLES = 1000  # MainWindow.calculate_formula 를 호출해 볼 셀 수
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    fn(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def summarize(samples):
+    # 반복 측정한 값의 요약
+    ordered = sorted(samples)
+    return {
+        'count': len(ordered),
+        'mean': statistics.fmean(ordered),
+        'p50': ordered[len(ordered) // 2],
+        'p95': ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+        'max': ordered[-1]
+    }
+
+
+def mouse_event(canvas, name, x, y, button=MouseButton.LEFT):
+    # 데이터 좌표를 화면 좌표로 바꿔서 matplotlib 마우스 이벤트 생성
+    px, py = canvas.axes.transData.transform((x, y))
+    return MouseEvent(name, canvas, px, py, button=button)
+
+
+def run_size(app, window, path, rows):
+    timings = {}
+    processing = app.processEvents
+
+    handler = DataHandler()
+    timings['load_data'] = timed(handler.load_data, path)
+    timings['create_column_info'] = timed(handler.create_column_info)
+    timings['calculate_formulas'] = timed(handler.calculate_formulas)
+
+    # MainWindow 에 데이터 설정 후 테이블 표시, 그려지는 시간까지 포함
+    window.data_handler.replace_with(handler)
+    window.table_model.set_data_handler(window.data_handler)
+    window.populate_combo_boxes()
+    window.generate_colors()
+    window.chart_canvas.initialize(is_swap=False)
+    timings['display_data'] = timed(lambda: (window.display_data(), processing()))
+
+    formula_cols = [col for col, info in window.column_info.items() if info['is_formula']]
+    rng = np.random.default_rng(0)
+    samples = rng.integers(0, rows, size=min(FORMULA_SAMPLES, rows))
+    timings['calculate_formula_per_cell'] = timed(
+        lambda: [window.calculate_formula(int(row), col) for row in samples for col in formula_cols]
+    ) / max(len(samples) * len(formula_cols), 1)
+
+    columns = window.data_handler.get_data().columns
+    x_column, y_column = columns[2], (columns[-1] if formula_cols else columns[3])
+    timings['get_table_data'] = timed(window.get_table_data, [x_column, y_column, 'Key', 'Summary'])
+
+    window.x_combo_box.setCurrentText(x_column)
+    window.y_combo_box.setCurrentText(y_column)
+    timings['plot_chart'] = timed(lambda: (window.plot_chart(), window.chart_canvas.scheduler.flush(), processing()))
+
+    canvas = window.chart_canvas
+    timings['update_plot'] = summarize([timed(lambda: (canvas.update_plot(True), canvas.scheduler.flush()))
+                                        for _ in range(5)])
+    timings['drag'] = run_drag(app, canvas)
+    return timings
+
+
+def run_drag(app, canvas):
+    # 점 하나를 잡아서 DRAG_STEPS 번 움직인 뒤 놓는다, 많은 점이 집계 표시될 때는 확대한 뒤 드래그
+    data = canvas.data
+    i = len(data) // 2
+    x, y = data.iat[i, 0], data.iat[i, 1]
+    if canvas.is_lod_active():
+        canvas.axes.set_xlim(x - 0.5, x + 0.5)
+        canvas.axes.set_ylim(y - 0.5, y + 0.5)
+        canvas.draw()
+    app.processEvents()
+
+    canvas.scheduler.flush()
+    press = mouse_event(canvas, 'button_press_event', x, y)
+    canvas.on_click(press)
+    if canvas.selected_index is None:
+        return None
+
+    x1 = canvas.axes.get_xlim()[1]
+    y1 = canvas.axes.get_ylim()[1]
+    frames = []
+    for step in range(1, DRAG_STEPS + 1):
+        t = step / DRAG_STEPS
+        event = mouse_event(canvas, 'motion_notify_event', x + (x1 - x) * 0.3 * t, y + (y1 - y) * 0.3 * t)
+        # 이벤트마다 바로 프레임을 처리하여 한 프레임의 비용을 잰다
+        frames.append(timed(lambda: (canvas.on_motion(event), canvas.scheduler.flush())))
+    release = timed(lambda: (canvas.on_release(event), canvas.scheduler.flush()))
+    app.processEvents()
+    return {'frames': summarize(frames), 'release': release}
+
+
+def metadata():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=BENCH_DIR, capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': commit,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'matplotlib': matplotlib.__version__
+    }
+
+
+def flatten(timings, prefix=''):
+    # 비교 출력용으로 {'drag.frames.mean': 0.01, ...} 형태로 변환
+    flat = {}
+    for name, value in timings.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f'{prefix}{name}.'))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[prefix + name] = value
+    return flat
+
+
+def compare(old, new):
+    old_runs = {run['rows']: flatten(run['timings']) for run in old['runs']}
+    for run in new['runs']:
+        before = old_runs.get(run['rows'])
+        if before is None:
+            continue
+        print(f"{run['rows']} rows (vs {old['meta'].get('commit') or old['meta']['timestamp']})")
+        for name, value in flatten(run['timings']).items():
+            if name in before and before[name] > 0 and not name.endswith('count'):
+                print(f"  {name:<34} {before[name]:10.4f} -> {value:10.4f}  {value / before[name]:6.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Quadrant chart tool benchmark suite')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(SIZES), help='row counts to benchmark')
+    parser.add_argument('--numeric', type=int, default=4, help='numeric columns in the synthetic workbook')
+    parser.add_argument('--formulas', type=int, default=2, help='formula columns in the synthetic workbook')
+    parser.add_argument('--workdir', default=os.path.join(BENCH_DIR, 'data'), help='where synthetic workbooks are kept')
+    parser.add_argument('--out', help='result JSON path (default: benchmarks/results/<timestamp>.json)')
+    parser.add_argument('--compare', help='previous result JSON to compare against')
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    QMessageBox.critical = staticmethod(lambda *a, **k: None)
+    QMessageBox.warning = staticmethod(lambda *a, **k: None)
+    from gui import MainWindow
+
+    result = {'meta': metadata(), 'config': {'numeric': args.numeric, 'formulas': args.formulas}, 'runs': []}
+    for rows in args.sizes:
+        path = cached_workbook(args.workdir, rows, args.numeric, args.formulas)
+        window = MainWindow()
+        window.show()
+        window.finish_startup()  # 백그라운드 import 를 기다리지 않고 DataHandler, 차트를 바로 만든다
+        app.processEvents()
+        instrument.enable()
+        instrument.reset()
+        timings = run_size(app, window, path, rows)
+        timings['counters'] = instrument.summary()['counters']
+        window.close()
+        window.deleteLater()
+        app.processEvents()
+
+        result['runs'].append({'rows': rows, 'timings': timings})
+        print(f"{rows} rows")
+        for name, value in flatten(timings).items():
+            print(f"  {name:<34} {value:10.4f}")
+
+    out = args.out or os.path.join(BENCH_DIR, 'results', datetime.now().strftime('%Y%m%d-%H%M%S') + '.json')
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2)
+    print(f"saved {out}")
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(json.load(f), result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,231 @@
+# 파싱한 엑셀 데이터를 로컬 디스크에 컬럼 단위로 캐시한다
+# 같은 파일을 다시 열면 openpyxl 파싱과 수식 계산 없이 저장된 컬럼을 memory-map 으로 바로 읽는다
+# 캐시 키: 파일 크기 + 수정 시각 + 내용 해시(blake2b) + 시트 이름, 전체 크기 기준으로 오래 안 쓴 항목부터 삭제(LRU)
+# SheetCache 는 한 엑셀 파일에서 이미 읽은 시트를 메모리에 보관하여 시트 전환 시 다시 읽지 않도록 한다
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import time
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from common import CACHE_DIR, CACHE_MAX_BYTES, SHEET_CACHE_SIZE, debug_print
+
+CACHE_VERSION = 3  # 저장 형식이 바뀌면 올려서 이전 캐시를 무시
+HASH_BLOCK_SIZE = 1 << 20
+MANIFEST_NAME = 'manifest.json'
+META_NAME = 'meta.pkl'
+
+
+def file_digest(file_path):
+    # 파일 내용 해시
+    digest = hashlib.blake2b(digest_size=20)
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class WorkbookCache:
+    def __init__(self, directory=None, max_bytes=CACHE_MAX_BYTES):
+        self.directory = directory or CACHE_DIR
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+        self.manifest = self.read_manifest()
+        self.removed = set()  # 이 객체에서 삭제한 항목, 기록을 합칠 때 다시 살아나지 않도록
+
+    def read_manifest(self):
+        # {entry: {'digest', 'sheet', 'path', 'size', 'mtime', 'bytes', 'last_used'}}
+        try:
+            with open(os.path.join(self.directory, MANIFEST_NAME), encoding='utf-8') as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if manifest.get('version') != CACHE_VERSION:
+            return {}
+        return manifest.get('entries', {})
+
+    def write_manifest(self):
+        # 중간에 종료되어도 깨지지 않도록 임시 파일에 쓴 뒤 교체
+        # 여러 프로세스(버전 비교 병렬 로드)가 같은 캐시를 쓰므로 디스크의 기록과 합치고, 임시 파일은 프로세스별로 만든다
+        manifest = self.read_manifest()
+        manifest.update(self.manifest)
+        for name in self.removed:
+            manifest.pop(name, None)
+        self.manifest = manifest
+
+        path = os.path.join(self.directory, MANIFEST_NAME)
+        temp_path = f'{path}.{os.getpid()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': CACHE_VERSION, 'entries': self.manifest}, f)
+        os.replace(temp_path, path)
+
+    def entry_dir(self, name):
+        return os.path.join(self.directory, name)
+
+    @staticmethod
+    def entry_name(digest, sheet_name):
+        # 파일 내용 해시 + 시트 이름, 시트 이름은 폴더 이름에 쓸 수 없는 문자가 있을 수 있으므로 해시로 바꾼다
+        return f"{digest}-{hashlib.blake2b(str(sheet_name).encode('utf-8'), digest_size=6).hexdigest()}"
+
+    def key(self, file_path, sheet_name):
+        # 파일 크기, 수정 시각이 기록과 같으면 해시 계산을 생략하고 기록된 해시를 사용
+        stat = os.stat(file_path)
+        path = os.path.abspath(file_path)
+        digest = None
+        for entry in self.manifest.values():
+            if entry['path'] == path and entry['size'] == stat.st_size and entry['mtime'] == stat.st_mtime_ns:
+                digest = entry['digest']
+                break
+        if digest is None:
+            digest = file_digest(file_path)
+        return self.entry_name(digest, sheet_name), digest, path, stat
+
+    def load(self, file_path, sheet_name):
+        # (캐시 내용, key) 반환, 캐시 내용은 (data, column_info, formula_values, sheet_name) 이고 없으면 None
+        # key 는 캐시가 없을 때 store() 에 그대로 넘긴다
+        key = self.key(file_path, sheet_name)
+        name, digest, path, stat = key
+        entry = self.manifest.get(name)
+        if entry is None or not os.path.isdir(self.entry_dir(name)):
+            return None, key
+
+        try:
+            cached = self.read_entry(name)
+        except (OSError, ValueError, EOFError, pickle.UnpicklingError) as e:
+            debug_print(f"cache read failed {name}: {e}")
+            self.remove(name)
+            self.write_manifest()
+            return None, key
+
+        # 같은 내용의 파일을 다른 경로에서 열었거나 수정 시각만 바뀐 경우 기록 갱신
+        entry.update(path=path, size=stat.st_size, mtime=stat.st_mtime_ns, last_used=time.time())
+        self.write_manifest()
+        return cached, key
+
+    def read_entry(self, name):
+        entry_dir = self.entry_dir(name)
+        with open(os.path.join(entry_dir, META_NAME), 'rb') as f:
+            meta = pickle.load(f)
+
+        # 숫자 컬럼은 copy-on-write 로 memory-map, 셀 편집은 메모리에만 반영되고 캐시 파일은 바뀌지 않는다
+        columns = {}
+        for i, stored in enumerate(meta['columns']):
+            if stored is None:
+                columns[i] = np.load(os.path.join(entry_dir, f'col{i}.npy'), mmap_mode='c')
+            else:
+                columns[i] = stored
+        # 문자열 컬럼도 object 배열 그대로 사용 (data_handler.frame_from_arrays 와 같은 이유)
+        with pd.option_context('future.infer_string', False):
+            data = pd.DataFrame(columns, index=range(1, meta['rows'] + 1), copy=False)
+        data.columns = meta['header']
+
+        formula_values = {col: np.load(os.path.join(entry_dir, f'formula{col}.npy'), mmap_mode='c')
+                          for col in meta['formula_columns']}
+        return data, meta['column_info'], formula_values, meta['sheet_name']
+
+    def store(self, key, data, column_info, formula_values, sheet_name):
+        # load() 에서 돌려받은 key 로 저장, 쓰는 도중 실패하면 해당 항목만 버린다
+        name, digest, path, stat = key
+        entry_dir = self.entry_dir(name)
+        temp_dir = f'{entry_dir}.{os.getpid()}.tmp'
+        shutil.rmtree(temp_dir, ignore_errors=True)
+        os.makedirs(temp_dir)
+
+        try:
+            stored_columns = []
+            for i in range(data.shape[1]):
+                values = data.iloc[:, i].to_numpy()
+                if values.dtype.kind in 'iufb':
+                    np.save(os.path.join(temp_dir, f'col{i}.npy'), values)
+                    stored_columns.append(None)  # .npy 파일로 저장한 컬럼
+                else:
+                    stored_columns.append(values)  # 문자열 등 object 컬럼은 메타 파일에 함께 pickle
+            for col, values in formula_values.items():
+                np.save(os.path.join(temp_dir, f'formula{col}.npy'), np.asarray(values))
+
+            meta = {
+                'header': list(data.columns),
+                'rows': data.shape[0],
+                'columns': stored_columns,
+                'column_info': column_info,
+                'formula_columns': list(formula_values),
+                'sheet_name': sheet_name
+            }
+            with open(os.path.join(temp_dir, META_NAME), 'wb') as f:
+                pickle.dump(meta, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            os.replace(temp_dir, entry_dir)
+        except OSError as e:
+            debug_print(f"cache store failed {name}: {e}")
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            return
+
+        size = sum(entry.stat().st_size for entry in os.scandir(entry_dir))
+        self.removed.discard(name)
+        self.manifest[name] = {
+            'digest': digest,
+            'sheet': sheet_name,
+            'path': path,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns,
+            'bytes': size,
+            'last_used': time.time()
+        }
+        self.evict()
+        self.write_manifest()
+
+    def evict(self):
+        # 전체 크기가 한도를 넘으면 마지막 사용 시각이 오래된 항목부터 삭제
+        total = sum(entry['bytes'] for entry in self.manifest.values())
+        for name in sorted(self.manifest, key=lambda n: self.manifest[n]['last_used']):
+            if total <= self.max_bytes:
+                break
+            total -= self.manifest[name]['bytes']
+            self.remove(name)
+
+    def remove(self, name):
+        self.manifest.pop(name, None)
+        self.removed.add(name)
+        shutil.rmtree(self.entry_dir(name), ignore_errors=True)
+
+    def clear(self):
+        for name in list(self.manifest):
+            self.remove(name)
+        self.write_manifest()
+
+
+class SheetCache:
+    # 시트 이름 -> 시트 상태(DataHandler, 중앙선 위치, 색상, 축 선택), 최근에 사용한 max_sheets 개만 보관
+    # 저장하지 않은 편집이 있는 시트는 개수를 넘어도 버리지 않는다
+    def __init__(self, max_sheets=SHEET_CACHE_SIZE):
+        self.max_sheets = max_sheets
+        self.sheets = OrderedDict()
+
+    def get(self, sheet_name):
+        state = self.sheets.get(sheet_name)
+        if state is not None:
+            self.sheets.move_to_end(sheet_name)
+        return state
+
+    def put(self, sheet_name, state):
+        self.sheets[sheet_name] = state
+        self.sheets.move_to_end(sheet_name)
+        excess = len(self.sheets) - self.max_sheets
+        for name in list(self.sheets):
+            if excess <= 0:
+                break
+            if not self.sheets[name]['handler'].dirty_cells:
+                del self.sheets[name]
+                excess -= 1
+
+    def values(self):
+        return list(self.sheets.values())
+
+    def clear(self):
+        self.sheets.clear()
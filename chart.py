@@ -1,20 +1,27 @@
 import math
 
 import numpy as np
-import pandas as pd
-from PyQt5.QtCore import pyqtSignal, pyqtSlot
-from matplotlib import lines
+from PyQt5.QtCore import pyqtSignal
 from matplotlib.backend_bases import MouseButton
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 
-from common import debug_print, ANNOTAION_DEFAULT_SIZE, ANNOTAION_BIG_SIZE
+import instrument
+from chart_base import ChartBase
+from common import debug_print, ANNOTAION_DEFAULT_SIZE, ANNOTAION_BIG_SIZE, LOD_AGGREGATE_THRESHOLD
+from quadrant import create_midlines, place_midlines, set_quadrant_limits, decorate_axes, add_label
+from spatial_index import GridIndex
 
 
-class ChartCanvas(FigureCanvas):
+class ChartCanvas(ChartBase, FigureCanvas):
+    # 공통 상태와 로직은 ChartBase, 여기서는 matplotlib 차트 요소(artist)로 그리는 부분만 구현
     point_selected = pyqtSignal(dict)
     point_clicked = pyqtSignal(str)
     point_dropped = pyqtSignal(str, float, float)
+    midline_moved = pyqtSignal(float, float)  # 중앙선 드래그 중, 드랍 시 (x_mid, y_mid)
+    plot_updated = pyqtSignal()  # 점 위치나 중앙선, 축 방향이 바뀌어 다시 그려졌을 때
 
     def __init__(self, parent=None):
 
@@ -22,120 +29,207 @@ class ChartCanvas(FigureCanvas):
         self.axes = fig.add_subplot(111)
         super().__init__(fig)
         self.setParent(parent)
-        self.selected_point = None
-        self.data = None
-        self.y_label = None
-        self.x_label = None
-        self.is_x_reversed = False
-        self.is_y_reversed = False
+        self.init_chart_state()
         self.annotates = []
-        self.chart_size_x = 0
-        self.chart_size_y = 0
+        self.scatter = None
         self.hline = None
         self.vline = None
-        self.dragging_line = None
         self.press = None
-        self.x_mid = None  # 초기화
-        self.y_mid = None  # 초기화
         self.prev_mouse_x = None
         self.prev_mouse_y = None
 
-        self.cid = self.mpl_connect('button_press_event', self.on_click)
-        self.cidmotion = self.mpl_connect('motion_notify_event', self.on_motion)
-        self.cidrelease = self.mpl_connect('button_release_event', self.on_release)
+        # 블리팅 드래그 상태: 드래그 시작 시 정적인 배경을 한 번만 저장하고 움직이는 요소만 다시 그린다
+        self.drag_background = None
+        self.drag_marker = None
 
-    def initialize(self, is_swap):
-        if is_swap is True:
-            self.x_mid, self.y_mid = self.y_mid, self.x_mid
-        else:
-            self.data = None
-            self.x_mid = None
-            self.y_mid = None
+        # 레이블은 필요할 때 생성하고, 보이는 점이 많으면 hexbin 으로 집계한다
+        self.lod_aggregate_threshold = LOD_AGGREGATE_THRESHOLD
+        self.aggregate = None  # 점이 많을 때 표시하는 hexbin
+        self.labelled = None  # 레이블이 만들어진 점 bool 배열, 위치가 바뀐 점 중 레이블이 있는 점만 옮긴다
+        self.trails = None  # 버전 비교 시 점별 이동 경로
+        self.updating_view = False
 
-    @pyqtSlot(pd.DataFrame, str, str, list)
-    def plot(self, data, x_label, y_label, colors):
-        self.data = data
-        self.x_label = x_label
-        self.y_label = y_label
+        # 클릭 위치 검사용 공간 인덱스 (레이블 박스, 마커 위치), 다시 그려질 때마다 무효화되고 클릭 시 필요하면 재생성
+        self.label_index = None
+        self.marker_index = None
 
-        if 'Color' not in self.data.columns:
-            self.data['Color'] = colors
+        self.cid = self.mpl_connect('button_press_event', self.on_click)
+        self.cidmotion = self.mpl_connect('motion_notify_event', self.on_motion)
+        self.cidrelease = self.mpl_connect('button_release_event', self.on_release)
+        self.ciddraw = self.mpl_connect('draw_event', self.invalidate_hit_index)
 
-        self.update_plot(True)
+    def make_toolbar(self, parent):
+        # 확대/이동 툴바, 백엔드마다 다르므로 캔버스가 만든다
+        return NavigationToolbar(self, parent)
 
-    def update_plot(self, force_redraw):
+    def clear_chart(self):
         self.axes.clear()
-        self.annotates = []
-
-        debug_print(f"before -> x_mid: {self.x_mid}, y_mid: {self.y_mid}")
-
-        if force_redraw is True:
-            self.get_chart_max_size()
-
-        if self.data is not None:
-            x_data = self.data.iloc[:, 0].astype(np.float64)
-            y_data = self.data.iloc[:, 1].astype(np.float64)
-
-            # 사분면 크기 설정
-            x_max, y_max = self.chart_size_x, self.chart_size_y
-
-            # 중앙선 위치 - 일반적인 경우
-            if self.x_mid is None or self.y_mid is None:
-                self.x_mid = x_max / 2
-                self.y_mid = y_max / 2
-
-            # 중앙선 위치 - 차트 바깥에 위치할 경우 가까운 안쪽으로 옮김
-            if self.x_mid >= x_max:
-                t = x_max * 0.99
-                self.x_mid = math.floor(t * 10) / 10
-            if self.y_mid >= y_max:
-                t = y_max * 0.99
-                self.y_mid = math.floor(t * 10) / 10
-
-            debug_print(f"after -> x_mid: {self.x_mid}, y_mid: {self.y_mid}")
-
-            self.hline = lines.Line2D([0, x_max], [self.y_mid, self.y_mid], color='black', linestyle='--')
-            self.vline = lines.Line2D([self.x_mid, self.x_mid], [0, y_max], color='black', linestyle='--')
+        self.reset_points()
 
-            self.axes.add_line(self.hline)
-            self.axes.add_line(self.vline)
-
-            # 차트 데이터 생성
-            colors = self.data['Color'].tolist()
-            self.scatter = self.axes.scatter(x_data, y_data, c=colors, picker=True)
-
-            for i, key in enumerate(self.data['Key']):
-                color = self.data['Color'].iloc[i]
-                annotate = self.axes.annotate(key, (x_data.iloc[i], y_data.iloc[i]),
-                                              bbox=dict(facecolor=color, alpha=0.5))
-                self.annotates.append(annotate)
-
-            # 사분면 X, Y 범위 설정
-            if self.is_x_reversed:
-                self.axes.set_xlim(x_max, 0)
-            else:
-                self.axes.set_xlim(0, x_max)
-
-            if self.is_y_reversed:
-                self.axes.set_ylim(y_max, 0)
-            else:
-                self.axes.set_ylim(0, y_max)
+    def reset_points(self):
+        super().reset_points()
+        self.annotates = []
+        self.scatter = None
+        self.hline = None
+        self.vline = None
+        self.aggregate = None
+        self.labelled = None
+        self.trails = None
+
+    def build_points(self, x_data, y_data):
+        # 데이터셋 또는 축 컬럼이 바뀐 경우 차트 요소 전체를 새로 생성
+        self.clear_chart()
+
+        self.hline, self.vline = create_midlines(self.axes)
+        self.scatter = self.axes.scatter(x_data, y_data, c=self.plotted_colors, picker=True)
+        self.store_points(x_data, y_data)
+
+        # 레이블은 점이 적으면 모두 생성하고, 많으면 화면에 보여야 할 때 생성한다
+        count = len(self.plotted_keys)
+        self.annotates = [None] * count
+        self.labelled = np.zeros(count, dtype=bool)
+        if not self.is_lod_active():
+            for i in range(count):
+                self.get_annotate(i)
+        if self.point_filter is not None:
+            self.apply_point_filter()
+
+        decorate_axes(self.axes, self.x_label, self.y_label)
+
+        # axes.clear() 시 콜백이 초기화되므로 다시 연결, 툴바 확대/이동 시 레이블 표시 갱신
+        self.axes.callbacks.connect('xlim_changed', self.on_view_changed)
+        self.axes.callbacks.connect('ylim_changed', self.on_view_changed)
+
+    def get_annotate(self, i):
+        # i 번째 점의 레이블, 아직 없으면 생성
+        annotate = self.annotates[i]
+        if annotate is None:
+            annotate = add_label(self.axes, self.plotted_keys[i], self.plotted_x[i], self.plotted_y[i],
+                                 self.point_colors[i])
+            self.annotates[i] = annotate
+            self.labelled[i] = True
+        return annotate
+
+    def reset_view(self):
+        self.updating_view = True
+        set_quadrant_limits(self.axes, self.chart_size_x, self.chart_size_y, self.is_x_reversed, self.is_y_reversed)
+        self.updating_view = False
+
+    def view_limits(self):
+        return self.axes.get_xlim(), self.axes.get_ylim()
+
+    def update_midlines(self):
+        place_midlines(self.hline, self.vline, self.chart_size_x, self.chart_size_y, self.x_mid, self.y_mid)
+
+    def on_view_changed(self, axes):
+        # 툴바로 확대/이동했을 때 보이는 영역 기준으로 레이블, 집계 표시를 갱신
+        if not self.updating_view:
+            self.apply_level_of_detail()
+
+    def apply_level_of_detail(self):
+        # 보이는 영역 안의 점만 레이블을 표시하고, 화면 영역별 레이블 수를 제한한다
+        # 보이는 점이 많으면 개별 점 대신 hexbin 으로 표시하고, 확대할수록 레이블이 다시 나타난다
+        if self.scatter is None or not self.is_lod_active():
+            return
 
-            self.axes.set_title('Quadrant Chart', color='green')
-            self.axes.set_xlabel(self.x_label, color='red')
-            self.axes.set_ylabel(self.y_label, color='blue')
+        in_view, labelled, extent = self.sample_labels()
+        self.update_aggregate(in_view, extent)
 
-        self.draw()
+        for i in self.visible_labels - labelled:
+            self.annotates[i].set_visible(False)
+        for i in labelled - self.visible_labels:
+            self.get_annotate(i).set_visible(True)
+        self.visible_labels = labelled
 
+        debug_print(f"apply_level_of_detail -> in view: {len(in_view)}, labels: {len(labelled)}")
 
-    def get_chart_max_size(self):
-        # 차트 사이즈를 현재 데이터 기준으로 갱신해야 할 때 호출
-        if self.data is not None:
-            x_data = self.data.iloc[:, 0].astype(np.float64)
-            y_data = self.data.iloc[:, 1].astype(np.float64)
+    def update_aggregate(self, in_view, extent):
+        if self.aggregate is not None:
+            self.aggregate.remove()
+            self.aggregate = None
 
-            self.chart_size_x = x_data.max()
-            self.chart_size_y = y_data.max()
+        if len(in_view) > self.lod_aggregate_threshold:
+            self.scatter.set_visible(False)
+            self.aggregate = self.axes.hexbin(self.plotted_x[in_view], self.plotted_y[in_view], gridsize=60,
+                                              extent=extent, mincnt=1, cmap='Blues', zorder=0.5)
+        else:
+            self.scatter.set_visible(True)
+
+    def points_changed(self, moved, renamed):
+        # 바뀐 점의 마커 위치와 레이블만 옮긴다, 필터로 숨긴 점은 NaN 그대로
+        for i in moved[self.labelled[moved]]:
+            self.annotates[i].xy = (self.plotted_x[i], self.plotted_y[i])
+        for i in renamed:
+            if self.annotates[i] is not None:
+                self.annotates[i].set_text(self.plotted_keys[i])
+        if len(moved):
+            offsets = self.scatter.get_offsets()
+            offsets[moved] = np.column_stack([self.plotted_x[moved], self.plotted_y[moved]])
+            visible = self.visible_mask()
+            if visible is not None:
+                offsets[moved[~visible[moved]]] = np.nan
+            self.scatter.set_offsets(offsets)
+            self.invalidate_hit_index()
+
+    def set_trails(self, xs, ys):
+        # 점별 이동 경로 (xs, ys: 버전 수 x 점 수 배열), 경로 전체를 LineCollection 하나로 그린다
+        if self.trails is not None:
+            self.trails.remove()
+            self.trails = None
+        if self.scatter is not None and len(xs) > 1:
+            segments = np.stack([np.asarray(xs).T, np.asarray(ys).T], axis=2)
+            self.trails = LineCollection(segments, colors='lightgray', linewidths=0.8, zorder=0.8)
+            self.axes.add_collection(self.trails, autolim=False)
+        self.request_redraw()
+
+    def start_animation(self):
+        # 재생 중에는 레이블을 숨기고 점(scatter)만 움직이는 요소로 그린다, 정적인 배경(축, 중앙선, 경로)은 한 번만 저장
+        if self.scatter is None:
+            return
+        for annotate in self.annotates:
+            if annotate is not None:
+                annotate.set_visible(False)
+        self.scatter.set_animated(True)
+        self.save_drag_background()
+
+    def animate_points(self, x, y, visible=None):
+        # 재생 프레임, 저장된 배경 위에 점만 새 위치로 그린다 (저장된 데이터와 차트 요소는 그대로)
+        if self.drag_background is None:
+            return
+        offsets = np.column_stack([x, y])
+        if visible is not None:
+            offsets[~visible] = np.nan
+        self.scatter.set_offsets(offsets)
+        self.blit_drag_frame(self.scatter)
+
+    def end_animation(self):
+        # 재생이 끝나면 숨겼던 레이블을 되돌린다, 점 위치는 이후 update_plot 에서 데이터 기준으로 반영
+        if self.scatter is None:
+            return
+        self.scatter.set_animated(False)
+        self.drag_background = None
+        for i in self.visible_labels:
+            self.annotates[i].set_visible(True)
+        self.apply_point_filter()
+        self.request_redraw()
+
+    def point_offsets(self):
+        # scatter 좌표, 필터로 숨긴 점은 NaN 으로 두어 그리지 않는다
+        offsets = np.column_stack([self.plotted_x, self.plotted_y])
+        visible = self.visible_mask()
+        if visible is not None:
+            offsets[~visible] = np.nan
+        return offsets
+
+    def apply_point_filter(self):
+        self.scatter.set_offsets(self.point_offsets())
+        if self.is_lod_active():
+            self.apply_level_of_detail()
+        else:
+            visible = self.visible_mask()
+            for i, annotate in enumerate(self.annotates):
+                annotate.set_visible(visible is None or bool(visible[i]))
+        self.invalidate_hit_index()
 
     def on_click(self, event):
         # 마우스 클릭 이벤트 처리
@@ -156,26 +250,46 @@ class ChartCanvas(FigureCanvas):
 
             self.prev_mouse_x, self.prev_mouse_y = event.xdata, event.ydata
 
-        for annotate in self.annotates:
-            contains, attr = annotate.contains(event)
-            if contains:
-                key = annotate.get_text()
-                if key in self.data['Key'].values:
-                    ind = self.data.index[self.data['Key'] == key].tolist()[0]
-                    self.selected_point = {
-                        "Key": key,
-                        "x": self.data.loc[ind, self.x_label],
-                        "y": self.data.loc[ind, self.y_label],
-                        "Summary": self.data.loc[ind, "Summary"]
-                    }
-                    self.point_selected.emit(self.selected_point)
-                    self.point_clicked.emit(key)
-                break
-
-        #
-        self.background = self.figure.canvas.copy_from_bbox(self.axes.bbox)
-        self.axes.draw_artist(self.scatter)
-        self.figure.canvas.blit(self.axes.bbox)
+        i = self.find_point(event)
+        if i is not None:
+            self.select_point(i)
+
+    def draw(self):
+        # 전체 다시 그리기 횟수 계측
+        instrument.count('chart.draws')
+        super().draw()
+
+    def invalidate_hit_index(self, event=None):
+        # 레이아웃이 바뀌었으므로 다음 클릭 때 인덱스를 다시 만든다
+        self.label_index = None
+        self.marker_index = None
+
+    def build_hit_index(self):
+        # 레이블 박스와 마커 위치를 화면 좌표로 변환하여 격자 인덱스 생성
+        # 화면 좌표 기준이므로 축 반전(is_x_reversed, is_y_reversed)도 그대로 반영된다
+        renderer = self.get_renderer()
+        boxes = np.full((len(self.annotates), 4), np.nan)
+        for i, annotate in enumerate(self.annotates):
+            if annotate is not None and annotate.get_visible():
+                bbox = annotate.get_window_extent(renderer)
+                boxes[i] = bbox.x0, bbox.y0, bbox.x1, bbox.y1
+        self.label_index = GridIndex(boxes)
+
+        offsets = self.axes.transData.transform(self.scatter.get_offsets())
+        radius = math.sqrt(self.scatter.get_sizes()[0]) / 2 * self.figure.dpi / 72
+        self.marker_index = GridIndex(np.column_stack([offsets - radius, offsets + radius]))
+
+    def find_point(self, event):
+        # 클릭 위치에 있는 가장 위쪽 점의 위치(row)를 반환, 레이블이 마커보다 위에 그려지므로 먼저 검사
+        if self.data is None or not self.annotates:
+            return None
+        if self.label_index is None:
+            self.build_hit_index()
+
+        i = self.label_index.topmost(event.x, event.y)
+        if i is None and self.scatter.get_visible():
+            i = self.marker_index.topmost(event.x, event.y)
+        return i
 
     def on_motion(self, event):
         # 마우스 이동 (드래그) 이벤트 처리
@@ -184,105 +298,142 @@ class ChartCanvas(FigureCanvas):
 
         debug_print("on_motion >>>>>")
 
+        # 다음 프레임까지 들어온 이동 이벤트는 마지막 것만 처리
+        if self.selected_point is not None or self.dragging_line is not None:
+            self.scheduler.schedule('motion', lambda: self.drag_to(event))
+
+    def drag_to(self, event):
         if self.selected_point is not None:
             if event.xdata is not None and event.ydata is not None:
-                key = self.selected_point['Key']
-
-                if self.is_x_reversed:
-                    new_x = max(min(self.axes.get_xlim()[0], event.xdata), self.axes.get_xlim()[1])
-                else:
-                    new_x = min(max(event.xdata, self.axes.get_xlim()[0]), self.axes.get_xlim()[1])
-
-                if self.is_y_reversed:
-                    new_y = max(min(self.axes.get_ylim()[0], event.ydata), self.axes.get_ylim()[1])
-                else:
-                    new_y = min(max(event.ydata, self.axes.get_ylim()[0]), self.axes.get_ylim()[1])
-
-                self.data.loc[self.data['Key'] == key, self.x_label] = new_x
-                self.data.loc[self.data['Key'] == key, self.y_label] = new_y
-                self.update_plot(False)
-
-        if self.dragging_line is None:
+                new_x, new_y = self.clamp_to_view(event.xdata, event.ydata)
+
+                # 드래그 중에는 움직이는 점과 레이블만 다시 그린다
+                if self.drag_background is None:
+                    self.start_point_drag()
+                self.drag_position = (new_x, new_y)
+                self.drag_marker.set_data([new_x], [new_y])
+                self.annotates[self.selected_index].xy = (new_x, new_y)
+                self.blit_drag_frame(self.drag_marker, self.annotates[self.selected_index])
+
+        # 점을 드래그하는 중에는 중앙선을 함께 움직이지 않는다
+        if self.dragging_line is None or self.selected_point is not None:
             return
 
+        if self.drag_background is None:
+            self.start_line_drag()
+
         if self.dragging_line == self.hline:
             y0 = event.ydata
             self.hline.set_ydata([y0, y0])
+            self.midline_moved.emit(self.x_mid, y0)
         elif self.dragging_line == self.vline:
             x0 = event.xdata
             self.vline.set_xdata([x0, x0])
-
-        self.figure.canvas.draw()
+            self.midline_moved.emit(x0, self.y_mid)
+
+        self.blit_drag_frame(self.dragging_line)
+
+    def start_point_drag(self):
+        # 선택된 점을 scatter 에서 숨기고 별도의 animated 마커로 대체한 뒤 정적인 배경을 저장
+        i = self.selected_index
+        offsets = self.scatter.get_offsets().copy()
+        x, y = offsets[i]
+        offsets[i] = (np.nan, np.nan)
+        self.scatter.set_offsets(offsets)
+
+        color = self.point_colors[i]
+        self.drag_marker, = self.axes.plot([x], [y], 'o', color=color, markersize=math.sqrt(self.scatter.get_sizes()[0]),
+                                           animated=True)
+        self.get_annotate(i).set_animated(True)
+        self.visible_labels.add(i)  # 레이블이 없던 점이면 이후 레이블 표시 갱신 대상에 포함
+        self.save_drag_background()
+
+    def start_line_drag(self):
+        # 움직이는 중앙선을 제외한 정적인 배경을 저장
+        self.dragging_line.set_animated(True)
+        self.save_drag_background()
+
+    @instrument.traced('drag.start')
+    def save_drag_background(self):
+        self.scheduler.cancel('draw')  # 여기서 바로 그리므로 대기 중인 다시 그리기는 필요 없다
+        self.draw()
+        self.drag_background = self.copy_from_bbox(self.axes.bbox)
+
+    @instrument.traced('drag.frame')
+    def blit_drag_frame(self, *artists):
+        # 저장된 배경 위에 움직이는 요소만 그려서 갱신
+        instrument.count('chart.blits')
+        self.restore_region(self.drag_background)
+        for artist in artists:
+            self.axes.draw_artist(artist)
+        self.blit(self.axes.bbox)
+
+    def end_drag(self):
+        # 블리팅 드래그 상태 정리, 이후 전체 다시 그리기는 호출한 쪽에서 수행
+        if self.drag_marker is not None:
+            self.drag_marker.remove()
+            self.drag_marker = None
+            # 드래그 동안 숨겼던 점과 옮긴 레이블을 마지막으로 그린 위치로 되돌린다, 새 위치는 update_plot 에서 반영
+            i = self.selected_index
+            self.scatter.set_offsets(self.point_offsets())
+            self.annotates[i].xy = (self.plotted_x[i], self.plotted_y[i])
+            self.annotates[i].set_animated(False)
+        if self.dragging_line is not None:
+            self.dragging_line.set_animated(False)
+        self.drag_background = None
+        self.drag_position = None
 
     def on_release(self, event):
-        # 마우스 해제 (드랍) 이벤트 처리
+        # 마우스 해제 (드랍) 이벤트 처리, 아직 처리되지 않은 이동 이벤트를 먼저 반영
+        self.scheduler.flush()
         if self.selected_point is not None:
             debug_print("on_release >>>>>")
 
             # 마우스 커서가 전혀 움직이지 않았다면 드래그앤드랍 이벤트 무시
             if self.prev_mouse_x == event.xdata and self.prev_mouse_y == event.ydata:
+                was_dragged = self.drag_background is not None
+                self.end_drag()
+                if was_dragged:
+                    self.update_plot(False)
                 self.selected_point = None
+                self.selected_index = None
                 return
 
-            key = self.selected_point['Key']
-            new_x = round(event.xdata, 1)
-            new_y = round(event.ydata, 1)
-
-            if self.is_x_reversed:
-                new_x = max(min(self.axes.get_xlim()[0], new_x), self.axes.get_xlim()[1])
-
-            if self.is_y_reversed:
-                new_y = max(min(self.axes.get_ylim()[0], new_y), self.axes.get_ylim()[1])
-
-            self.data.loc[self.data['Key'] == key, self.x_label] = new_x
-            self.data.loc[self.data['Key'] == key, self.y_label] = new_y
-            self.update_plot(False)
-            self.point_dropped.emit(key, new_x, new_y)
-
-            # 업데이트된 data point 의 정보를 상단에 노출
-            self.selected_point['x'] = new_x
-            self.selected_point['y'] = new_y
-            self.point_selected.emit(self.selected_point)
-
-            self.selected_point = None
+            # 차트 바깥에서 놓은 경우 마지막 드래그 위치 사용
+            if event.xdata is None or event.ydata is None:
+                if self.drag_position is None:
+                    self.end_drag()
+                    self.selected_point = None
+                    self.selected_index = None
+                    return
+                event_x, event_y = self.drag_position
+            else:
+                event_x, event_y = event.xdata, event.ydata
+            self.drop_point(event_x, event_y)
 
         if event.button == MouseButton.LEFT:
             if self.dragging_line == self.vline:
-                self.x_mid = event.xdata
+                self.x_mid = self.vline.get_xdata()[0]
                 debug_print(f"Vertical line dropped at x = {self.x_mid}")
 
             elif self.dragging_line == self.hline:
-                self.y_mid = event.ydata
+                self.y_mid = self.hline.get_ydata()[0]
                 debug_print(f"Horizontal line dropped at y = {self.y_mid}")
 
+            if self.dragging_line is not None:
+                was_dragged = self.drag_background is not None
+                self.end_drag()
+                if was_dragged:
+                    self.request_redraw()
+                    self.midline_moved.emit(self.x_mid, self.y_mid)
+
             self.dragging_line = None
             self.press = None
 
-    def reverse_x_axis(self):
-        self.is_x_reversed = not self.is_x_reversed
-        self.update_plot(False)
-
-    def reverse_y_axis(self):
-        self.is_y_reversed = not self.is_y_reversed
-        self.update_plot(False)
-
-    @pyqtSlot(int)
-    def highlight_point(self, row):
-        # 테이블에서 선택된 데이터를 차트에서 강조하여 표시
-        key = self.data.iloc[row]['Key']
-        debug_print(f"highlight_point > key: {key}")
-        for i, annotate in enumerate(self.annotates):
-            if annotate.get_text() == key:
-                annotate.set_fontsize(ANNOTAION_BIG_SIZE)  # 글꼴 크기 증가
-            else:
-                annotate.set_fontsize(ANNOTAION_DEFAULT_SIZE)  # 기본 글꼴 크기
-
-        self.draw()
-
-    @pyqtSlot()
-    def obscure_point(self):
-        # 차트에서 강조된 데이터 표시 초기화
-        for i, annotate in enumerate(self.annotates):
-            annotate.set_fontsize(ANNOTAION_DEFAULT_SIZE)  # 기본 글꼴 크기
-
-        self.draw()
+    def set_highlight(self, index):
+        # 이전 강조 점과 새 점의 글꼴 크기만 바꾼다
+        if self.highlighted_index is not None and self.highlighted_index < len(self.annotates):
+            self.annotates[self.highlighted_index].set_fontsize(ANNOTAION_DEFAULT_SIZE)  # 기본 글꼴 크기
+        if index is not None:
+            self.get_annotate(index).set_fontsize(ANNOTAION_BIG_SIZE)  # 글꼴 크기 증가
+        self.highlighted_index = index
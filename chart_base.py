@@ -0,0 +1,290 @@
+# ChartCanvas(matplotlib)와 QtChartCanvas(QGraphicsView)가 함께 쓰는 차트 상태와 로직
+# 데이터 참조, 마지막으로 그린 값과의 비교, 필터, 레이블 선택, 중앙선 위치, 강조, 점 드랍 처리는 여기서 하고
+# 실제로 그리는 부분만 각 백엔드가 구현한다 (build_points, clear_chart, reset_view, view_limits, update_midlines 등)
+# 시그널은 QObject 를 상속한 각 백엔드 클래스에 정의한다
+import numpy as np
+import pandas as pd
+from PyQt5.QtCore import pyqtSlot
+
+import instrument
+from common import debug_print, LOD_POINT_THRESHOLD, LOD_LABEL_GRID, LOD_LABELS_PER_REGION
+from quadrant import chart_max_size, fit_midlines
+from redraw import RedrawScheduler
+from spatial_index import grid_sample
+
+
+class ChartBase:
+    def init_chart_state(self):
+        # 백엔드의 Qt 위젯이 만들어진 뒤 호출
+        self.selected_point = None
+        self.selected_index = None
+        self.data = None
+        self.key_index = {}  # Key -> row 위치, DataHandler 의 인덱스를 공유
+        self.highlighted_index = None
+        self.y_label = None
+        self.x_label = None
+        self.is_x_reversed = False
+        self.is_y_reversed = False
+        self.chart_size_x = 0
+        self.chart_size_y = 0
+        self.x_mid = None
+        self.y_mid = None
+        self.dragging_line = None
+        self.drag_position = None
+
+        # 마지막으로 반영된 값, 이후 변경분만 적용한다
+        self.plotted_x = None
+        self.plotted_y = None
+        self.plotted_keys = None
+        self.plotted_labels = None
+        self.plotted_colors = None
+        self.plotted_limits = None  # 보이는 범위를 정한 (차트 크기, 축 방향), 바뀌지 않으면 확대/축소한 범위를 유지
+        self.rebuild_pending = True
+        self.point_colors = []
+        self.point_filter = None  # 필터에 맞는 점 bool 배열, None 이면 전체 표시
+
+        # 대량 데이터 표시 설정, 레이블은 화면 영역별 개수를 제한한다
+        self.lod_point_threshold = LOD_POINT_THRESHOLD
+        self.lod_label_grid = LOD_LABEL_GRID
+        self.lod_labels_per_region = LOD_LABELS_PER_REGION
+        self.visible_labels = set()
+
+        # 다시 그리기와 드래그 프레임은 모아서 한 화면 프레임에 한 번만 처리
+        self.scheduler = RedrawScheduler(parent=self)
+
+    def initialize(self, is_swap):
+        if is_swap is True:
+            self.x_mid, self.y_mid = self.y_mid, self.x_mid
+        else:
+            self.data = None
+            self.x_mid = None
+            self.y_mid = None
+            self.rebuild_pending = True
+            self.point_filter = None
+
+    @pyqtSlot(pd.DataFrame, str, str, list)
+    @instrument.traced('plot')
+    def plot(self, data, x_label, y_label, colors, key_index=None):
+        # data 는 DataHandler 의 컬럼 배열을 그대로 참조하는 읽기 전용 DataFrame (X, Y, Key, Summary 순서)
+        # 복사하지 않으므로 셀 값이 바뀌면 update_plot 만 호출하면 되고, 차트에서 직접 값을 바꾸지 않는다
+        self.data = data
+        if key_index is None:
+            key_index = {}
+            keys = self.data['Key'].tolist()
+            for row in range(len(keys) - 1, -1, -1):
+                key_index[keys[row]] = row
+        self.key_index = key_index
+        self.x_label = x_label
+        self.y_label = y_label
+
+        # 데이터셋(행 수, 색상) 또는 축 컬럼이 바뀐 경우에만 차트 요소를 새로 만든다
+        if (colors is not self.plotted_colors or (x_label, y_label) != self.plotted_labels
+                or self.plotted_x is None or len(self.plotted_x) != self.data.shape[0]):
+            self.rebuild_pending = True
+        self.plotted_colors = colors
+
+        self.update_plot(True)
+
+    @instrument.traced('plot.update')
+    def update_plot(self, force_redraw):
+        debug_print(f"before -> x_mid: {self.x_mid}, y_mid: {self.y_mid}")
+
+        if force_redraw is True:
+            self.get_chart_max_size()
+
+        if self.data is None:
+            self.clear_chart()
+            self.request_redraw()
+            self.plot_updated.emit()
+            return
+
+        x_data, y_data = self.point_values()
+
+        # 중앙선 위치 - 없으면 가운데, 차트 바깥이면 가까운 안쪽으로 옮김
+        x_max, y_max = self.chart_size_x, self.chart_size_y
+        self.x_mid, self.y_mid = fit_midlines(x_max, y_max, self.x_mid, self.y_mid)
+
+        debug_print(f"after -> x_mid: {self.x_mid}, y_mid: {self.y_mid}")
+
+        rebuilt = self.rebuild_pending or self.plotted_x is None
+        if rebuilt:
+            self.build_points(x_data, y_data)
+        else:
+            self.apply_changes(x_data, y_data)
+
+        # 사분면 X, Y 범위 설정, 차트 크기나 축 방향이 그대로면 확대/축소한 범위를 유지한다
+        limits = (x_max, y_max, self.is_x_reversed, self.is_y_reversed)
+        if rebuilt or limits != self.plotted_limits:
+            self.plotted_limits = limits
+            self.reset_view()
+
+        self.update_midlines()
+        self.apply_level_of_detail()
+        self.request_redraw()
+        self.plot_updated.emit()
+
+    def reset_points(self):
+        self.highlighted_index = None
+        self.plotted_x = None
+        self.plotted_y = None
+        self.plotted_keys = None
+        self.plotted_labels = None
+        self.plotted_limits = None
+        self.rebuild_pending = True
+        self.visible_labels = set()
+
+    def store_points(self, x_data, y_data):
+        # 새로 만든 차트 요소에 반영된 값 저장, 색상은 데이터에 컬럼으로 추가하지 않고 목록 그대로 사용
+        self.point_colors = self.plotted_colors
+        self.plotted_x = x_data.copy()
+        self.plotted_y = y_data.copy()
+        self.plotted_keys = np.array(self.data['Key'].tolist(), dtype=object)
+        self.plotted_labels = (self.x_label, self.y_label)
+        self.rebuild_pending = False
+
+    def apply_changes(self, x_data, y_data):
+        # 이전에 그린 값과 비교하여 바뀐 점의 위치, Key 만 갱신
+        moved = np.flatnonzero((x_data != self.plotted_x) | (y_data != self.plotted_y))
+        self.plotted_x[moved] = x_data[moved]
+        self.plotted_y[moved] = y_data[moved]
+
+        keys = self.data['Key'].to_numpy(dtype=object)
+        renamed = np.flatnonzero(keys != self.plotted_keys)
+        self.plotted_keys[renamed] = keys[renamed]
+
+        self.points_changed(moved, renamed)
+        debug_print(f"apply_changes -> moved: {len(moved)}")
+
+    def points_changed(self, moved, renamed):
+        # 위치(moved) 또는 Key(renamed)가 바뀐 점, 차트 요소에 반영할 것이 있는 백엔드만 구현
+        pass
+
+    def update_point(self, row):
+        # 테이블에서 한 row 가 변경되었을 때 호출, 그 점의 좌표와 레이블만 반영한다
+        # 새 값이 차트 범위를 넘어설 때만 범위를 다시 계산하여 전체를 갱신
+        if self.data is None:
+            return
+        x, y = float(self.data.iat[row, 0]), float(self.data.iat[row, 1])
+        if self.plotted_x is None or self.rebuild_pending or not (x <= self.chart_size_x and y <= self.chart_size_y):
+            self.update_plot(True)
+            return
+
+        key = self.data.iat[row, 2]
+        moved = x != self.plotted_x[row] or y != self.plotted_y[row]
+        if not moved and key == self.plotted_keys[row]:
+            return  # 차트에 표시되지 않는 값(Summary)만 바뀐 경우
+        self.plotted_x[row], self.plotted_y[row] = x, y
+        self.plotted_keys[row] = key
+        self.points_changed(np.array([row]) if moved else np.array([], dtype=np.int64), np.array([row]))
+        if moved and self.is_lod_active():
+            self.apply_level_of_detail()
+        self.request_redraw()
+        if moved:
+            self.plot_updated.emit()
+
+    def point_values(self):
+        # X, Y 좌표 배열, 숫자 컬럼은 float64 로 저장되어 있으므로 변환 없이 저장된 배열을 그대로 사용
+        return self.data.iloc[:, 0].to_numpy(dtype=np.float64), self.data.iloc[:, 1].to_numpy(dtype=np.float64)
+
+    def get_chart_max_size(self):
+        # 차트 사이즈를 현재 데이터 기준으로 갱신해야 할 때 호출
+        if self.data is not None:
+            self.chart_size_x, self.chart_size_y = chart_max_size(*self.point_values())
+
+    def is_lod_active(self):
+        return self.plotted_x is not None and len(self.plotted_x) > self.lod_point_threshold
+
+    def set_point_filter(self, mask):
+        # 필터에 맞지 않는 점과 레이블을 숨긴다 (mask: 보이는 점 bool 배열, None 이면 전체), 차트 요소는 다시 만들지 않는다
+        self.point_filter = mask
+        if self.plotted_x is None:
+            return
+        self.apply_point_filter()
+        self.request_redraw()
+
+    def visible_mask(self):
+        # 현재 그려진 점 수와 맞는 필터만 사용
+        mask = self.point_filter
+        if mask is None or self.plotted_x is None or len(mask) != len(self.plotted_x):
+            return None
+        return mask
+
+    def sample_labels(self):
+        # 보이는 영역 안의 (필터에 맞는) 점과, 그 중 화면 영역마다 앞쪽 row 부터 최대 개수만큼 고른 레이블 표시 점
+        (x0, x1), (y0, y1) = (sorted(limits) for limits in self.view_limits())
+        x, y = self.plotted_x, self.plotted_y
+        in_view = (x >= x0) & (x <= x1) & (y >= y0) & (y <= y1)
+        visible = self.visible_mask()
+        in_view = np.flatnonzero(in_view if visible is None else in_view & visible)
+        extent = (x0, x1, y0, y1)
+        labelled = set(grid_sample(x, y, in_view, extent, self.lod_label_grid, self.lod_labels_per_region).tolist())
+        if self.highlighted_index is not None:
+            labelled.add(self.highlighted_index)
+        return in_view, labelled, extent
+
+    def clamp_to_view(self, x, y):
+        (x0, x1), (y0, y1) = (sorted(limits) for limits in self.view_limits())
+        return min(max(x, x0), x1), min(max(y, y0), y1)
+
+    def select_point(self, i):
+        # 클릭한 점을 선택하고 정보를 알린다
+        row = self.data.iloc[i]
+        self.selected_index = i
+        self.selected_point = {
+            "Key": row['Key'],
+            "x": row[self.x_label],
+            "y": row[self.y_label],
+            "Summary": row['Summary']
+        }
+        self.point_selected.emit(self.selected_point)
+        self.point_clicked.emit(row['Key'])
+
+    def drop_point(self, x, y):
+        # 드래그한 점을 (x, y)에 놓는다, 값은 point_dropped 를 받은 쪽에서 DataHandler 에 저장하고
+        # 차트는 저장된 값으로 다시 그린다
+        key = self.selected_point['Key']
+        new_x, new_y = self.clamp_to_view(round(x, 1), round(y, 1))
+
+        self.end_drag()
+        self.point_dropped.emit(key, new_x, new_y)
+        self.update_plot(False)
+
+        # 업데이트된 data point 의 정보를 상단에 노출
+        self.selected_point['x'] = new_x
+        self.selected_point['y'] = new_y
+        self.point_selected.emit(self.selected_point)
+        self.selected_point = None
+        self.selected_index = None
+
+    def request_redraw(self):
+        # 다음 프레임에 한 번만 다시 그린다
+        self.scheduler.schedule('draw', self.draw)
+
+    def reverse_x_axis(self):
+        self.is_x_reversed = not self.is_x_reversed
+        self.update_plot(False)
+
+    def reverse_y_axis(self):
+        self.is_y_reversed = not self.is_y_reversed
+        self.update_plot(False)
+
+    @pyqtSlot(int)
+    def highlight_point(self, row):
+        # 테이블에서 선택된 데이터의 레이블을 크게 표시, 강조된 점의 레이블은 항상 표시
+        if self.data is None or self.plotted_x is None:
+            return
+        key = self.data.iat[row, 2]
+        debug_print(f"highlight_point > key: {key}")
+        self.set_highlight(self.key_index.get(key, row))
+        self.apply_level_of_detail()
+        self.request_redraw()
+
+    @pyqtSlot()
+    def obscure_point(self):
+        # 차트에서 강조된 데이터 표시 초기화
+        self.set_highlight(None)
+        self.apply_level_of_detail()
+        self.request_redraw()
+
+    def set_highlight(self, index):
+        self.highlighted_index = index
@@ -1,9 +1,58 @@
-DEBUG = False  # 디버그 모드 설정
+import os
+
+DEBUG = os.environ.get('QCT_DEBUG', '') not in ('', '0')  # 디버그 모드 설정, QCT_DEBUG=1 또는 set_debug() 로 켠다
+DEBUG_FRAME_ROWS = 5  # 디버그 모드에서 DataFrame 은 크기와 앞부분 몇 row 만 출력
 TEXT_COLUMN_LIST = ["Key", "Summary"]  # 텍스트 값을 갖는 컬럼 정의
 ANNOTAION_DEFAULT_SIZE = 10
 ANNOTAION_BIG_SIZE = 19
 
 
+def set_debug(on=True):
+    global DEBUG
+    DEBUG = on
+
+
 def debug_print(message):
-    if DEBUG:
-        print(message)
+    # 꺼져 있으면 아무것도 만들지 않는다, 만드는 비용이 큰 메시지는 lambda 로 넘기면 켜져 있을 때만 만든다
+    if not DEBUG:
+        return
+    if callable(message):
+        message = message()
+    if hasattr(message, 'shape') and hasattr(message, 'head'):
+        message = f"<{type(message).__name__} {message.shape}>\n{message.head(DEBUG_FRAME_ROWS)}"
+    print(message)
+
+
+# 대량 데이터 표시(Level of Detail) 설정
+LOD_POINT_THRESHOLD = 1000  # 점 개수가 이 값을 넘으면 화면 영역별로 레이블 개수를 제한하여 표시
+LOD_LABEL_GRID = (8, 6)  # 레이블 개수 제한에 사용하는 화면 영역 분할 (가로, 세로)
+LOD_LABELS_PER_REGION = 4  # 화면 영역 하나에 표시하는 최대 레이블 수
+LOD_AGGREGATE_THRESHOLD = 5000  # 화면에 보이는 점 개수가 이 값을 넘으면 개별 점 대신 hexbin 으로 표시
+
+# 파싱한 엑셀 데이터 디스크 캐시 설정
+CACHE_DIR = os.environ.get('QCT_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'quadrant-chart-tool'))
+CACHE_MAX_BYTES = 2 * 1024 ** 3  # 캐시 전체 크기 한도, 넘으면 오래 안 쓴 파일부터 삭제
+
+# 차트 다시 그리기 프레임 제한, 드래그 중 마우스 이벤트와 다시 그리기 요청은 이 간격으로 모아서 처리
+REDRAW_MAX_FPS = int(os.environ.get('QCT_MAX_FPS', 60))
+
+SHEET_CACHE_SIZE = 8  # 시트 전환 시 다시 읽지 않도록 메모리에 보관하는 시트 수
+
+AUTOSAVE_INTERVAL_SEC = 60  # 편집 기록이 있으면 이 간격으로 원본 엑셀 파일에 자동 저장
+# openpyxl 로 불러와 다시 저장하면 사라지는 통합 문서 구성 요소(xlsx 내부 경로), 하나라도 있으면 자동 저장하지 않는다
+OPENPYXL_UNSUPPORTED_PARTS = ('xl/charts/', 'xl/drawings/', 'xl/media/', 'xl/vbaProject.bin', 'xl/activeX/',
+                              'xl/ctrlProps/', 'xl/slicers/', 'xl/slicerCaches/', 'xl/timelines/',
+                              'xl/timelineCaches/', 'xl/model/', 'customXml/')
+
+FILTER_DELAY_MS = 150  # 필터 입력 중에는 마지막 입력 후 이 시간만큼 기다렸다가 한 번만 적용
+
+# 버전 비교 재생 설정
+PLAYBACK_FPS = 30  # 재생 프레임 수
+PLAYBACK_SECONDS_PER_VERSION = 1.0  # 이웃한 두 버전 사이를 이동하는 데 걸리는 시간
+
+# 차트 백엔드: 표시 이름 -> (모듈, 캔버스 클래스), 선택한 백엔드는 설정에 저장되어 다음 실행에도 사용
+CHART_BACKENDS = {
+    'Matplotlib': ('chart', 'ChartCanvas'),
+    'Qt Raster': ('qt_chart', 'QtChartCanvas'),
+}
+DEFAULT_CHART_BACKEND = 'Matplotlib'
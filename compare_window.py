@@ -0,0 +1,174 @@
+import os
+import time
+
+import numpy as np
+import pandas as pd
+from PyQt5.QtCore import Qt, QTimer, pyqtSlot
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPushButton, QSlider, QLabel
+from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+
+from chart import ChartCanvas
+from common import PLAYBACK_FPS, PLAYBACK_SECONDS_PER_VERSION
+from quadrant import generate_colors
+
+SLIDER_STEPS = 100  # 이웃한 두 버전 사이의 슬라이더 눈금 수
+
+
+class CompareWindow(QDialog):
+    # 여러 버전에서 점이 이동한 경로를 재생, 차트 요소는 다시 만들지 않는다
+    # 재생(또는 슬라이더 드래그) 중에는 보간한 좌표로 점만 블리팅하고, 멈추면 레이블까지 전체를 다시 그린다
+    def __init__(self, timeline, x_label, y_label, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle('Compare Versions')
+        self.resize(1200, 900)
+        self.timeline = timeline
+        self.names = [os.path.basename(path) for path in timeline.files]
+        self.position = 0.0  # 현재 재생 위치, 0 ~ 버전 수 - 1
+        self.last_tick = None
+        self.animating = False  # 재생 또는 슬라이더 드래그 중
+        self.moves = None  # 이웃한 버전 사이에 사분면이 바뀐 항목 수
+
+        # 차트 데이터는 현재 프레임 좌표 배열을 그대로 참조하므로 프레임마다 배열 값만 바꾸면 된다
+        self.frame_x = timeline.x[0].copy()
+        self.frame_y = timeline.y[0].copy()
+        keys = np.empty(len(timeline.keys), dtype=object)
+        keys[:] = timeline.keys
+        summaries = np.empty(len(timeline.summaries), dtype=object)
+        summaries[:] = timeline.summaries
+        data = pd.DataFrame({0: self.frame_x, 1: self.frame_y, 2: keys, 3: summaries}, copy=False)
+        data.columns = [x_label, y_label, 'Key', 'Summary']
+
+        layout = QVBoxLayout(self)
+        self.canvas = ChartCanvas(self)
+        self.toolbar = NavigationToolbar(self.canvas, self)
+        layout.addWidget(self.toolbar)
+        layout.addWidget(self.canvas, 8)
+
+        controls = QHBoxLayout()
+        self.play_button = QPushButton('Play')
+        self.play_button.clicked.connect(self.toggle_playback)
+        controls.addWidget(self.play_button)
+
+        self.slider = QSlider(Qt.Horizontal)
+        self.slider.setRange(0, (len(timeline) - 1) * SLIDER_STEPS)
+        self.slider.valueChanged.connect(self.on_slider_moved)
+        self.slider.sliderPressed.connect(self.start_scrubbing)
+        self.slider.sliderReleased.connect(self.stop_animation)
+        controls.addWidget(self.slider, 1)
+
+        self.version_label = QLabel()
+        controls.addWidget(self.version_label)
+        layout.addLayout(controls)
+
+        self.moves_label = QLabel()
+        layout.addWidget(self.moves_label)
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(int(1000 / PLAYBACK_FPS))
+        self.timer.timeout.connect(self.next_frame)
+
+        # 차트 크기는 모든 버전을 포함하도록 설정
+        self.canvas.plot(data, x_label, y_label, generate_colors(len(keys)))
+        self.canvas.chart_size_x, self.canvas.chart_size_y = timeline.bounds()
+        self.canvas.update_plot(False)
+        self.canvas.set_trails(timeline.x, timeline.y)
+        self.canvas.midline_moved.connect(self.count_moves)
+        self.canvas.mpl_connect('button_press_event', lambda event: self.pause())  # 중앙선, 점 드래그 전에 재생을 멈춘다
+        self.count_moves(self.canvas.x_mid, self.canvas.y_mid)
+        self.show_frame(0.0)
+
+    @pyqtSlot()
+    def toggle_playback(self):
+        if self.timer.isActive():
+            self.pause()
+            return
+        if self.position >= len(self.timeline) - 1:
+            self.position = 0.0
+        self.start_animation()
+        self.last_tick = time.perf_counter()
+        self.timer.start()
+        self.play_button.setText('Pause')
+
+    @pyqtSlot()
+    def pause(self):
+        self.timer.stop()
+        self.play_button.setText('Play')
+        self.stop_animation()
+
+    def start_animation(self):
+        if not self.animating:
+            self.animating = True
+            self.canvas.start_animation()
+
+    @pyqtSlot()
+    def stop_animation(self):
+        # 멈춘 위치의 점과 레이블을 데이터에 반영하여 전체 다시 그리기
+        if self.animating:
+            self.animating = False
+            self.canvas.end_animation()
+            self.show_frame(self.position)
+
+    @pyqtSlot()
+    def start_scrubbing(self):
+        self.timer.stop()
+        self.play_button.setText('Play')
+        self.start_animation()
+
+    def next_frame(self):
+        # 실제 경과 시간 기준으로 진행, 프레임이 늦어져도 재생 속도는 일정하다
+        now = time.perf_counter()
+        position = self.position + (now - self.last_tick) / PLAYBACK_SECONDS_PER_VERSION
+        self.last_tick = now
+        last = len(self.timeline) - 1
+        self.show_frame(min(position, last))
+        if position >= last:
+            self.pause()
+
+    @pyqtSlot(int)
+    def on_slider_moved(self, value):
+        self.show_frame(value / SLIDER_STEPS)
+
+    def show_frame(self, position):
+        self.position = position
+        x, y, visible = self.timeline.frame(position)
+        if self.animating:
+            self.canvas.animate_points(x, y, visible)
+        else:
+            self.show_positions(x, y, visible)
+
+        self.slider.blockSignals(True)
+        self.slider.setValue(round(position * SLIDER_STEPS))
+        self.slider.blockSignals(False)
+        self.show_version()
+
+    def show_positions(self, x, y, visible):
+        # 차트 데이터(현재 프레임 배열)를 바꾸고 바뀐 점과 레이블만 갱신
+        np.copyto(self.frame_x, x)
+        np.copyto(self.frame_y, y)
+
+        # 해당 프레임에 없는 항목은 숨긴다, 표시 대상이 바뀐 경우에만 갱신
+        mask = None if visible.all() else visible
+        current = self.canvas.point_filter
+        if (mask is None) != (current is None) or (mask is not None and not np.array_equal(mask, current)):
+            self.canvas.set_point_filter(mask)
+        self.canvas.update_plot(False)
+
+    @pyqtSlot(float, float)
+    def count_moves(self, x_mid, y_mid):
+        # 중앙선이 바뀌면 버전 사이 사분면 이동 수를 다시 계산
+        self.moves = self.timeline.quadrant_moves(x_mid, y_mid)
+        self.show_version()
+
+    def show_version(self):
+        index = min(int(self.position), len(self.timeline) - 1)
+        self.version_label.setText(f"{self.names[index]} ({index + 1} / {len(self.timeline)})")
+        if self.moves is None or len(self.moves) == 0:
+            self.moves_label.setText('')
+            return
+        segment = min(index, len(self.moves) - 1)
+        self.moves_label.setText(f"{self.names[segment]} -> {self.names[segment + 1]}: "
+                                 f"{self.moves[segment]} items changed quadrant")
+
+    def closeEvent(self, event):
+        self.pause()
+        super().closeEvent(event)
@@ -1,30 +1,322 @@
+import importlib.util
+import os
+import time
+import tracemalloc
+import zipfile
+from itertools import islice
+from xml.etree import ElementTree
+
+import numpy as np
 import openpyxl
 import pandas as pd
 
-from common import debug_print
+import instrument
+from common import debug_print, TEXT_COLUMN_LIST, OPENPYXL_UNSUPPORTED_PARTS
+from formula import compile_formulas, evaluate_formulas, formula_order, build_dependents
+from text_index import TokenIndex
+
+# pyarrow 가 없으면 Parquet 형식은 등록하지 않는다, 있으면 Parquet 파일을 처음 읽을 때 import
+PARQUET_AVAILABLE = importlib.util.find_spec('pyarrow') is not None
+
+LOAD_CHUNK_SIZE = 5000  # 스트리밍 로드 시 한 번에 읽어들이는 row 수
+LOAD_PREVIEW_ROWS = 500  # 미리보기를 요청한 경우 첫 chunk 의 row 수
+
+# 컬럼 타입 추론 단계, 값이 들어올수록 숫자 -> object 방향으로만 넓어진다
+# 숫자 컬럼은 정수, 실수 구분 없이 float64 배열로 저장하여 테이블과 차트가 변환 없이 같은 배열을 사용한다
+_KIND_NUMBER = 0
+_KIND_OBJECT = 1
+
+_NUMBER_TYPES = {int, float, type(None)}
+
+
+_SPREADSHEET_NS = '{http://schemas.openxmlformats.org/spreadsheetml/2006/main}'
+
+# 확장자 -> (형식 이름, DataHandler 읽기 메서드 이름), 모든 읽기 메서드는 같은 규칙(헤더, 빈 셀 0, 숫자 컬럼 float64)으로
+# DataFrame 을 만들어 column_info 와 이후 처리가 파일 형식과 관계없이 같다
+READERS = {}
+
+
+def register_reader(extension, description, enabled=True):
+    # 읽기 메서드 데코레이터, 메서드는 (file_path, progress, cancel, preview, sheet_name) 을 받아 DataFrame 을 반환
+    def register(method):
+        if enabled:
+            READERS[extension] = (description, method.__name__)
+        return method
+    return register
+
+
+def file_extension(file_path):
+    return os.path.splitext(file_path)[1].lower()
+
+
+def open_file_filter():
+    # 파일 열기 대화상자 필터, 등록된 모든 형식을 한 번에 고르는 항목 + 형식별 항목
+    patterns = ' '.join(f'*{extension}' for extension in READERS)
+    return ';;'.join([f'Data Files ({patterns})'] +
+                     [f'{description} (*{extension})' for extension, (description, _) in READERS.items()])
+
+
+class LoadCancelled(Exception):
+    pass
+
+
+def list_sheets(file_path):
+    # 시트 내용은 읽지 않고 통합 문서 정보(xl/workbook.xml)에서 시트 이름만 순서대로 가져온다
+    # CSV, Parquet 은 시트가 하나이고 이름은 파일 이름(확장자 제외)
+    if file_extension(file_path) != '.xlsx':
+        return [os.path.splitext(os.path.basename(file_path))[0]]
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            root = ElementTree.fromstring(archive.read('xl/workbook.xml'))
+        return [sheet.get('name') for sheet in root.iter(f'{_SPREADSHEET_NS}sheet')]
+    except (KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+        # 표준 구조가 아니면 openpyxl 로 확인
+        wb = openpyxl.load_workbook(file_path, read_only=True)
+        try:
+            return wb.sheetnames
+        finally:
+            wb.close()
+
+
+def frame_from_arrays(arrays, index, header):
+    # 컬럼 배열을 복사하지 않고 DataFrame 으로 묶는다
+    # pandas 3 은 문자열 object 배열을 str 타입으로 바꾸면서 복사하므로, Key/Summary 도 같은 배열을 참조하도록 추론을 끈다
+    with pd.option_context('future.infer_string', False):
+        data = pd.DataFrame(dict(enumerate(arrays)), index=index, copy=False)
+    data.columns = header
+    return data
+
+
+def unsupported_parts(file_path):
+    # write_patches 로 저장하면 사라지는 구성 요소(차트, 이미지, 매크로 등)의 xlsx 내부 경로 접두사 목록
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            names = archive.namelist()
+    except (OSError, zipfile.BadZipFile):
+        return []
+    return [part for part in OPENPYXL_UNSUPPORTED_PARTS if any(name.startswith(part) for name in names)]
 
 
 class DataHandler:
     def __init__(self):
         self.data = None
         self.column_info = {}
+        self.formulas = {}  # 수식 컬럼 인덱스 -> 파싱된 Formula
+        self.formula_values = {}  # 수식 컬럼 인덱스 -> 계산된 결과 배열
+        self.formula_order = []  # 수식 컬럼 계산 순서
+        self.dependents = {}  # 컬럼 인덱스 -> 그 컬럼을 직접 참조하는 수식 컬럼
+        self.key_index = {}  # Key -> row 위치(0부터 시작), 같은 Key가 여러 개면 첫 번째 row
+        self.load_stats = {}  # 마지막 로드의 처리 속도, 메모리 사용량 정보
+        self.file_path = None  # 데이터를 읽어온 원본 파일
+        self.sheet_name = None
+        self.dirty_cells = set()  # 로드 이후 변경된 셀 (row, col), 저장 시 이 셀만 원본에 반영
+        self.journal = None  # 설정되면 셀 값이 바뀔 때마다 편집 기록(Journal)에 추가, 다른 DataHandler 로 복사하지 않는다
+        self.text_index = None  # Key, Summary 단어 색인, 필요할 때 만들고 셀 편집 시 해당 row 만 갱신
+
+    @instrument.traced('load')
+    def load_data(self, file_path, streaming=True, track_memory=False, progress=None, cancel=None, preview=None,
+                  cache=None, sheet_name=None):
+        # streaming=False 이면 기존 방식(전체 편집 모드 로드)으로 읽는다, 성능 비교용
+        # progress(stage, done, total): 진행 상황 콜백, cancel: threading.Event, 설정되면 LoadCancelled 발생
+        # preview(DataFrame): 첫 chunk 를 읽은 직후 미리보기 데이터 전달
+        # cache(WorkbookCache): 주어지면 캐시된 컬럼과 수식 결과를 사용하고, 없으면 읽은 뒤 수식까지 계산하여 저장
+        # sheet_name: 읽을 시트, 없으면 첫 번째 시트
+        # 읽기 방식은 확장자로 READERS 에서 고른다, streaming=False 는 .xlsx 에만 적용
+        # 취소되거나 실패하면 기존 데이터는 그대로 유지된다
+        if track_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        cache_hit = False
+
+        try:
+            if sheet_name is None and cache is not None:
+                sheet_name = list_sheets(file_path)[0]
+            cached, cache_key = cache.load(file_path, sheet_name) if cache is not None else (None, None)
+            if cached is not None:
+                self.restore_cached(cached)
+                cache_hit = True
+            else:
+                if streaming or file_extension(file_path) != '.xlsx':
+                    self.data = self.reader_for(file_path)(file_path, progress, cancel, preview, sheet_name)
+                else:
+                    self.data = self.read_workbook_full(file_path, sheet_name)
+                self.create_column_info()  # 컬럼 정보를 저장
+                if cache is not None:
+                    self.calculate_formulas(progress)
+                    cache.store(cache_key, self.data, self.column_info, self.formula_values, self.sheet_name)
+            self.build_key_index()
+            self.text_index = None
+            self.file_path = file_path
+            self.dirty_cells = set()
+        finally:
+            peak_memory = None
+            if track_memory:
+                _, peak_memory = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
 
-    def load_data(self, file_path):
+        elapsed = time.perf_counter() - start
+        rows = self.data.shape[0]
+        self.load_stats = {
+            'mode': 'cache' if cache_hit else 'streaming' if streaming else 'full',
+            'format': file_extension(file_path).lstrip('.'),
+            'rows': rows,
+            'seconds': elapsed,
+            'rows_per_sec': rows / elapsed if elapsed > 0 else float('inf'),
+            'peak_memory': peak_memory
+        }
+        debug_print(f"load_data -> {self.load_stats}")
+
+    def reader_for(self, file_path):
+        extension = file_extension(file_path)
+        if extension not in READERS:
+            raise ValueError(f"Unsupported file type: {extension or os.path.basename(file_path)}")
+        return getattr(self, READERS[extension][1])
 
+    def read_workbook_full(self, file_path, sheet_name=None):
+        # 기존 로드 방식: 셀 객체 전체를 메모리에 올린다, 성능 비교용
+        # 컬럼 배열은 스트리밍 로드와 같은 방법으로 만들어 두 방식의 컬럼 타입(float64/object)이 같다
         wb = openpyxl.load_workbook(file_path)
-        sheet_names = wb.get_sheet_names()
-        name = sheet_names[0]
-        sheet_ranges = wb[name]
-        self.data = pd.DataFrame(sheet_ranges.values)
-        self.data.fillna(0, inplace=True)
+        self.sheet_name = sheet_name if sheet_name is not None else wb.sheetnames[0]
+        sheet = wb[self.sheet_name]
+        return self.collect_rows(sheet.values, max(sheet.max_row - 1, 0))
+
+    @register_reader('.xlsx', 'Excel Files')
+    def read_workbook_streaming(self, file_path, progress=None, cancel=None, preview=None, sheet_name=None):
+        # read-only, values-only 모드로 row를 chunk 단위로 읽으면서 컬럼별 타입을 추론한다
+        # 셀 객체 그리드를 만들지 않고 컬럼별 값 리스트만 누적한 뒤 DataFrame은 한 번만 생성
+        # read-only 모드에서는 선택한 시트만 읽고 다른 시트는 파싱하지 않는다
+        wb = openpyxl.load_workbook(file_path, read_only=True)
+        try:
+            self.sheet_name = sheet_name if sheet_name is not None else wb.sheetnames[0]
+            sheet = wb[self.sheet_name]
+            total = max((sheet.max_row or 1) - 1, 0)  # 시트 크기 정보가 없으면 0
+            return self.collect_rows(sheet.iter_rows(values_only=True), total, progress, cancel, preview)
+        finally:
+            wb.close()
+
+    def collect_rows(self, rows, total, progress=None, cancel=None, preview=None):
+        # 시트 row(값 tuple) iterator 를 컬럼 배열로 변환, 첫 번째 row 는 헤더
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        width = len(header)
+
+        def read_chunk(size):
+            # row 길이가 헤더와 다르면 헤더 기준으로 맞춘다
+            chunk = [row if len(row) == width else (tuple(row) + (None,) * width)[:width]
+                     for row in islice(rows, size)]
+            return list(zip(*chunk))
+
+        return self.collect_columns(header, read_chunk, total, progress, cancel, preview)
+
+    @register_reader('.csv', 'CSV Files')
+    def read_csv(self, file_path, progress=None, cancel=None, preview=None, sheet_name=None):
+        # pandas C 파서로 chunk 단위로 읽는다, 타입은 chunk 별로 추론된 값을 엑셀과 같은 방식으로 합친다
+        # 헤더를 따로 읽어서 같은 이름의 컬럼도 이름을 바꾸지 않고, Key, Summary 는 숫자처럼 보여도 문자열로 읽는다
+        self.sheet_name = list_sheets(file_path)[0]
+        try:
+            header = pd.read_csv(file_path, header=None, nrows=1, dtype=object).iloc[0].tolist()
+        except pd.errors.EmptyDataError:
+            return pd.DataFrame()
+        header = [None if pd.isna(name) else name for name in header]
+        width = len(header)
+        text_columns = {j: str for j, name in enumerate(header) if name in TEXT_COLUMN_LIST}
+
+        with pd.read_csv(file_path, header=None, skiprows=1, names=range(width), dtype=text_columns,
+                         chunksize=LOAD_CHUNK_SIZE) as reader:
+            def read_chunk(size):
+                try:
+                    chunk = reader.get_chunk(size)
+                except StopIteration:
+                    return []
+                columns = []
+                for j in range(width):
+                    values = chunk[j].to_numpy(dtype=object)
+                    values[pd.isna(values)] = None  # 빈 칸은 엑셀의 빈 셀과 같이 None
+                    columns.append(values.tolist())
+                return columns
+
+            # 전체 row 수는 읽기 전에 알 수 없으므로 0 (진행 표시는 읽은 row 수만)
+            return self.collect_columns(header, read_chunk, 0, progress, cancel, preview)
+
+    @register_reader('.parquet', 'Parquet Files', enabled=PARQUET_AVAILABLE)
+    def read_parquet(self, file_path, progress=None, cancel=None, preview=None, sheet_name=None):
+        # 파일을 memory-map 하여 컬럼 단위로 읽는다, 숫자 컬럼은 Arrow 배열에서 float64 배열로 바로 변환
+        # 편집할 수 있도록 숫자 컬럼도 복사본을 사용 (memory-map 버퍼는 읽기 전용)
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        self.sheet_name = list_sheets(file_path)[0]
+        table = pq.read_table(file_path, memory_map=True)
+        header = table.column_names
+        row_count = table.num_rows
+
+        arrays = []
+        for j, column in enumerate(table.columns):
+            if cancel is not None and cancel.is_set():
+                raise LoadCancelled()
+            is_number = pa.types.is_integer(column.type) or pa.types.is_floating(column.type)
+            if is_number and header[j] not in TEXT_COLUMN_LIST:
+                array = np.array(column.fill_null(0).to_numpy(), dtype=np.float64)
+            else:
+                array = self.build_column(column.to_pylist(), _KIND_OBJECT, row_count)
+            arrays.append(array)
+            if progress is not None:
+                progress('rows', row_count * (j + 1) // len(header), row_count)
+        return frame_from_arrays(arrays, range(1, row_count + 1), header)
+
+    def collect_columns(self, header, read_chunk, total, progress=None, cancel=None, preview=None):
+        # read_chunk(size): 최대 size 개 row 를 컬럼별 값 목록으로 반환, 더 없으면 빈 목록
+        # 컬럼별 값을 누적하면서 타입을 추론하고 마지막에 DataFrame 을 한 번만 만든다
+        header = [0 if name is None else name for name in header]  # 기존 fillna(0) 동작 유지
+        width = len(header)
+        columns = [[] for _ in range(width)]
+        kinds = [_KIND_NUMBER] * width
+
+        while True:
+            if cancel is not None and cancel.is_set():
+                raise LoadCancelled()
 
-        new_header = self.data.iloc[0]  # 첫 번째 row를 헤더로 사용
-        self.data = self.data[1:]  # 첫 번째 row를 데이터로 사용하므로 제거
-        self.data.columns = new_header  # 헤더 설정
-        self.create_column_info() # 컬럼 정보를 저장
+            first_chunk = not columns[0] if columns else False
+            chunk_size = LOAD_PREVIEW_ROWS if preview is not None and first_chunk else LOAD_CHUNK_SIZE
+            chunk = read_chunk(chunk_size)
+            if not chunk or not len(chunk[0]):
+                break
+
+            for j, values in enumerate(chunk):
+                columns[j].extend(values)
+                if kinds[j] == _KIND_OBJECT:
+                    continue
+                if not set(map(type, values)) <= _NUMBER_TYPES:
+                    kinds[j] = _KIND_OBJECT
+
+            row_count = len(columns[0])
+            if progress is not None:
+                progress('rows', row_count, max(total, row_count) if total else 0)
+            if preview is not None and first_chunk and len(chunk[0]) == chunk_size:
+                preview(self.build_frame(header, columns, kinds))
+
+        return self.build_frame(header, columns, kinds)
+
+    def build_frame(self, header, columns, kinds):
+        # 컬럼별 값 목록으로 DataFrame 생성, index 는 1부터 시작
+        row_count = len(columns[0]) if columns else 0
+        arrays = [self.build_column(values, kind, row_count) for values, kind in zip(columns, kinds)]
+        return frame_from_arrays(arrays, range(1, row_count + 1), header)
+
+    @staticmethod
+    def build_column(values, kind, row_count):
+        # 추론된 타입으로 컬럼 배열 생성, 빈 셀은 0으로 채운다
+        if kind == _KIND_NUMBER:
+            return np.fromiter((0.0 if v is None else v for v in values), dtype=np.float64, count=row_count)
+
+        array = np.empty(row_count, dtype=object)
+        array[:] = [0 if v is None else v for v in values]
+        return array
 
     def create_column_info(self):
         # 첫번째 row 값을 조사하여 컬럼 정보를 딕셔너리 형으로 저장한다
+        self.column_info.clear()  # 이전 파일의 컬럼 정보 제거
 
         # 알파벳 순서대로 맵핑
         for i, value in enumerate(self.data.columns):
@@ -32,7 +324,7 @@ class DataHandler:
             alphabet = chr(65 + i)
 
             is_formula = False
-            cell_data = self.data.at[1, value]
+            cell_data = self.data.iat[0, i] if self.data.shape[0] > 0 else None
             if str(cell_data).startswith('='):
                 is_formula = True
 
@@ -41,6 +333,23 @@ class DataHandler:
         # 결과 출력
         debug_print(self.column_info)
 
+        # 수식은 컬럼별로 한 번만 파싱해 두고, 셀 편집 시 다시 계산할 컬럼을 찾기 위한 의존 관계를 만든다
+        self.formulas = compile_formulas(self.column_info)
+        self.formula_values = {}
+        self.formula_order, _ = formula_order(self.formulas)
+        self.dependents = build_dependents(self.formulas)
+
+    def restore_cached(self, cached):
+        # 캐시에서 읽은 데이터로 설정, 수식은 셀 편집 시 다시 계산하기 위해 컴파일만 한다
+        self.data, column_info, formula_values, self.sheet_name = cached
+        self.column_info.clear()
+        self.column_info.update(column_info)
+        self.formulas = compile_formulas(self.column_info)
+        # 이전 버전에서 정수 결과를 int64 로 저장한 캐시도 float64 로 맞춘다
+        self.formula_values = {col: values.astype(np.float64, copy=False) for col, values in formula_values.items()}
+        self.formula_order, _ = formula_order(self.formulas)
+        self.dependents = build_dependents(self.formulas)
+
     def add_data(self, index, alphabet, name, is_formula, formula):
         self.column_info[index] = {
             'alphabet': alphabet,
@@ -49,19 +358,241 @@ class DataHandler:
             'formula': formula
         }
 
+    @instrument.traced('formula.evaluate')
+    def calculate_formulas(self, progress=None):
+        # 현재 데이터 기준으로 모든 수식 컬럼을 다시 계산
+        self.formula_values = evaluate_formulas(self.data, self.formulas, progress)
+        return self.formula_values
+
+    def dependent_columns(self, col):
+        # col 에 직접 또는 간접적으로 의존하는 수식 컬럼, 계산 순서대로
+        affected = set()
+        pending = [col]
+        while pending:
+            for dependent in self.dependents.get(pending.pop(), ()):
+                if dependent not in affected:
+                    affected.add(dependent)
+                    pending.append(dependent)
+        return [index for index in self.formula_order if index in affected]
+
+    @instrument.traced('formula.row')
+    def recalculate_row(self, row, col):
+        # row 의 col 값이 바뀌었을 때 그 값에 의존하는 수식 셀만 다시 계산, 값이 바뀐 수식 컬럼 목록 반환
+        changed = []
+        for index in self.dependent_columns(col):
+            formula = self.formulas[index]
+            if formula is None:
+                continue
+            result = formula.evaluate(lambda ref: self.cell_as_float(row, ref), 1)[0]
+
+            values = self.formula_values[index]
+            if result != values[row]:
+                values[row] = result  # float64 배열에 바로 쓴다, 테이블과 차트는 같은 배열을 참조
+                changed.append(index)
+        return changed
+
+    def cell_as_float(self, row, col):
+        # 수식 한 셀 계산용 입력 값, 수식 컬럼이면 계산 결과를 사용
+        if col in self.formula_values:
+            return self.formula_values[col][row:row + 1]
+
+        try:
+            value = float(self.data.iat[row, col])
+        except (TypeError, ValueError):
+            value = np.nan
+        return np.array([value])
+
+    def set_data(self, data):
+        # 이미 만들어진 DataFrame 으로 데이터 교체 (미리보기 등)
+        self.data = data
+        self.create_column_info()
+        self.build_key_index()
+        self.text_index = None
+        self.file_path = None
+        self.sheet_name = None
+        self.dirty_cells = set()
+
+    def replace_with(self, other):
+        # 다른 DataHandler(백그라운드에서 로드 완료된 데이터)의 내용으로 교체
+        # column_info, key_index 는 다른 객체가 참조하므로 딕셔너리 내용만 바꾼다
+        self.data = other.data
+        self.column_info.clear()
+        self.column_info.update(other.column_info)
+        self.formulas = other.formulas
+        self.formula_values = other.formula_values
+        self.formula_order = other.formula_order
+        self.dependents = other.dependents
+        self.key_index.clear()
+        self.key_index.update(other.key_index)
+        self.load_stats = other.load_stats
+        self.file_path = other.file_path
+        self.sheet_name = other.sheet_name
+        self.dirty_cells = other.dirty_cells
+        self.text_index = other.text_index
+
+    def get_formula_values(self):
+        return self.formula_values
+
+    def key_column(self):
+        # Key 컬럼의 위치, 없으면 None
+        if self.data is None or 'Key' not in self.data.columns:
+            return None
+        return self.data.columns.get_loc('Key')
+
+    def build_key_index(self):
+        # Key -> row 위치 인덱스 생성, 다른 객체가 같은 딕셔너리를 참조할 수 있도록 내용만 교체한다
+        self.key_index.clear()
+        col = self.key_column()
+        if col is None:
+            return
+        keys = self.data.iloc[:, col].tolist()
+        for row in range(len(keys) - 1, -1, -1):
+            self.key_index[keys[row]] = row
+
+    def get_text_index(self):
+        # 텍스트 컬럼 단어 색인, 없으면 만든다 (로드 워커에서 미리 만들어 둔다)
+        if self.text_index is None:
+            columns = {name: self.data[name].tolist() for name in TEXT_COLUMN_LIST if name in self.data.columns}
+            self.text_index = TokenIndex(columns, self.data.shape[0])
+        return self.text_index
+
+    def get_row(self, key):
+        # Key 에 해당하는 row 위치, 없으면 None
+        return self.key_index.get(key)
+
+    def set_value(self, row, col, value):
+        # row, col 위치(0부터 시작)의 값을 변경, 컬럼 배열은 그대로 두고 값만 바꾼다 (차트가 같은 배열을 참조)
+        # 컬럼 타입에 맞지 않는 값이 들어온 경우에만 컬럼을 넓힌다
+        # 컬럼(Series)을 변수로 잡아두면 쓰기 시 배열이 복사되므로 dtype 만 확인한다
+        dtype = self.data.dtypes.iloc[col]
+        if pd.api.types.is_integer_dtype(dtype):
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+            elif not isinstance(value, int):
+                self.widen_column(col, np.float64 if isinstance(value, float) else object)
+        elif pd.api.types.is_float_dtype(dtype):
+            if not isinstance(value, (int, float)):
+                self.widen_column(col, object)
+        elif isinstance(dtype, pd.StringDtype):
+            if not isinstance(value, str):
+                self.widen_column(col, object)
+        elif dtype != object:
+            self.widen_column(col, object)
+
+        old_value = self.data.iat[row, col]
+        if self.journal is not None and old_value != value:
+            key_col = self.key_column()
+            key = self.data.iat[row, key_col] if key_col is not None else row
+            self.journal.append(self.sheet_name, key, self.data.columns[col], old_value, value)
+
+        self.data.iat[row, col] = value
+        if old_value != value:
+            self.dirty_cells.add((row, col))
+
+        if col == self.key_column() and old_value != value:
+            self.rekey(row, old_value, value)
+        if self.text_index is not None and old_value != value:
+            self.text_index.update(self.data.columns[col], row, value)
+
+    def widen_column(self, col, dtype):
+        # 컬럼 배열을 새 타입으로 교체, 이전에 가져간 배열(view)에는 이후 변경이 반영되지 않는다
+        self.data.isetitem(col, self.data.iloc[:, col].astype(dtype))
+
+    def rekey(self, row, old_key, new_key):
+        # Key 가 변경된 row 의 인덱스만 갱신
+        if self.key_index.get(old_key) == row:
+            # 같은 Key 를 가진 다른 row 가 있으면 그 row 를 가리키도록 한다
+            del self.key_index[old_key]
+            col = self.key_column()
+            others = (self.data.iloc[:, col] == old_key).to_numpy().nonzero()[0]
+            if len(others):
+                self.key_index[old_key] = int(others[0])
+
+        current = self.key_index.get(new_key)
+        if current is None or current > row:
+            self.key_index[new_key] = row
+
+    def column_values(self, col):
+        # 화면에 보이는 값 배열(수식 컬럼은 계산 결과), 사본이 아닌 저장된 배열 그대로
+        if col in self.formula_values:
+            return self.formula_values[col]
+        return self.data.iloc[:, col].to_numpy()
+
+    def get_table_data(self, columns=None):
+        # 화면에 보이는 값(수식 컬럼은 계산 결과)으로 구성한 DataFrame, columns 로 필요한 컬럼만 선택
+        # 복사하지 않고 컬럼 배열을 그대로 참조하므로 셀 값이 바뀌면 바로 반영된다, 읽기 전용으로 사용
+        if columns is None:
+            columns = list(self.data.columns)
+
+        arrays = [self.column_values(self.data.columns.get_loc(name)) for name in columns]
+        return frame_from_arrays(arrays, self.data.index, columns)
+
     def get_data(self):
         return self.data
 
     def get_column_info(self):
         return self.column_info
 
-    def save_data(self, file_path):
+    @instrument.traced('save')
+    def save_data(self, file_path, other_sheets=()):
+        # other_sheets: 같은 파일에서 읽은 다른 시트의 DataHandler, 해당 시트의 변경 셀도 함께 저장
         if self.data is not None:
-            debug_print("=========================== save data ==========================")
-            debug_print(self.data)
-            debug_print("=========================== save data ==========================")
+            handlers = [self] + [handler for handler in other_sheets
+                                 if handler is not self and handler.file_path == self.file_path]
+            debug_print(f"save data -> {file_path}, dirty cells: {[len(h.dirty_cells) for h in handlers]}")
+            instrument.count('save.cells', sum(len(handler.dirty_cells) for handler in handlers))
+
+            if self.file_path is not None and self.file_path.lower().endswith('.xlsx') \
+                    and os.path.exists(self.file_path):
+                # 원본 통합 문서에 변경된 셀만 반영, 수식/서식/다른 시트는 그대로 유지
+                self.patch_workbook(file_path, handlers)
+            else:
+                handlers = [self]
+                writer = pd.ExcelWriter(file_path, engine='openpyxl')
+                self.data.to_excel(writer, index=False, sheet_name=self.sheet_name or 'Sheet1')
+                writer.close()
+
+            # 저장한 파일이 이후 변경 사항의 기준이 된다
+            for handler in handlers:
+                handler.file_path = file_path
+                handler.dirty_cells = set()
+
+    def patch_workbook(self, file_path, handlers=None):
+        # 원본 파일을 열어 변경된 셀 값만 바꾼 뒤 file_path 로 저장
+        patches = {handler.sheet_name: handler.dirty_values() for handler in handlers or [self]}
+        write_patches(self.file_path, file_path, patches)
+
+    def dirty_values(self):
+        # 저장할 변경 셀 [(row, col, value)], 수식 컬럼은 원본 수식을 유지하기 위해 제외
+        values = []
+        for row, col in sorted(self.dirty_cells):
+            details = self.column_info.get(col)
+            if details is None or details['is_formula']:
+                continue
+            value = self.data.iat[row, col]
+            if isinstance(value, np.generic):
+                value = value.item()
+            values.append((row, col, value))
+        return values
+
+
+def write_patches(source_path, target_path, patches):
+    # source_path 통합 문서에 {시트 이름: [(row, col, value)]} 를 반영하여 target_path 로 저장
+    # 값만 전달받으므로 백그라운드 스레드(자동 저장)에서도 호출할 수 있다
+    # openpyxl 이 지원하지 않는 구성 요소(unsupported_parts)는 저장한 파일에서 사라진다
+    wb = openpyxl.load_workbook(source_path)
+
+    # 다른 시트에 잘못 쓰지 않도록, 없는 시트가 있으면 아무것도 저장하지 않는다
+    missing = [name for name in patches if name not in wb.sheetnames]
+    if missing:
+        raise ValueError(f"sheet not found in {os.path.basename(source_path)}: {', '.join(map(str, missing))}")
 
-            writer = pd.ExcelWriter(file_path, engine='openpyxl')
-            self.data.to_excel(writer, index=False, sheet_name='Sheet1')
-            writer.close()
+    patched = 0
+    for name, values in patches.items():
+        sheet = wb[name]
+        for row, col, value in values:
+            sheet.cell(row=row + 2, column=col + 1, value=value)  # 1행은 헤더
+            patched += 1
 
+    wb.save(target_path)
+    debug_print(f"write_patches -> {patched} cells")
@@ -0,0 +1,214 @@
+import re
+from collections import defaultdict
+
+import numpy as np
+import pandas as pd
+
+# 수식 토큰: 셀 참조(A2, $B$3, C), 숫자, 연산자, 괄호
+_TOKEN_PATTERN = re.compile(r'\s*(?:(\$?[A-Za-z]+\$?\d*)|(\d+\.?\d*|\.\d+)|(.))')
+_OPERATORS = {'+', '-', '*', '/'}
+
+
+class FormulaError(Exception):
+    pass
+
+
+class Formula:
+    # 컬럼 수식을 한 번만 파싱하여 표현식 트리로 저장하고, 컬럼 전체를 NumPy 배열로 한 번에 계산한다
+    # 트리 노드: ('num', 값) / ('ref', 컬럼 인덱스) / ('neg', 노드) / ('bin', 연산자, 왼쪽, 오른쪽)
+
+    def __init__(self, text, column_info):
+        self.text = str(text)
+        self.alphabet_to_index = {details['alphabet']: index for index, details in column_info.items()}
+        self.references = set()  # 수식이 참조하는 컬럼 인덱스
+        self.tokens = self.tokenize(self.text.lstrip('='))
+        self.position = 0
+        self.tree = self.parse_expression()
+        if self.position != len(self.tokens):
+            raise FormulaError(f"Unexpected token: {self.tokens[self.position][1]}")
+        del self.tokens
+
+    def tokenize(self, text):
+        tokens = []
+        for match in _TOKEN_PATTERN.finditer(text.rstrip()):
+            reference, number, symbol = match.groups()
+            if reference is not None:
+                # 행 번호는 무시하고 같은 row의 컬럼 값을 참조한다
+                letters = re.sub(r'[^A-Za-z]', '', reference).upper()
+                if letters not in self.alphabet_to_index:
+                    raise FormulaError(f"Unknown column: {letters}")
+                tokens.append(('ref', self.alphabet_to_index[letters]))
+            elif number is not None:
+                tokens.append(('num', number))
+            elif symbol in _OPERATORS or symbol in '()':
+                tokens.append(('op', symbol))
+            else:
+                raise FormulaError(f"Unsupported character: {symbol}")
+        return tokens
+
+    def peek(self):
+        if self.position < len(self.tokens):
+            return self.tokens[self.position]
+        return None, None
+
+    def parse_expression(self):
+        node = self.parse_term()
+        while self.peek() in (('op', '+'), ('op', '-')):
+            _, op = self.tokens[self.position]
+            self.position += 1
+            node = ('bin', op, node, self.parse_term())
+        return node
+
+    def parse_term(self):
+        node = self.parse_factor()
+        while self.peek() in (('op', '*'), ('op', '/')):
+            _, op = self.tokens[self.position]
+            self.position += 1
+            node = ('bin', op, node, self.parse_factor())
+        return node
+
+    def parse_factor(self):
+        kind, value = self.peek()
+        if kind is None:
+            raise FormulaError("Unexpected end of formula")
+        self.position += 1
+
+        if kind == 'num':
+            return 'num', float(value)
+        if kind == 'ref':
+            self.references.add(value)
+            return 'ref', value
+        if value == '-':
+            return 'neg', self.parse_factor()
+        if value == '+':
+            return self.parse_factor()
+        if value == '(':
+            node = self.parse_expression()
+            if self.peek() != ('op', ')'):
+                raise FormulaError("Missing closing parenthesis")
+            self.position += 1
+            return node
+        raise FormulaError(f"Unexpected token: {value}")
+
+    def evaluate(self, columns, row_count):
+        # columns: 컬럼 인덱스 -> float64 배열을 돌려주는 함수
+        # 결과는 소수점 1자리 반올림, 0으로 나누기 및 기타 오류가 난 셀은 0
+        # 숫자 컬럼과 같이 항상 float64 로 반환, 셀 편집으로 결과가 정수에서 소수가 되어도 같은 배열에 쓸 수 있다
+        # 정수 값은 반올림해도 그대로이므로 정수끼리의 연산 결과를 따로 구분하지 않는다
+        with np.errstate(all='ignore'):
+            values = np.broadcast_to(self.evaluate_node(self.tree, columns, row_count), (row_count,))
+            result = np.where(np.isfinite(values), round_half(values, 1), 0.0)
+        return result
+
+    def evaluate_node(self, node, columns, row_count):
+        kind = node[0]
+        if kind == 'num':
+            return np.float64(node[1])
+        if kind == 'ref':
+            return columns(node[1])
+        if kind == 'neg':
+            return -self.evaluate_node(node[1], columns, row_count)
+
+        _, op, left, right = node
+        left_values = self.evaluate_node(left, columns, row_count)
+        right_values = self.evaluate_node(right, columns, row_count)
+        if op == '+':
+            return left_values + right_values
+        if op == '-':
+            return left_values - right_values
+        if op == '*':
+            return left_values * right_values
+        # 0으로 나누는 셀은 NaN으로 표시하여 최종 결과에서 0이 되도록 한다
+        return np.where(right_values == 0, np.nan, left_values / right_values)
+
+
+def round_half(values, digits):
+    # Python round(값, digits) 와 같은 결과, np.round 는 값 x 10^digits 를 반올림하므로 1.05 처럼
+    # 10진수로 정확히 표현되지 않는 경계 값에서 결과가 다를 수 있다, 경계에 가까운 셀만 round 로 다시 계산
+    result = np.round(values, digits)
+    scaled = values * 10.0 ** digits
+    distance = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5)
+    near_half = np.flatnonzero(np.isfinite(values) & (distance <= np.abs(scaled) * 1e-12 + 1e-9))
+    for i in near_half.tolist():
+        result[i] = round(float(values[i]), digits)
+    return result
+
+
+def column_as_float(data, index):
+    # 수식 계산용 컬럼 배열, 숫자로 변환할 수 없는 값은 NaN
+    column = data.iloc[:, index]
+    if pd.api.types.is_numeric_dtype(column.dtype) and not pd.api.types.is_bool_dtype(column.dtype):
+        return column.to_numpy(dtype=np.float64)
+    return pd.to_numeric(column, errors='coerce').to_numpy(dtype=np.float64)
+
+
+def compile_formulas(column_info):
+    # 수식 컬럼별로 Formula 객체 생성, 해석할 수 없는 수식은 None (모든 셀이 0)
+    formulas = {}
+    for index, details in column_info.items():
+        if details['is_formula']:
+            try:
+                formulas[index] = Formula(details['formula'], column_info)
+            except FormulaError:
+                formulas[index] = None
+    return formulas
+
+
+def formula_order(formulas):
+    # 수식 컬럼 계산 순서 (위상 정렬), 다른 수식 컬럼을 참조하면 그 컬럼이 먼저 온다
+    # 순환 참조에 걸린 컬럼은 순서에서 빠지고 cyclic 으로 반환된다 (모든 셀이 0)
+    waiting = {index: {ref for ref in formula.references if ref in formulas} if formula is not None else set()
+               for index, formula in formulas.items()}
+    dependents = build_dependents(formulas)
+
+    order = []
+    ready = sorted(index for index, refs in waiting.items() if not refs)
+    while ready:
+        index = ready.pop(0)
+        order.append(index)
+        for dependent in sorted(dependents.get(index, ())):
+            refs = waiting[dependent]
+            refs.discard(index)
+            if not refs and dependent not in order and dependent not in ready:
+                ready.append(dependent)
+
+    cyclic = set(formulas) - set(order)
+    return order, cyclic
+
+
+def build_dependents(formulas):
+    # 컬럼 인덱스 -> 그 컬럼을 직접 참조하는 수식 컬럼 집합
+    dependents = defaultdict(set)
+    for index, formula in formulas.items():
+        if formula is not None:
+            for ref in formula.references:
+                dependents[ref].add(index)
+    return dict(dependents)
+
+
+def evaluate_formulas(data, formulas, progress=None):
+    # 모든 수식 컬럼을 컬럼 단위로 계산하여 {컬럼 인덱스: 결과 배열} 반환
+    # 수식 컬럼을 참조하는 수식은 참조 대상의 계산 결과(float64)를 그대로 사용한다
+    # progress('formulas', 완료한 컬럼 수, 전체 컬럼 수)
+    row_count = data.shape[0]
+    cache = {}
+    order, cyclic = formula_order(formulas)
+
+    results = {index: np.zeros(row_count) for index in cyclic}
+
+    def columns(index):
+        if index in results:
+            return results[index]
+        if index not in cache:
+            cache[index] = column_as_float(data, index)
+        return cache[index]
+
+    for index in order:
+        formula = formulas[index]
+        if formula is None:
+            results[index] = np.zeros(row_count)
+        else:
+            results[index] = formula.evaluate(columns, row_count)
+        if progress is not None:
+            progress('formulas', len(results), len(formulas))
+    return results
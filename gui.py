@@ -1,21 +1,28 @@
-import random
-import re
-
-import pandas as pd
-from PyQt5.QtCore import pyqtSignal, pyqtSlot, Qt, QEvent
-from PyQt5.QtGui import QFont, QColor
+# 창을 빨리 보여주기 위해 pandas, openpyxl, matplotlib 를 사용하는 모듈은 여기서 import 하지 않는다
+# 창이 처음 그려지면 백그라운드 스레드에서 미리 읽고(preload), 사용하는 메서드 안에서 import 한다
+# DataHandler 와 차트는 그 뒤 finish_startup() 에서 만들고, 그 전에는 데이터가 필요한 버튼을 비활성화한다
+import importlib
+import os
+
+import numpy as np
+from PyQt5.QtCore import pyqtSignal, pyqtSlot, Qt, QEvent, QTimer, QSettings
 from PyQt5.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QLabel, QHBoxLayout, QPushButton, \
-    QTableWidget, QTableWidgetItem, QFileDialog, QComboBox, QSplitter, QMessageBox, QAbstractItemView
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
+    QTableView, QFileDialog, QComboBox, QSplitter, QMessageBox, QAbstractItemView, QProgressDialog, QLineEdit
 
-from chart import ChartCanvas
-from common import debug_print, TEXT_COLUMN_LIST
-from data_handler import DataHandler
+import instrument
+from common import debug_print, TEXT_COLUMN_LIST, AUTOSAVE_INTERVAL_SEC, FILTER_DELAY_MS, CHART_BACKENDS, \
+    DEFAULT_CHART_BACKEND
+from journal import Journal
+from preload import start_preload
+from quadrant_panel import QuadrantPanel
+from quadrant_stats import QUADRANTS
+from table_model import DataFrameTableModel
 
 
 class MainWindow(QMainWindow):
     row_selected = pyqtSignal(int)
     row_deselected = pyqtSignal()
+    startup_finished = pyqtSignal()  # 미뤄둔 모듈을 읽고 DataHandler, 차트를 만든 뒤
 
     def __init__(self):
         super().__init__()
@@ -30,11 +37,41 @@ class MainWindow(QMainWindow):
         self.chart_data = None
         self.is_chart_ready = False
 
-        self.data_handler = DataHandler()
-        self.column_info = self.data_handler.get_column_info()
+        self.data_handler = None  # finish_startup() 에서 생성
+        self.column_info = {}
         self.colors = []  # annotation 배경 색상을 선택하고 저장하기 위한 리스트
         self.previous_selected_row = -1  # 테이블에서 이전 선택된 행의 인덱스를 추적하는 변수
 
+        # 백그라운드 로드 상태
+        self.load_thread = None
+        self.load_worker = None
+        self.load_progress = None
+        self.preview_handler = None
+
+        # 이미 읽은 시트는 메모리에 보관하여 시트 전환 시 다시 읽지 않는다
+        self.sheet_cache = None
+
+        # 시작 상태, 첫 화면을 그린 뒤 무거운 모듈을 백그라운드에서 읽는다
+        self.is_painted = False
+        self.preload_thread = None
+        self.preload_worker = None
+
+        # 편집 기록과 자동 저장 상태
+        self.settings = QSettings('quadrant-chart-tool', 'quadrant-chart-tool')
+        self.journal = None
+        self.replay_path = None  # 시작 시 복구하기로 한 파일, 로드가 끝나면 다시 묻지 않고 적용
+        self.replay_records = {}  # 시트 이름 -> 아직 적용하지 않은 편집 기록, 해당 시트를 읽을 때 적용
+        self.autosave_thread = None
+        self.autosave_worker = None
+        self.autosave_journal = None  # 자동 저장을 시작할 때의 편집 기록, 그 사이 다른 파일로 저장했으면 정리하지 않는다
+        self.workbook_parts = {}  # 파일 경로 -> 저장하면 사라지는 구성 요소, 자동 저장 전에 파일마다 한 번 확인
+
+        # 버전 비교 상태
+        self.compare_thread = None
+        self.compare_worker = None
+        self.compare_progress = None
+        self.compare_window = None
+
         self.central_widget = QWidget()
         self.setCentralWidget(self.central_widget)
         self.main_layout = QHBoxLayout(self.central_widget)
@@ -49,6 +86,12 @@ class MainWindow(QMainWindow):
         self.load_button.clicked.connect(self.load_data)
         self.button_layout.addWidget(self.load_button)
 
+        self.sheet_combo_box = QComboBox()
+        self.sheet_combo_box.setPlaceholderText('Select sheet')
+        self.sheet_combo_box.setEnabled(False)
+        self.sheet_combo_box.textActivated.connect(self.select_sheet)
+        self.button_layout.addWidget(self.sheet_combo_box)
+
         self.x_combo_box = QComboBox()
         self.x_combo_box.setPlaceholderText('Select X axis')
         self.button_layout.addWidget(self.x_combo_box)
@@ -65,6 +108,10 @@ class MainWindow(QMainWindow):
         self.swap_axes_button.clicked.connect(self.swap_axes)
         self.button_layout.addWidget(self.swap_axes_button)
 
+        self.compare_button = QPushButton('Compare Versions')
+        self.compare_button.clicked.connect(self.compare_versions)
+        self.button_layout.addWidget(self.compare_button)
+
         self.save_button = QPushButton('Save Changes')
         self.save_button.clicked.connect(self.save_changes)
         self.button_layout.addWidget(self.save_button)
@@ -72,11 +119,42 @@ class MainWindow(QMainWindow):
         # 버튼 레이아웃을 왼쪽 레이아웃의 상단에 추가
         self.left_layout.addLayout(self.button_layout)
 
-        # 데이터 테이블 레이아웃
-        self.table_widget = QTableWidget()
+        # 필터 레이아웃: Key/Summary 단어, 숫자 범위(예: Impact>=5), 사분면 조건에 맞는 row 만 테이블과 차트에 표시
+        self.filter_layout = QHBoxLayout()
+
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText('Filter: words in Key/Summary, conditions like Impact>=5')
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.textChanged.connect(lambda: self.filter_timer.start())
+        self.filter_layout.addWidget(self.filter_edit, 4)
+
+        self.quadrant_combo_box = QComboBox()
+        self.quadrant_combo_box.addItem('All quadrants', None)
+        for x_high, y_high in QUADRANTS:
+            self.quadrant_combo_box.addItem(f"{'High' if x_high else 'Low'} X / {'High' if y_high else 'Low'} Y",
+                                            (x_high, y_high))
+        self.quadrant_combo_box.currentIndexChanged.connect(self.apply_filter)
+        self.filter_layout.addWidget(self.quadrant_combo_box, 1)
+
+        self.filter_count_label = QLabel()
+        self.filter_layout.addWidget(self.filter_count_label)
+
+        self.left_layout.addLayout(self.filter_layout)
+
+        # 입력 중에는 마지막 입력 후 잠시 기다렸다가 한 번만 필터 적용
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DELAY_MS)
+        self.filter_timer.timeout.connect(self.apply_filter)
+        self.filter_mids = None  # 마지막으로 사분면 필터에 사용한 중앙선 위치
+
+        # 데이터 테이블 레이아웃, DataHandler 의 DataFrame 을 직접 보여주는 모델/뷰 구조
+        self.table_model = DataFrameTableModel(self.data_handler, self)
+        self.table_view = QTableView()
+        self.table_view.setModel(self.table_model)
 
         # 테이블 레이아웃을 왼쪽 레이아웃의 하단에 추가
-        self.left_layout.addWidget(self.table_widget)
+        self.left_layout.addWidget(self.table_view)
 
         # 차트 정보 레이아웃
         self.chartview_layout = QHBoxLayout()
@@ -89,28 +167,31 @@ class MainWindow(QMainWindow):
         # 차트 정보 레이아웃을 오른쪽 레이아웃의 상단에 추가
         self.right_layout.addWidget(h_widget)
 
-        # 차트 캔버스
-        self.chart_canvas = ChartCanvas(self)
-        self.chart_canvas.point_clicked.connect(self.highlight_selected_row)  # Signal 연결
-        self.chart_canvas.point_selected.connect(self.display_selected_point)  # Signal 연결
-        self.chart_canvas.point_dropped.connect(self.handle_point_drop)  # Signal 연결
+        # 사분면별 개수, 합계, 평균
+        self.quadrant_panel = QuadrantPanel()
+        self.right_layout.addWidget(self.quadrant_panel)
 
-        # 차트 툴바를 오른쪽 레이아웃에 추가
-        self.toolbar = NavigationToolbar(self.chart_canvas, self)
-        self.right_layout.addWidget(self.toolbar)
-
-        # 차트 캔버스를 오른쪽 레이아웃의 하단에 추가
-        self.right_layout.addWidget(self.chart_canvas, 8)
+        # 차트 캔버스와 툴바는 create_chart() 에서 만들어 이 자리에 넣는다
+        self.chart_canvas = None
+        self.toolbar = None
+        self.chart_placeholder = QLabel('Loading chart...')
+        self.chart_placeholder.setAlignment(Qt.AlignCenter)
+        self.right_layout.addWidget(self.chart_placeholder, 8)
 
         # 차트 정보 레이아웃에 Reverse Chart 버튼 추가
         self.reverse_x_axis_button = QPushButton('Reverse X Axis')
-        self.reverse_x_axis_button.clicked.connect(self.chart_canvas.reverse_x_axis)
         self.chartview_layout.addWidget(self.reverse_x_axis_button, 1)
 
         self.reverse_y_axis_button = QPushButton('Reverse Y Axis')
-        self.reverse_y_axis_button.clicked.connect(self.chart_canvas.reverse_y_axis)
         self.chartview_layout.addWidget(self.reverse_y_axis_button, 1)
 
+        # 차트 백엔드 선택, 바꾸면 현재 차트 상태를 유지한 채 캔버스를 교체
+        self.chart_backend_combo_box = QComboBox()
+        self.chart_backend_combo_box.addItems(CHART_BACKENDS)
+        self.chart_backend_combo_box.setCurrentText(self.chart_backend())
+        self.chart_backend_combo_box.currentTextChanged.connect(self.set_chart_backend)
+        self.chartview_layout.addWidget(self.chart_backend_combo_box, 1)
+
         # QSplitter를 사용하여 레이아웃 나누기
         self.splitter = QSplitter(Qt.Horizontal)
         left_widget = QWidget()
@@ -125,55 +206,577 @@ class MainWindow(QMainWindow):
         self.main_layout.addWidget(self.splitter)
 
         # 테이블에서 직접 값 변경 시 차트 갱신
-        self.table_widget.itemChanged.connect(self.on_item_changed)
+        self.table_model.cell_edited.connect(self.on_item_changed)
+        self.table_model.invalid_input.connect(self.on_invalid_input)
 
         # 테이블에서 특정 row 선택 시 차트에서 해당 annotation 크기를 늘려서 표시, 선택 해제 시 크기 원복
-        self.table_widget.selectionModel().selectionChanged.connect(self.on_selection_changed)
-        self.row_deselected.connect(self.chart_canvas.obscure_point)
-
-        self.row_selected.connect(self.chart_canvas.highlight_point)
+        self.table_view.selectionModel().selectionChanged.connect(self.on_selection_changed)
 
         self.installEventFilter(self)
-        self.table_widget.viewport().installEventFilter(self)
+        self.table_view.viewport().installEventFilter(self)
+
+        # 계측이 켜져 있으면 상태 표시줄에 차트 다시 그리기 fps 와 버려진(합쳐진) 요청 수를 표시
+        self.redraw_stats_label = QLabel()
+        self.statusBar().addPermanentWidget(self.redraw_stats_label)
+        self.redraw_stats_timer = QTimer(self)
+        self.redraw_stats_timer.timeout.connect(self.show_redraw_stats)
+        self.redraw_stats_timer.start(1000)
+
+        self.autosave_timer = QTimer(self)
+        self.autosave_timer.timeout.connect(self.autosave)
+        self.autosave_timer.start(AUTOSAVE_INTERVAL_SEC * 1000)
+
+        # DataHandler, 차트가 준비될 때까지 데이터가 필요한 동작을 막는다 (Load Data 는 누르면 바로 준비)
+        self.startup_widgets = (self.plot_button, self.swap_axes_button, self.compare_button, self.save_button,
+                                self.filter_edit, self.quadrant_combo_box, self.reverse_x_axis_button,
+                                self.reverse_y_axis_button, self.chart_backend_combo_box)
+        for widget in self.startup_widgets:
+            widget.setEnabled(False)
+
+    def paintEvent(self, event):
+        # 처음 그려진 직후 미뤄둔 모듈을 백그라운드에서 읽기 시작
+        super().paintEvent(event)
+        if not self.is_painted:
+            self.is_painted = True
+            instrument.startup_mark('first paint')
+            QTimer.singleShot(0, self.start_preload)
+
+    def start_preload(self):
+        if self.data_handler is not None or self.preload_worker is not None:
+            return
+        self.preload_thread, self.preload_worker = start_preload(self)
+        self.preload_worker.finished.connect(self.on_preload_finished)
 
-    def load_data(self):
+    @pyqtSlot()
+    def on_preload_finished(self):
+        self.preload_thread = None
+        self.preload_worker = None
+        self.finish_startup()
+
+    def finish_startup(self):
+        # DataHandler, 시트 캐시, 차트 생성, 백그라운드 import 가 끝나기 전에 호출되면 끝날 때까지 기다린다
+        if self.data_handler is not None:
+            return
+        from cache import SheetCache
+        from data_handler import DataHandler
+        instrument.startup_mark('modules loaded')
+
+        self.data_handler = DataHandler()
+        self.column_info = self.data_handler.get_column_info()
+        self.sheet_cache = SheetCache()
+        self.table_model.set_data_handler(self.data_handler)
+        self.create_chart()
+        for widget in self.startup_widgets:
+            widget.setEnabled(True)
+        instrument.startup_mark('chart ready')
+        self.startup_finished.emit()
+
+    def chart_backend(self):
+        backend = self.settings.value('chart_backend', DEFAULT_CHART_BACKEND)
+        return backend if backend in CHART_BACKENDS else DEFAULT_CHART_BACKEND
+
+    def create_chart(self):
+        # 설정된 백엔드로 차트 캔버스를 만든다
+        module_name, class_name = CHART_BACKENDS[self.chart_backend()]
+        canvas = getattr(importlib.import_module(module_name), class_name)(self)
+        canvas.point_clicked.connect(self.highlight_selected_row)  # Signal 연결
+        canvas.point_selected.connect(self.display_selected_point)  # Signal 연결
+        canvas.point_dropped.connect(self.handle_point_drop)  # Signal 연결
+        canvas.midline_moved.connect(self.quadrant_panel.set_midlines)
+        canvas.midline_moved.connect(self.refilter_quadrant)
+        canvas.plot_updated.connect(self.update_quadrant_panel)
+
+        # 자리 표시 위젯(또는 이전 백엔드의 툴바와 캔버스)을 새 툴바와 캔버스로 교체
+        if self.chart_canvas is not None:
+            self.reverse_x_axis_button.clicked.disconnect(self.chart_canvas.reverse_x_axis)
+            self.reverse_y_axis_button.clicked.disconnect(self.chart_canvas.reverse_y_axis)
+            self.row_deselected.disconnect(self.chart_canvas.obscure_point)
+            self.row_selected.disconnect(self.chart_canvas.highlight_point)
+        old_widgets = [widget for widget in (self.chart_placeholder, self.toolbar, self.chart_canvas)
+                       if widget is not None]
+        index = self.right_layout.indexOf(old_widgets[0])
+        for widget in old_widgets:
+            self.right_layout.removeWidget(widget)
+            widget.deleteLater()
+        self.chart_placeholder = None
+
+        self.chart_canvas = canvas
+        self.reverse_x_axis_button.clicked.connect(canvas.reverse_x_axis)
+        self.reverse_y_axis_button.clicked.connect(canvas.reverse_y_axis)
+        self.row_deselected.connect(canvas.obscure_point)
+        self.row_selected.connect(canvas.highlight_point)
+        self.toolbar = canvas.make_toolbar(self)
+        if self.toolbar is not None:
+            self.right_layout.insertWidget(index, self.toolbar)
+            index += 1
+        self.right_layout.insertWidget(index, canvas, 8)
 
-        file_path, _ = QFileDialog.getOpenFileName(self, 'Open File', '', 'Excel Files (*.xlsx)')
+    @pyqtSlot(str)
+    def set_chart_backend(self, backend):
+        # 선택한 백엔드를 저장하고 캔버스를 교체, 그려진 차트가 있으면 같은 데이터와 중앙선, 축 방향, 필터, 강조로 다시 그린다
+        self.settings.setValue('chart_backend', backend)
+        old = self.chart_canvas
+        if old is None:
+            return  # 시작 준비가 끝나면 저장된 백엔드로 만든다
+        self.create_chart()
+        canvas = self.chart_canvas
+        canvas.x_mid, canvas.y_mid = old.x_mid, old.y_mid
+        canvas.is_x_reversed, canvas.is_y_reversed = old.is_x_reversed, old.is_y_reversed
+        if self.is_chart_ready and old.data is not None:
+            canvas.set_point_filter(old.point_filter)
+            canvas.plot(old.data, old.x_label, old.y_label, self.colors, self.data_handler.key_index)
+            if old.highlighted_index is not None:
+                canvas.highlight_point(old.highlighted_index)
+
+    def update_quadrant_panel(self):
+        # 차트가 다시 그려지면 점 좌표와 중앙선 기준으로 사분면 통계 갱신
+        canvas = self.chart_canvas
+        if canvas.data is None:
+            self.quadrant_panel.clear()
+            return
+        self.quadrant_panel.set_axes(canvas.x_label, canvas.y_label, canvas.is_x_reversed, canvas.is_y_reversed)
+        x, y = canvas.point_values()
+        visible = canvas.visible_mask()
+        if visible is not None:
+            # 필터가 설정되어 있으면 보이는 점만 집계
+            x, y = x[visible], y[visible]
+        self.quadrant_panel.set_points(x, y)
+        self.quadrant_panel.set_midlines(canvas.x_mid, canvas.y_mid)
+
+    @pyqtSlot()
+    def apply_filter(self):
+        # 필터 조건에 맞는 row 만 테이블과 차트에 표시, 차트를 다시 그리거나 테이블을 다시 채우지 않는다
+        self.filter_timer.stop()
+        handler = self.data_handler
+        if handler.get_data() is None or self.load_worker is not None:
+            return
+
+        canvas = self.chart_canvas
+        quadrant = self.quadrant_combo_box.currentData()
+        points = None
+        if quadrant is not None and self.is_chart_ready and canvas.data is not None:
+            points = (*canvas.point_values(), canvas.x_mid, canvas.y_mid)
+        self.filter_mids = (canvas.x_mid, canvas.y_mid)
+
+        from point_filter import filter_mask
+        with instrument.span('filter'):
+            mask = filter_mask(handler, self.filter_edit.text(), quadrant, points)
+            self.table_model.set_visible_rows(None if mask is None else np.flatnonzero(mask))
+            if self.is_chart_ready:
+                canvas.set_point_filter(mask)
+                self.update_quadrant_panel()
+
+        total = handler.get_data().shape[0]
+        self.filter_count_label.setText('' if mask is None else f'{np.count_nonzero(mask)} / {total} rows')
+
+    @pyqtSlot(float, float)
+    def refilter_quadrant(self, x_mid, y_mid):
+        # 사분면 필터가 설정되어 있으면 중앙선을 놓았을 때 다시 적용, 드래그 중에는 차트의 중앙선 값이 바뀌지 않는다
+        if self.quadrant_combo_box.currentData() is None:
+            return
+        if (self.chart_canvas.x_mid, self.chart_canvas.y_mid) != self.filter_mids:
+            self.apply_filter()
+
+    def compare_versions(self):
+        # 같은 통합 문서의 여러 버전(파일 이름 순서)을 선택한 X, Y 축 기준으로 병렬 로드한 뒤 점 이동 경로를 재생
+        if self.compare_worker is not None or self.check_axes_selection() is False:
+            return
+        from data_handler import open_file_filter
+        from loader import start_compare
+        file_paths, _ = QFileDialog.getOpenFileNames(self, 'Select Versions', '', open_file_filter())
+        if len(file_paths) < 2:
+            return
+
+        self.compare_button.setEnabled(False)
+        self.compare_progress = QProgressDialog('Loading versions...', None, 0, len(file_paths), self)
+        self.compare_progress.setWindowTitle('Compare Versions')
+        self.compare_progress.setMinimumDuration(300)
+
+        self.compare_thread, self.compare_worker = start_compare(sorted(file_paths), self.x_column, self.y_column,
+                                                                 self.data_handler.sheet_name, self)
+        self.compare_worker.progress.connect(self.compare_progress.setValue)
+        self.compare_worker.finished.connect(self.on_compare_finished)
+        self.compare_worker.failed.connect(self.on_compare_failed)
+
+    def finish_compare(self):
+        self.compare_progress.close()
+        self.compare_progress = None
+        self.compare_thread = None
+        self.compare_worker = None
+        self.compare_button.setEnabled(True)
+
+    @pyqtSlot(object)
+    def on_compare_finished(self, timeline):
+        self.finish_compare()
+        from compare_window import CompareWindow
+        if self.compare_window is not None:
+            self.compare_window.close()
+        self.compare_window = CompareWindow(timeline, self.x_column, self.y_column, self)
+        self.compare_window.show()
+
+    @pyqtSlot(str)
+    def on_compare_failed(self, message):
+        self.finish_compare()
+        QMessageBox.critical(self, 'Error', f'Failed to compare versions: {message}')
+
+    def show_redraw_stats(self):
+        self.redraw_stats_label.setVisible(instrument.is_enabled())
+        if instrument.is_enabled() and self.chart_canvas is not None:
+            stats = self.chart_canvas.scheduler.stats()
+            self.redraw_stats_label.setText(f"Redraw: {stats['fps']} fps, {stats['frames']} frames, "
+                                            f"{stats['dropped']} dropped")
+
+    def load_data(self):
+        self.finish_startup()
+        from data_handler import open_file_filter
+        file_path, _ = QFileDialog.getOpenFileName(self, 'Open File', '', open_file_filter())
         if file_path:
-            self.table_widget.itemChanged.disconnect()  # 신호 연결 해제
-            self.data_handler.load_data(file_path)
-            self.display_data()
-            self.populate_combo_boxes()
-            self.generate_colors()
-            self.chart_canvas.initialize(is_swap=False)
-            self.table_widget.itemChanged.connect(self.on_item_changed)  # 신호 다시 연결
+            self.start_loading(file_path)
+
+    @pyqtSlot(str)
+    def select_sheet(self, sheet_name):
+        # 시트 전환, 이미 읽은 시트는 보관된 상태로 바로 바꾸고 처음 선택한 시트만 읽는다
+        if self.load_worker is not None or sheet_name == self.data_handler.sheet_name:
+            return
+        self.store_sheet_state()
+        state = self.sheet_cache.get(sheet_name)
+        if state is not None:
+            self.restore_sheet_state(state)
+        else:
+            self.start_loading(self.data_handler.file_path, sheet_name)
+
+    def store_sheet_state(self):
+        # 현재 시트의 데이터(편집 내용 포함), 중앙선 위치, 색상, 축 선택을 보관
+        from data_handler import DataHandler
+        if self.data_handler.get_data() is None:
+            return
+        handler = DataHandler()
+        handler.replace_with(self.data_handler)
+        self.sheet_cache.put(handler.sheet_name, {
+            'handler': handler,
+            'colors': self.colors,
+            'x_mid': self.chart_canvas.x_mid,
+            'y_mid': self.chart_canvas.y_mid,
+            'x_column': self.x_combo_box.currentText(),
+            'y_column': self.y_combo_box.currentText(),
+            'is_chart_ready': self.is_chart_ready
+        })
+
+    def restore_sheet_state(self, state):
+        self.data_handler.replace_with(state['handler'])
+        self.table_model.set_data_handler(self.data_handler)
+        self.display_data()
+        self.populate_combo_boxes()
+        self.colors = state['colors']
+        self.clear_chart()
+        self.x_combo_box.setCurrentText(state['x_column'])
+        self.y_combo_box.setCurrentText(state['y_column'])
+        self.chart_canvas.x_mid = state['x_mid']
+        self.chart_canvas.y_mid = state['y_mid']
+        if state['is_chart_ready']:
+            self.plot_chart()
+        else:
+            self.apply_filter()
+        self.show_sheet_names()
+
+    def show_sheet_names(self, sheet_names=None):
+        # sheet_names 가 주어지면 목록을 새로 채우고, 현재 시트를 선택 상태로 표시
+        self.sheet_combo_box.blockSignals(True)
+        if sheet_names is not None:
+            self.sheet_combo_box.clear()
+            self.sheet_combo_box.addItems(sheet_names)
+        self.sheet_combo_box.setCurrentText(self.data_handler.sheet_name or '')
+        self.sheet_combo_box.setEnabled(self.sheet_combo_box.count() > 1)
+        self.sheet_combo_box.blockSignals(False)
+
+    def clear_chart(self):
+        # 이전 시트(파일)의 차트를 지운다
+        self.is_chart_ready = False
+        self.chart_canvas.initialize(is_swap=False)
+        self.chart_canvas.update_plot(False)
+
+    def start_loading(self, file_path, sheet_name=None):
+        # 워커 스레드에서 파싱과 수식 계산을 수행, 완료될 때까지 기존 데이터는 그대로 유지
+        if self.load_worker is not None:
+            return
+        self.finish_startup()
+        from loader import start_load
+
+        self.set_loading(True)
+        self.load_progress = QProgressDialog('Loading...', 'Cancel', 0, 0, self)
+        self.load_progress.setWindowTitle('Load Data')
+        self.load_progress.setMinimumDuration(300)
+        self.load_progress.canceled.connect(self.cancel_loading)
+
+        self.load_thread, self.load_worker = start_load(file_path, self, sheet_name)
+        self.load_worker.progress.connect(self.on_load_progress)
+        self.load_worker.preview_ready.connect(self.on_load_preview)
+        self.load_worker.finished.connect(self.on_load_finished)
+        self.load_worker.failed.connect(self.on_load_failed)
+        self.load_worker.cancelled.connect(self.on_load_cancelled)
+
+    def cancel_loading(self):
+        if self.load_worker is not None:
+            self.load_worker.cancel()
+
+    def set_loading(self, loading):
+        # 로드 중에는 데이터를 바꾸는 동작과 차트 조작을 막는다
+        for widget in (self.load_button, self.sheet_combo_box, self.plot_button, self.swap_axes_button, self.save_button,
+                       self.filter_edit, self.quadrant_combo_box, self.chart_backend_combo_box, self.chart_canvas):
+            widget.setEnabled(not loading)
+
+    @pyqtSlot(str, int, int)
+    def on_load_progress(self, stage, done, total):
+        if self.load_progress is None:
+            return
+        if stage == 'rows':
+            self.load_progress.setLabelText(f'Parsing rows: {done}' + (f' / {total}' if total else ''))
+        else:
+            self.load_progress.setLabelText(f'Evaluating formulas: {done} / {total}')
+        self.load_progress.setMaximum(total)
+        self.load_progress.setValue(done)
+
+    @pyqtSlot(object)
+    def on_load_preview(self, frame):
+        # 첫 chunk 를 먼저 테이블에 보여준다 (읽기 전용)
+        from data_handler import DataHandler
+        self.preview_handler = DataHandler()
+        self.preview_handler.set_data(frame)
+        self.preview_handler.calculate_formulas()
+        self.table_model.set_data_handler(self.preview_handler, read_only=True)
+
+    @pyqtSlot(object)
+    def on_load_finished(self, handler):
+        # 다른 파일을 열었으면 보관된 시트를 버리고 시트 목록을 새로 읽는다
+        from data_handler import list_sheets
+        new_file = handler.file_path != self.data_handler.file_path
+        if new_file:
+            self.sheet_cache.clear()
+            self.open_journal(handler.file_path)
+        self.data_handler.replace_with(handler)
+        self.table_model.set_data_handler(self.data_handler)
+        self.display_data()
+        self.populate_combo_boxes()
+        self.generate_colors()
+        self.clear_chart()
+        self.finish_loading()
+        self.apply_filter()
+        self.show_sheet_names(list_sheets(handler.file_path) if new_file else None)
+        self.replay_journal()
+
+    def offer_recovery(self):
+        # 시작 시 마지막으로 연 파일에 저장되지 않은 편집 기록이 남아 있으면 복구 여부를 묻고 파일을 연다
+        file_path = self.settings.value('last_workbook', '')
+        if not file_path or not os.path.exists(file_path) or not Journal(file_path).has_records():
+            return
+        answer = QMessageBox.question(self, 'Recover Edits',
+                                      f'Unsaved edits from a previous session were found for\n{file_path}\n\n'
+                                      f'Open the file and replay them?', QMessageBox.Yes | QMessageBox.No)
+        if answer == QMessageBox.Yes:
+            self.replay_path = file_path
+            self.start_loading(file_path)
+
+    def open_journal(self, file_path):
+        # 새 파일의 편집 기록을 연다, 이전 세션의 기록이 남아 있으면 적용할지 묻는다
+        if self.journal is not None:
+            self.journal.close()
+        self.settings.setValue('last_workbook', file_path)
+        self.journal = Journal(file_path)
+        self.data_handler.journal = self.journal
+        self.replay_records = {}
+
+        records = self.journal.records()
+        if not records:
+            return
+        if self.replay_path != file_path:
+            answer = QMessageBox.question(self, 'Recover Edits',
+                                          f'{len(records)} unsaved edits from a previous session were found. '
+                                          f'Replay them?', QMessageBox.Yes | QMessageBox.No)
+            if answer != QMessageBox.Yes:
+                self.journal.discard()
+                return
+        self.replay_path = None
+        for record in records:
+            self.replay_records.setdefault(record['sheet'], []).append(record)
+
+    def replay_journal(self):
+        # 현재 시트에 해당하는 편집 기록을 다시 적용, 이미 기록에 있는 편집이므로 다시 기록하지 않는다
+        records = self.replay_records.pop(self.data_handler.sheet_name, [])
+        if not records:
+            return
+        data = self.data_handler.get_data()
+        self.data_handler.journal = None
+        try:
+            for record in records:
+                row = self.data_handler.get_row(record['key'])
+                if row is None or record['column'] not in data.columns:
+                    debug_print(f"replay skipped: {record}")
+                    continue
+                self.table_model.set_edited_value(row, data.columns.get_loc(record['column']), record['new'])
+        finally:
+            self.data_handler.journal = self.journal
+        debug_print(f"replayed {len(records)} edits on {self.data_handler.sheet_name}")
+
+    def autosave(self):
+        # 편집 기록이 있으면 변경 셀 값의 사본을 만들어 워커 스레드에서 원본 파일에 반영
+        if self.journal is None or self.autosave_worker is not None or self.load_worker is not None:
+            return
+        if not self.journal.has_records() or self.replay_records:
+            return
+        file_path = self.data_handler.file_path
+        if not file_path or not file_path.lower().endswith('.xlsx') or not os.path.exists(file_path):
+            return
+        if self.lossy_parts(file_path, warn=True):
+            return
+
+        patches = {handler.sheet_name: handler.dirty_values() for handler in self.workbook_handlers()
+                   if handler.dirty_cells}
+        if not patches:
+            # 편집했던 값이 모두 원래대로 돌아간 경우
+            self.journal.compact(self.journal.seq)
+            return
+
+        from autosave import start_autosave
+        self.autosave_journal = self.journal
+        self.autosave_thread, self.autosave_worker = start_autosave(file_path, patches, self.journal.seq, self)
+        self.autosave_worker.finished.connect(self.on_autosave_finished)
+        self.autosave_worker.failed.connect(self.on_autosave_failed)
+
+    def lossy_parts(self, file_path, warn=False):
+        # openpyxl 로 다시 저장하면 사라지는 구성 요소(차트, 이미지 등), 있으면 자동 저장하지 않고 처음 한 번 알린다
+        # 편집은 기록(journal)에 남아 있으므로 직접 저장하거나 다음 실행 때 복구할 수 있다
+        if file_path not in self.workbook_parts:
+            from data_handler import unsupported_parts
+            self.workbook_parts[file_path] = unsupported_parts(file_path)
+            if self.workbook_parts[file_path] and warn:
+                QMessageBox.warning(self, 'Autosave Disabled',
+                                    f'{os.path.basename(file_path)} contains content that saving would remove '
+                                    f'({", ".join(self.workbook_parts[file_path])}).\n\n'
+                                    f'Autosave is off for this file. Edits are kept in the recovery journal.')
+        return self.workbook_parts[file_path]
+
+    def workbook_handlers(self):
+        # 현재 시트와 보관 중인 같은 파일의 다른 시트
+        handlers = [self.data_handler]
+        for state in self.sheet_cache.values():
+            handler = state['handler']
+            if handler.sheet_name != self.data_handler.sheet_name and handler.file_path == self.data_handler.file_path:
+                handlers.append(handler)
+        return handlers
+
+    @pyqtSlot(int, object)
+    def on_autosave_finished(self, seq, patches):
+        # 저장 중에 다시 바뀌지 않은 셀만 변경 목록에서 제거하고, 반영된 편집 기록을 정리한다
+        for handler in self.workbook_handlers():
+            for row, col, value in patches.get(handler.sheet_name, []):
+                current = handler.get_data().iat[row, col]
+                if (row, col) in handler.dirty_cells and current == value:
+                    handler.dirty_cells.discard((row, col))
+        if self.journal is not None and self.journal is self.autosave_journal:
+            self.journal.compact(seq)
+        self.autosave_thread = None
+        self.autosave_worker = None
+        self.autosave_journal = None
+        debug_print(f"autosave -> {sum(len(values) for values in patches.values())} cells")
+
+    @pyqtSlot(str)
+    def on_autosave_failed(self, message):
+        # 파일이 다른 프로그램에서 열려 있는 등의 경우, 편집 기록은 그대로 두고 다음 주기에 다시 시도
+        debug_print(f"autosave failed: {message}")
+        self.statusBar().showMessage(f'Autosave failed: {message}')
+        self.autosave_thread = None
+        self.autosave_worker = None
+        self.autosave_journal = None
+
+    def closeEvent(self, event):
+        # 진행 중인 자동 저장이 끝날 때까지 기다린다, 저장되지 않은 편집은 기록에 남아 다음 실행 때 복구할 수 있다
+        self.autosave_timer.stop()
+        if self.autosave_thread is not None:
+            self.autosave_thread.wait()
+        if self.preload_thread is not None:
+            self.preload_thread.wait()
+        if self.journal is not None:
+            self.journal.close()
+        super().closeEvent(event)
+
+    @pyqtSlot(str)
+    def on_load_failed(self, message):
+        self.finish_loading()
+        QMessageBox.critical(self, 'Error', f'Failed to load file: {message}')
+
+    @pyqtSlot()
+    def on_load_cancelled(self):
+        self.finish_loading()
+
+    def finish_loading(self):
+        # 미리보기를 보여주고 있었다면 기존 데이터로 되돌리고 로드 상태 정리
+        if self.table_model.data_handler is not self.data_handler:
+            self.table_model.set_data_handler(self.data_handler)
+        self.preview_handler = None
+        if self.load_progress is not None:
+            self.load_progress.canceled.disconnect(self.cancel_loading)
+            self.load_progress.close()
+            self.load_progress = None
+        self.load_thread = None
+        self.load_worker = None
+        self.set_loading(False)
+        self.show_sheet_names()  # 시트 전환이 취소되거나 실패하면 현재 시트로 되돌린다
 
     def plot_chart(self):
 
-        # 현재 테이블에 노출되는 데이터를 업데이트하여 저장한다
-        if self.get_table_data() is not None:
-            self.table_widget.itemChanged.disconnect()  # 신호 연결 해제
-            self.update_data_from_gui()
-            self.reset_table_style()
-            self.table_widget.itemChanged.connect(self.on_item_changed)  # 신호 다시 연결
+        # 테이블 편집 값은 이미 DataHandler 에 저장되어 있으므로 강조 표시만 초기화한다
+        self.reset_table_style()
 
         # X, Y축 선택 여부를 체크하고 축 정보를 저장한다
         if self.check_axes_selection() is False:
             return
 
-        # GUI 테이블로부터 데이터 가져와서 차트 그리기
-        chart_data = self.get_table_data()[[self.x_column, self.y_column, 'Key', 'Summary']]
+        # 테이블 데이터로부터 차트에 필요한 컬럼만 가져와서 차트 그리기
+        if self.data_handler.get_data() is None:
+            return
+        chart_data = self.get_table_data([self.x_column, self.y_column, 'Key', 'Summary'])
         if chart_data is not None:
             debug_print("================== plot chart > chart data =======================")
             debug_print(chart_data)
             debug_print("================== plot chart > chart data =======================")
-            self.chart_canvas.plot(chart_data, self.x_column, self.y_column, self.colors)
+            self.chart_canvas.plot(chart_data, self.x_column, self.y_column, self.colors,
+                                   self.data_handler.key_index)
             self.is_chart_ready = True
+            self.apply_filter()
 
     def save_changes(self):
         file_path, _ = QFileDialog.getSaveFileName(self, 'Save File', '', 'Excel Files (*.xlsx)')
         if file_path:
-            self.data_handler.save_data(file_path)
+            # 원본의 차트, 이미지 등은 저장한 파일에 남지 않으므로 계속할지 묻는다
+            source_path = self.data_handler.file_path
+            parts = self.lossy_parts(source_path) if source_path and source_path.lower().endswith('.xlsx') \
+                and os.path.exists(source_path) else []
+            if parts:
+                answer = QMessageBox.question(self, 'Save File',
+                                              f'The saved file will not contain {", ".join(parts)} '
+                                              f'from {os.path.basename(source_path)}. Save anyway?',
+                                              QMessageBox.Yes | QMessageBox.No)
+                if answer != QMessageBox.Yes:
+                    return
+            # 진행 중인 자동 저장이 끝난 뒤 저장
+            if self.autosave_thread is not None:
+                self.autosave_thread.wait()
+            # 보관 중인 다른 시트의 편집 내용도 함께 저장
+            other_sheets = [state['handler'] for state in self.sheet_cache.values()
+                            if state['handler'].sheet_name != self.data_handler.sheet_name]
+            try:
+                self.data_handler.save_data(file_path, other_sheets)
+            except (OSError, ValueError) as e:
+                QMessageBox.critical(self, 'Error', f'Failed to save file: {e}')
+                return
+            self.workbook_parts.pop(file_path, None)
+
+            # 모든 편집이 저장되었으므로 기록을 비우고, 이후 편집은 저장한 파일 기준으로 기록
+            if self.journal is not None:
+                self.journal.discard()
+            self.journal = Journal(file_path)
+            self.data_handler.journal = self.journal
+            self.settings.setValue('last_workbook', file_path)
 
     def populate_combo_boxes(self):
         data = self.data_handler.get_data()
@@ -210,7 +813,7 @@ class MainWindow(QMainWindow):
             return False
 
         # 선택된 X, Y축의 인덱스 값을 저장한다
-        header = self.table_widget.horizontalHeader()
+        header = self.table_view.horizontalHeader()
         model = header.model()
         column_count = header.count()
 
@@ -232,69 +835,22 @@ class MainWindow(QMainWindow):
             f"check_axes_selection -> x_column_index: {self.x_column_index}, y_column_index: {self.y_column_index}")
         return True
 
+    @instrument.traced('table.fill')
     def display_data(self):
         # 데이터를 테이블에 표시한다, 값은 그대로, 수식은 계산하여 값만
-        data = self.data_handler.get_data()
-        self.table_widget.setRowCount(data.shape[0])
-        self.table_widget.setColumnCount(data.shape[1])
-        self.table_widget.setHorizontalHeaderLabels(data.columns)
-
-        # 추가 계산이 필요한 수식 컬럼을 먼저 조사
-        column_info = self.data_handler.get_column_info()
-        true_formula_indices = [index for index, details in column_info.items() if details['is_formula']]
-        debug_print(true_formula_indices)
-
-        # 수식을 계산해서 숫자 값으로 변환
-        for i in range(data.shape[0]):
-            for j in range(data.shape[1]):
-                if j in true_formula_indices:
-                    calculated_value = self.calculate_formula(i, j)
-                    self.table_widget.setItem(i, j, QTableWidgetItem(str(calculated_value)))
-                else:
-                    self.table_widget.setItem(i, j, QTableWidgetItem(str(data.iat[i, j])))
+        # 셀 문자열은 모델이 화면에 보이는 셀에 대해서만 만든다
+        formula_values = self.data_handler.get_formula_values()
+        if not formula_values:
+            formula_values = self.data_handler.calculate_formulas()
+        debug_print(list(formula_values))
+        self.table_model.reset()
 
     def calculate_formula(self, row, col):
-        # String 형태의 수식을 계산식으로 치환하여 값 계산
-        data = self.data_handler.get_data()
-        formula = self.column_info[col]['formula']
-        formula = formula.lstrip('=')
-        formula = re.sub(r'\d+', '', formula)
-
-        # 변수에 대응하는 값을 저장할 딕셔너리
-        variables = {}
-
-        for char in formula:
-            if char.isalpha():  # 알파벳인지 확인
-                if char not in variables:  # 이미 입력받은 변수는 건너뜀
-                    index_by_alphabet = None
-                    for index, details in self.column_info.items():
-                        if details.get('alphabet') == char:
-                            index_by_alphabet = index
-                            break
-
-                    value = data.iat[row, index_by_alphabet]
-                    variables[char] = value
-
-        # 변수 대입 및 계산
-        for var, value in variables.items():
-            formula = formula.replace(var, str(value))
-
-        try:
-            # 계산 수행
-            result = eval(formula)
-            rounded_result = round(result, 1)
-        except ZeroDivisionError:
-            # 수식 오류 처리 (1)
-            debug_print("Error: Division by zero")
-            rounded_result = 0
-        except Exception as e:
-            # 수식 오류 처리 (2)
-            debug_print(f"Error: {e}")
-            rounded_result = 0
-
-        # 결과 출력
-        debug_print(f"수식 계산 결과: {rounded_result}")
-        return rounded_result
+        # 수식 컬럼의 계산 결과 중 해당 셀 값을 반환 (계산은 DataHandler.calculate_formulas 에서 컬럼 단위로 수행)
+        formula_values = self.data_handler.get_formula_values()
+        if col not in formula_values:
+            formula_values = self.data_handler.calculate_formulas()
+        return formula_values[col][row]
 
     @pyqtSlot(dict)
     def display_selected_point(self, point):
@@ -311,163 +867,67 @@ class MainWindow(QMainWindow):
         self.selected_point_label.setText(info)
 
     def update_row_by_key(self, key_to_update, new_x_value, new_y_value):
-        # 차트 이동에 의해 변경된 컬럼 값을 셀 스타일을 변경하여 표시
-        for row in range(self.table_widget.rowCount()):
-            item = self.table_widget.item(row, 0)
-            if item is not None and item.text() == key_to_update:
-                debug_print(f"row: {row}, x_column_index: {self.x_column_index}, y_column_index: {self.y_column_index}")
-                # 보여지는 테이블 데이터 변경 X
-                self.table_widget.item(row, self.x_column_index).setText(str(new_x_value))
-                self.table_widget.item(row, self.x_column_index).setBackground(Qt.yellow)
-                font = self.table_widget.item(row, self.x_column_index).font()
-                font.setItalic(True)
-                self.table_widget.item(row, self.x_column_index).setForeground(Qt.darkBlue)
-                self.table_widget.item(row, self.x_column_index).setFont(font)
-                # 보여지는 테이블 데이터 변경 Y
-                self.table_widget.item(row, self.y_column_index).setText(str(new_y_value))
-                self.table_widget.item(row, self.y_column_index).setBackground(Qt.yellow)
-                font = self.table_widget.item(row, self.y_column_index).font()
-                font.setItalic(True)
-                self.table_widget.item(row, self.y_column_index).setForeground(Qt.darkBlue)
-                self.table_widget.item(row, self.y_column_index).setFont(font)
-
-                break
-
-    def update_data_from_gui(self):
-        # GUI 테이블에서 변경된 값을 DataFrame에 저장
-        # 수식이 없는 컬럼은 값을 그대로 저장하고
-        # 수식이 있는 컬럼은 저장 없이 계산만 하여 보여준다
+        # 차트 이동에 의해 변경된 컬럼 값을 저장하고 셀 스타일을 변경하여 표시
+        row = self.data_handler.get_row(key_to_update)
+        if row is None:
+            return
 
-        # 저장할 DataFrame 가져오기
-        data = self.data_handler.get_data()
+        debug_print(f"row: {row}, x_column_index: {self.x_column_index}, y_column_index: {self.y_column_index}")
+        self.table_model.set_edited_value(row, self.x_column_index, new_x_value)
+        self.table_model.set_edited_value(row, self.y_column_index, new_y_value)
 
-        # 추가 계산이 필요한 컬럼을 먼저 조사
-        column_info = self.data_handler.get_column_info()
-        true_formula_indices = [index for index, details in column_info.items() if details['is_formula']]
-
-        # 결과 출력
-        debug_print("========================== update_data from gui =============================")
-        debug_print(data)
-        debug_print("========================== update_data from gui =============================")
-
-        # 수식을 계산해서 숫자 값으로 변환
-        for i in range(data.shape[0]):
-            for j in range(data.shape[1]):
-                if j in true_formula_indices:
-                    calculated_value = self.calculate_formula(i, j)
-                    self.table_widget.setItem(i, j, QTableWidgetItem(str(calculated_value)))
-                else:
-                    cell_value = self.table_widget.item(i, j).text()
-                    if cell_value is None:
-                        cell_value = ''  # None을 빈 문자열로 대체
-                    data.iat[i, j] = cell_value
-
-    def get_table_data(self):
-        # 테이블의 값을 기준으로 차트를 그릴 DataFrame 생성 (엑셀에서 읽어온 DataFrame과는 별도)
-        rows = self.table_widget.rowCount()
-        cols = self.table_widget.columnCount()
-        data = []
-
-        headers = [self.table_widget.horizontalHeaderItem(j).text() for j in range(cols)]
-
-        for i in range(rows):
-            row_data = []
-            for j in range(cols):
-                item = self.table_widget.item(i, j)
-                row_data.append(item.text() if item else '')
-            data.append(row_data)
+    def get_table_data(self, columns=None):
+        # 테이블에 보이는 값(수식은 계산 결과)으로 차트를 그릴 DataFrame 생성 (DataHandler 의 배열을 복사하지 않고 참조)
+        df = self.data_handler.get_table_data(columns)
 
         debug_print("================== get table data =======================")
-        debug_print(data)
+        debug_print(df)
         debug_print("================== get table data =======================")
-        df = pd.DataFrame(data, columns=headers)
-        df.index = range(1, len(df) + 1)
-
         return df
 
     @pyqtSlot(str, float, float)
     def handle_point_drop(self, key, x, y):
-        self.table_widget.itemChanged.disconnect()  # 신호 연결 해제
-
         debug_print(f"Point dropped: Key={key}, X={x}, Y={y}")
         self.update_row_by_key(key, x, y)
 
-        self.table_widget.itemChanged.connect(self.on_item_changed)  # 신호 다시 연결
-
     @pyqtSlot(str)
     def highlight_selected_row(self, key):
-        self.table_widget.itemChanged.disconnect()  # 신호 연결 해제
+        row = self.data_handler.get_row(key)
+        if row is None:
+            return
 
-        # key = point['Key']
-        data = self.data_handler.get_data()
-        row = data.index[data['Key'] == key].tolist()[0] - 1
-
-        # 이전 선택된 행이 있고, 그 행이 현재 행과 다르면 원래 상태로 되돌림
-        if self.previous_selected_row != -1 and self.previous_selected_row != row:
-            for col in range(self.table_widget.columnCount()):
-                item = self.table_widget.item(self.previous_selected_row, col)
-                if item.background().color() != QColor(Qt.yellow):
-                    item.setBackground(QColor(Qt.white))
-
-        # 현재 선택된 행을 강조
-        for col in range(self.table_widget.columnCount()):
-            item = self.table_widget.item(row, col)
-            if item.background().color() != QColor(Qt.yellow):
-                item.setBackground(Qt.green)
-            # self.table_widget.item(row, col).setBackground(Qt.green)
-
-        # 선택된 행이 보이도록 스크롤
-        # 1. 최초 버전
-        # self.table_widget.scrollToItem(self.table_widget.item(row, 0), QAbstractItemView.PositionAtCenter)
-        # 2. MAC에서만 이상 동작
-        # self.table_widget.verticalScrollBar().setValue(row)
-        # 3. 타이머
-        # QTimer.singleShot(50, lambda: self.scroll_to_row(row))
-        # 4. 최초 버전 + 축으로 선택된 컬럼이 보이도록 이동
-        self.table_widget.scrollToItem(self.table_widget.item(row, min(self.x_column_index, self.y_column_index)),
-                                       QAbstractItemView.PositionAtCenter)
+        # 이전 선택된 행은 원래 상태로 되돌리고 현재 선택된 행을 강조 (차트 이동으로 변경된 셀은 그대로 유지)
+        self.table_model.set_highlighted_row(row)
 
-        self.previous_selected_row = row
+        # 선택된 행이 보이도록 스크롤, 축으로 선택된 컬럼이 보이도록 이동 (필터로 숨겨진 행이면 이동하지 않음)
+        view_row = self.table_model.view_row(row)
+        if view_row >= 0:
+            self.table_view.scrollTo(self.table_model.index(view_row, min(self.x_column_index, self.y_column_index)),
+                                     QAbstractItemView.PositionAtCenter)
 
-        self.table_widget.itemChanged.connect(self.on_item_changed)  # 신호 다시 연결
+        self.previous_selected_row = row
 
     def reset_table_style(self):
         # 테이블에 적용된 스타일을 모두 제거하고 기본 폰트 및 색상 설정
-        default_font = QFont()
-        default_background = QColor(Qt.white)
-        default_foreground = QColor(Qt.black)
-
-        for row in range(self.table_widget.rowCount()):
-            for column in range(self.table_widget.columnCount()):
-                item = self.table_widget.item(row, column)
-                if item:
-                    item.setBackground(default_background)
-                    item.setForeground(default_foreground)
-                    item.setFont(default_font)
-
-    def on_item_changed(self, item):
+        self.table_model.clear_styles()
+        self.previous_selected_row = -1
+
+    def on_item_changed(self, row, column):
         # 테이블 셀 값이 변경되었을 경우 차트를 업데이트 한다
 
         # 차트가 그려지기 전이면 동작 안함
         if not self.is_chart_ready:
             return
 
-        # 현재 수정된 셀의 컬럼 이름을 가져오기
-        col_name = self.column_info[item.column()]['name']
+        # 변경된 셀과 그 셀에 의존하는 수식 셀 중 차트에 표시되는 값이 있을 때만 해당 점을 갱신
+        affected = {column, *self.data_handler.dependent_columns(column)}
+        chart_columns = {self.x_column_index, self.y_column_index, self.data_handler.key_column()}
+        if self.data_handler.get_data().columns[column] == 'Summary' or affected & chart_columns:
+            self.chart_canvas.update_point(row)
 
-        # 숫자만 입력받는 컬럼인지 확인
-        if col_name not in TEXT_COLUMN_LIST:
-            # 셀의 값을 가져오고 숫자인지 확인
-            try:
-                float(item.text())
-            except ValueError:
-                QMessageBox.warning(self, "Invalid Input", "Please enter a valid number.")
-                item.setText("0")  # 입력값 0 처리
-                return
-
-        # X, Y축이 선택되어 있다면 차트를 업데이트
-        if self.x_column and self.y_column:
-            self.plot_chart()
+    def on_invalid_input(self, row, column):
+        # 숫자 컬럼에 숫자가 아닌 값이 입력되면 경고 (입력값은 0 처리됨)
+        QMessageBox.warning(self, "Invalid Input", "Please enter a valid number.")
 
     def on_selection_changed(self, selected, deselected):
         # 테이블 셀 선택/선택 해제 이벤트 발생 시 차트를 업데이트 한다
@@ -480,7 +940,7 @@ class MainWindow(QMainWindow):
         deselected_indexes = deselected.indexes()
 
         if selected_indexes:
-            row = selected_indexes[0].row()
+            row = self.table_model.source_row(selected_indexes[0].row())
             self.row_selected.emit(row)
         elif deselected_indexes:
             self.row_deselected.emit()
@@ -488,21 +948,17 @@ class MainWindow(QMainWindow):
     def eventFilter(self, source, event):
         # 마우스 이벤트 감지, 테이블 바깥 영역에서 클릭 발생 시 테이블 셀 선택 해제
         if event.type() == QEvent.MouseButtonPress:
-            if source == self and not self.table_widget.underMouse():
+            if source == self and not self.table_view.underMouse():
                 # 테이블 바깥을 클릭한 경우
-                self.table_widget.clearSelection()
+                self.table_view.clearSelection()
                 self.row_deselected.emit()
-            elif source == self.table_widget.viewport():
+            elif source == self.table_view.viewport():
                 # 테이블 셀을 클릭한 경우
-                selected_items = self.table_widget.selectedItems()
-                if not selected_items:
+                if not self.table_view.selectionModel().hasSelection():
                     self.row_deselected.emit()
         return super(MainWindow, self).eventFilter(source, event)
 
     def generate_colors(self):
+        from quadrant import generate_colors
         if self.data_handler is not None:
-            self.colors = [self.random_color() for _ in range(self.data_handler.get_data().shape[0])]
-
-    def random_color(self):
-        r = lambda: random.randint(0, 255)
-        return f'#{r():02x}{r():02x}{r():02x}'
+            self.colors = generate_colors(self.data_handler.get_data().shape[0])
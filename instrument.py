@@ -0,0 +1,250 @@
+# 가벼운 성능 계측: 이름 붙인 구간(span) 시간 히스토그램과 카운터, Chrome trace 파일 저장
+# QCT_TRACE=1 환경 변수 또는 enable() 로 켠다, 꺼져 있으면 span() 은 아무 일도 하지 않는 객체를 반환한다
+# QCT_TRACE_FILE=<path> 를 지정하면 종료 시 trace 파일(chrome://tracing, Perfetto 에서 열기)을 저장
+# 사용법:
+#     with instrument.span('load', file=path):
+#         ...
+#     instrument.count('chart.draws')
+# 시작 시간 보고서: time_imports() 를 다른 모듈보다 먼저 호출하면 모듈별 import 시간과 startup_mark() 로 표시한 단계
+# (첫 화면 표시 등) 시각을 기록하고, startup_report() 로 첫 화면 표시 전후의 패키지별 import 시간을 보여준다
+import atexit
+import builtins
+import functools
+import importlib.util
+import json
+import math
+import os
+import sys
+import threading
+import time
+from collections import deque
+
+MAX_EVENTS = 200000  # trace 로 보관하는 최대 구간 수, 넘으면 오래된 것부터 버린다
+HISTOGRAM_BUCKETS = 32  # 마이크로초 단위 2의 거듭제곱 구간, 마지막 구간은 약 35분 이상
+
+_enabled = os.environ.get('QCT_TRACE', '') not in ('', '0')
+_lock = threading.Lock()
+_events = deque(maxlen=MAX_EVENTS)
+_histograms = {}
+_counters = {}
+_origin = time.perf_counter()
+
+_original_import = None  # time_imports() 로 감싸기 전의 __import__
+_import_times = []  # (모듈 이름, 누적 시간, 자체 시간, 끝난 시각), 새 모듈을 읽은 import 만 기록
+_import_stack = threading.local()  # 스레드별 진행 중인 import 의 하위 import 시간 합계
+_startup_marks = []  # (단계 이름, 시각)
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ('name', 'args', 'start')
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        record(self.name, self.start, time.perf_counter(), self.args)
+        return False
+
+
+def enable(on=True):
+    global _enabled
+    _enabled = on
+
+
+def is_enabled():
+    return _enabled
+
+
+def span(name, **args):
+    # 꺼져 있으면 공유된 빈 객체를 반환하므로 with 문 한 번의 비용만 든다
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name):
+    # 함수 전체를 구간으로 기록하는 데코레이터
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return fn(*args, **kwargs)
+            with _Span(name, {}):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def count(name, n=1):
+    if not _enabled:
+        return
+    with _lock:
+        _counters[name] = _counters.get(name, 0) + n
+
+
+def record(name, start, end, args=None):
+    # 구간 하나를 히스토그램과 trace 에 추가, 다른 스레드(백그라운드 로드)에서도 호출된다
+    micros = (end - start) * 1e6
+    bucket = min(max(int(math.log2(micros)) + 1, 0), HISTOGRAM_BUCKETS - 1) if micros >= 1 else 0
+    with _lock:
+        histogram = _histograms.get(name)
+        if histogram is None:
+            histogram = _histograms[name] = {'count': 0, 'total': 0.0, 'min': math.inf, 'max': 0.0,
+                                             'buckets': [0] * HISTOGRAM_BUCKETS}
+        histogram['count'] += 1
+        histogram['total'] += micros
+        histogram['min'] = min(histogram['min'], micros)
+        histogram['max'] = max(histogram['max'], micros)
+        histogram['buckets'][bucket] += 1
+        _events.append((name, start, end, threading.get_ident(), args))
+
+
+def percentile(histogram, fraction):
+    # 히스토그램 구간 상한값으로 근사한 백분위수 (마이크로초)
+    target = histogram['count'] * fraction
+    seen = 0
+    for bucket, n in enumerate(histogram['buckets']):
+        seen += n
+        if n and seen >= target:
+            return min(float(2 ** bucket), histogram['max'])
+    return histogram['max']
+
+
+def summary():
+    # {'spans': {name: {count, mean_ms, p50_ms, p95_ms, max_ms, total_ms}}, 'counters': {name: n}}
+    with _lock:
+        histograms = {name: dict(h, buckets=list(h['buckets'])) for name, h in _histograms.items()}
+        counters = dict(_counters)
+    spans = {}
+    for name, h in sorted(histograms.items()):
+        spans[name] = {
+            'count': h['count'],
+            'mean_ms': h['total'] / h['count'] / 1000,
+            'p50_ms': percentile(h, 0.5) / 1000,
+            'p95_ms': percentile(h, 0.95) / 1000,
+            'max_ms': h['max'] / 1000,
+            'total_ms': h['total'] / 1000,
+            'buckets': h['buckets']
+        }
+    return {'spans': spans, 'counters': counters}
+
+
+def report():
+    # 사람이 읽기 위한 요약 문자열
+    stats = summary()
+    lines = [f"{'span':<24}{'count':>8}{'mean ms':>10}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}"]
+    for name, s in stats['spans'].items():
+        lines.append(f"{name:<24}{s['count']:>8}{s['mean_ms']:>10.2f}{s['p50_ms']:>10.2f}{s['p95_ms']:>10.2f}"
+                     f"{s['max_ms']:>10.2f}")
+    for name, n in sorted(stats['counters'].items()):
+        lines.append(f"{name:<24}{n:>8}")
+    return '\n'.join(lines)
+
+
+def dump_trace(path):
+    # Chrome trace event 형식 (complete event 'X'), 시간 단위는 마이크로초
+    with _lock:
+        events = list(_events)
+        counters = dict(_counters)
+    pid = os.getpid()
+    trace = [{'name': name, 'ph': 'X', 'ts': (start - _origin) * 1e6, 'dur': (end - start) * 1e6,
+              'pid': pid, 'tid': tid, 'args': {key: str(value) for key, value in (args or {}).items()}}
+             for name, start, end, tid, args in events]
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': trace, 'otherData': {'counters': counters, 'summary': summary()['spans']}}, f)
+
+
+def reset():
+    with _lock:
+        _events.clear()
+        _histograms.clear()
+        _counters.clear()
+
+
+def time_imports():
+    # builtins.__import__ 를 감싸서 이후 import 시간을 기록, 이미 읽은 모듈의 import 는 바로 넘긴다
+    global _original_import
+    if _original_import is None:
+        _original_import = builtins.__import__
+        builtins.__import__ = _timed_import
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    if level == 0 and not fromlist and name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+
+    stack = _import_stack.__dict__.setdefault('children', [])
+    loaded = len(sys.modules)
+    stack.append(0.0)
+    start = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        end = time.perf_counter()
+        elapsed = end - start
+        children = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        if len(sys.modules) > loaded:
+            if level:
+                name = importlib.util.resolve_name('.' * level + name, (globals or {}).get('__package__'))
+            _import_times.append((name, elapsed, elapsed - children, end))
+
+
+def startup_mark(name):
+    # 시작 단계 시각 기록, time_imports() 를 호출하지 않았으면 아무 일도 하지 않는다
+    if _original_import is not None:
+        _startup_marks.append((name, time.perf_counter()))
+
+
+def startup_report(top=15):
+    # 단계별 시각(계측 시작 기준)과 최상위 패키지별 import 자체 시간, 'first paint' 단계 전후로 나눠서 표시
+    marks = list(_startup_marks)
+    first_paint = next((at for name, at in marks if name == 'first paint'), math.inf)
+    lines = [f"{'startup stage':<28}{'at ms':>10}{'step ms':>10}"]
+    previous = _origin
+    for name, at in marks:
+        lines.append(f"{name:<28}{(at - _origin) * 1000:>10.1f}{(at - previous) * 1000:>10.1f}")
+        previous = at
+
+    packages = {}
+    for name, _, own, end in list(_import_times):
+        times = packages.setdefault(name.partition('.')[0], [0.0, 0.0])
+        times[0 if end <= first_paint else 1] += own
+    ordered = sorted(packages.items(), key=lambda item: -sum(item[1]))
+    lines.append(f"{'import self time ms':<28}{'before':>10}{'deferred':>10}")
+    for name, (before, deferred) in ordered[:top]:
+        lines.append(f"{name:<28}{before * 1000:>10.1f}{deferred * 1000:>10.1f}")
+    rest = ordered[top:]
+    if rest:
+        lines.append(f"{f'({len(rest)} others)':<28}{sum(t[0] for _, t in rest) * 1000:>10.1f}"
+                     f"{sum(t[1] for _, t in rest) * 1000:>10.1f}")
+    lines.append(f"{'total':<28}{sum(t[0] for t in packages.values()) * 1000:>10.1f}"
+                 f"{sum(t[1] for t in packages.values()) * 1000:>10.1f}")
+    return '\n'.join(lines)
+
+
+def _dump_at_exit():
+    path = os.environ.get('QCT_TRACE_FILE')
+    if path and (_events or _counters):
+        dump_trace(path)
+
+
+atexit.register(_dump_at_exit)
@@ -0,0 +1,97 @@
+# 셀 편집 기록(journal): 편집할 때마다 (시트, Key, 컬럼, 이전 값, 새 값)을 엑셀 파일 옆의 파일에 한 줄씩 추가한다
+# 프로그램이 비정상 종료되어도 저장하지 않은 편집을 다음 실행 때 다시 적용(replay)할 수 있다
+# 자동 저장으로 엑셀 파일에 반영된 기록은 compact() 로 journal 에서 제거한다
+import json
+import os
+
+import numpy as np
+
+from common import debug_print
+
+
+def journal_path(workbook_path):
+    # 엑셀 파일과 같은 폴더의 숨김 파일
+    directory, name = os.path.split(os.path.abspath(workbook_path))
+    return os.path.join(directory, f'.{name}.journal')
+
+
+def plain_value(value):
+    # numpy 값은 JSON 으로 저장할 수 있는 파이썬 값으로 변환
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
+
+
+class Journal:
+    def __init__(self, workbook_path):
+        self.workbook_path = workbook_path
+        self.path = journal_path(workbook_path)
+        self.file = None
+        records = self.records()
+        self.seq = records[-1]['seq'] if records else 0  # 마지막으로 기록한 편집 번호
+
+    def records(self):
+        # 기록된 편집 목록, 비정상 종료로 마지막 줄이 잘렸으면 그 줄은 버린다
+        try:
+            with open(self.path, encoding='utf-8') as f:
+                lines = f.readlines()
+        except FileNotFoundError:
+            return []
+
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                debug_print(f"journal: skip broken line {line!r}")
+        return records
+
+    def has_records(self):
+        return os.path.exists(self.path) and os.path.getsize(self.path) > 0
+
+    def append(self, sheet, key, column, old, new):
+        # 편집 하나를 추가하고 디스크에 바로 기록, 기록할 수 없으면 편집은 그대로 두고 journal 만 건너뛴다
+        self.seq += 1
+        record = {'seq': self.seq, 'sheet': sheet, 'key': plain_value(key), 'column': plain_value(column),
+                  'old': plain_value(old), 'new': plain_value(new)}
+        try:
+            if self.file is None:
+                self.file = open(self.path, 'a', encoding='utf-8')
+            self.file.write(json.dumps(record, separators=(',', ':'), default=str) + '\n')
+            self.file.flush()
+            os.fsync(self.file.fileno())
+        except OSError as e:
+            debug_print(f"journal append failed: {e}")
+        return self.seq
+
+    def compact(self, upto_seq):
+        # upto_seq 까지의 편집은 엑셀 파일에 반영되었으므로 제거, 이후 편집만 남긴다
+        remaining = [record for record in self.records() if record['seq'] > upto_seq]
+        self.close()
+        if not remaining:
+            self.remove_file()
+            return
+
+        temp_path = self.path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            for record in remaining:
+                f.write(json.dumps(record, separators=(',', ':'), default=str) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+
+    def discard(self):
+        # 기록 전체 삭제 (저장 완료 또는 복구하지 않기로 한 경우)
+        self.close()
+        self.remove_file()
+
+    def remove_file(self):
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
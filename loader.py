@@ -0,0 +1,113 @@
+import threading
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal, pyqtSlot
+
+from cache import WorkbookCache
+from common import debug_print
+from data_handler import DataHandler, LoadCancelled
+from versions import load_versions, VersionTimeline
+
+
+class LoadWorker(QObject):
+    # 워커 스레드에서 엑셀 파싱과 수식 계산을 수행하고 결과를 시그널로 전달
+    progress = pyqtSignal(str, int, int)  # 단계('rows', 'formulas'), 완료 수, 전체 수
+    preview_ready = pyqtSignal(object)  # 첫 chunk 로 만든 미리보기 DataFrame
+    finished = pyqtSignal(object)  # 로드가 끝난 DataHandler
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+
+    def __init__(self, file_path, sheet_name=None, use_cache=True):
+        super().__init__()
+        self.file_path = file_path
+        self.sheet_name = sheet_name
+        self.use_cache = use_cache
+        self.cancel_event = threading.Event()
+
+    def cancel(self):
+        # GUI 스레드에서 호출, 다음 chunk 를 읽기 전에 중단된다
+        self.cancel_event.set()
+
+    @pyqtSlot()
+    def run(self):
+        handler = DataHandler()
+        try:
+            handler.load_data(self.file_path, progress=self.progress.emit, cancel=self.cancel_event,
+                              preview=self.preview_ready.emit, cache=self.open_cache(), sheet_name=self.sheet_name)
+            if self.cancel_event.is_set():
+                raise LoadCancelled()
+            if not handler.get_formula_values():
+                handler.calculate_formulas(progress=self.progress.emit)
+            handler.get_text_index()  # 필터에 사용할 단어 색인도 워커에서 미리 만든다
+        except LoadCancelled:
+            self.cancelled.emit()
+            return
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(handler)
+
+    def open_cache(self):
+        # 캐시 폴더를 만들 수 없으면 캐시 없이 로드
+        if not self.use_cache:
+            return None
+        try:
+            return WorkbookCache()
+        except OSError as e:
+            debug_print(f"cache disabled: {e}")
+            return None
+
+
+def start_load(file_path, parent=None, sheet_name=None):
+    # 워커와 스레드를 만들어 로드를 시작, 스레드는 작업이 끝나면 스스로 정리된다
+    thread = QThread(parent)
+    worker = LoadWorker(file_path, sheet_name)
+    worker.moveToThread(thread)
+
+    thread.started.connect(worker.run)
+    for signal in (worker.finished, worker.failed, worker.cancelled):
+        signal.connect(thread.quit)
+    thread.finished.connect(worker.deleteLater)
+    thread.finished.connect(thread.deleteLater)
+
+    thread.start()
+    return thread, worker
+
+
+class CompareWorker(QObject):
+    # 워커 스레드에서 여러 버전을 프로세스 풀로 병렬 로드하고 Key 기준으로 맞춘 VersionTimeline 전달
+    progress = pyqtSignal(int, int)  # 로드가 끝난 버전 수, 전체 버전 수
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+    def __init__(self, file_paths, x_column, y_column, sheet_name=None):
+        super().__init__()
+        self.file_paths = file_paths
+        self.x_column = x_column
+        self.y_column = y_column
+        self.sheet_name = sheet_name
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            versions = load_versions(self.file_paths, self.x_column, self.y_column, self.sheet_name,
+                                     progress=self.progress.emit)
+            timeline = VersionTimeline(versions)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        self.finished.emit(timeline)
+
+
+def start_compare(file_paths, x_column, y_column, sheet_name=None, parent=None):
+    thread = QThread(parent)
+    worker = CompareWorker(file_paths, x_column, y_column, sheet_name)
+    worker.moveToThread(thread)
+
+    thread.started.connect(worker.run)
+    for signal in (worker.finished, worker.failed):
+        signal.connect(thread.quit)
+    thread.finished.connect(worker.deleteLater)
+    thread.finished.connect(thread.deleteLater)
+
+    thread.start()
+    return thread, worker
@@ -1,16 +1,30 @@
 import sys
 import logging
-from PyQt5.QtWidgets import QApplication
-from gui import MainWindow
+
+import instrument
+
+# --startup-report: 모듈별 import 시간과 첫 화면 표시까지의 단계별 시간을 기록하여 준비가 끝나면 출력
+STARTUP_REPORT = '--startup-report' in sys.argv
+if STARTUP_REPORT:
+    instrument.time_imports()
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+from gui import MainWindow  # noqa: E402
 
 logging.basicConfig(filename='app.log', level=logging.ERROR)
 
 
 def main():
     try:
+        instrument.startup_mark('imports')
         app = QApplication(sys.argv)
         main_window = MainWindow()
+        instrument.startup_mark('window created')
+        if STARTUP_REPORT:
+            main_window.startup_finished.connect(lambda: print(instrument.startup_report(), flush=True))
         main_window.show()
+        instrument.startup_mark('window shown')
+        main_window.offer_recovery()  # 이전 실행에서 저장하지 않은 편집이 있으면 복구 여부를 묻는다
         sys.exit(app.exec_())
     except Exception as e:
         logging.error("오류가 발생했습니다: %s", e, exc_info=True)
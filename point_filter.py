@@ -0,0 +1,57 @@
+# 차트 점과 테이블 row 필터, 조건을 모두 만족(AND)하는 row 만 남긴다
+# 필터 문자열은 공백으로 구분
+#   컬럼이름>=값 (<, <=, >, >=, =, !=): 숫자 범위 조건, 컬럼 값 배열 전체를 한 번에 비교 (수식 컬럼은 계산 결과)
+#   그 외 단어: Key, Summary 에 그 단어로 시작하는 단어가 있는 row (단어 색인 사용)
+# 사분면 조건은 차트 좌표와 중앙선 기준, 중앙선 위의 점은 높은 쪽으로 센다 (quadrant_stats 와 같은 기준)
+import operator
+import re
+
+import numpy as np
+import pandas as pd
+
+from text_index import tokenize
+
+_CONDITION_PATTERN = re.compile(r'^(.+?)(<=|>=|!=|<|>|=)(-?(?:\d+\.?\d*|\.\d+))$')
+_OPERATORS = {'<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge, '=': operator.eq,
+              '!=': operator.ne}
+
+
+def parse_filter(text, column_names):
+    # (검색어 목록, [(컬럼 이름, 비교 함수, 값)]), 없는 컬럼의 조건은 일반 단어로 취급
+    terms = []
+    conditions = []
+    for word in text.split():
+        match = _CONDITION_PATTERN.match(word)
+        if match and match.group(1) in column_names:
+            conditions.append((match.group(1), _OPERATORS[match.group(2)], float(match.group(3))))
+        else:
+            terms.extend(sorted(tokenize(word)))
+    return terms, conditions
+
+
+def numeric_values(values):
+    # 비교용 실수 배열, 숫자 컬럼은 저장된 배열 그대로 사용하고 숫자가 아닌 값은 NaN
+    if values.dtype.kind in 'fiu':
+        return values
+    return pd.to_numeric(pd.Series(values), errors='coerce').to_numpy(dtype=np.float64)
+
+
+def quadrant_mask(x, y, x_mid, y_mid, quadrant):
+    x_high, y_high = quadrant
+    return ((x >= x_mid) == x_high) & ((y >= y_mid) == y_high)
+
+
+def filter_mask(handler, text, quadrant=None, points=None):
+    # 보이는 row 의 bool 배열, 조건이 없으면 None (전체 표시)
+    # quadrant: (x 가 높은 쪽인지, y 가 높은 쪽인지), points: 사분면 조건에 사용할 (x, y, x_mid, y_mid)
+    data = handler.get_data()
+    terms, conditions = parse_filter(text, set(data.columns))
+
+    mask = handler.get_text_index().mask(terms) if terms else None
+    for name, compare, value in conditions:
+        found = compare(numeric_values(handler.column_values(data.columns.get_loc(name))), value)
+        mask = found if mask is None else mask & found
+    if quadrant is not None and points is not None:
+        found = quadrant_mask(*points, quadrant)
+        mask = found if mask is None else mask & found
+    return mask
@@ -0,0 +1,39 @@
+# 창을 먼저 보여주기 위해 시작 시 import 하지 않은 무거운 모듈(pandas, openpyxl, matplotlib)을 백그라운드 스레드에서 읽는다
+# 끝나기 전에 GUI 스레드에서 같은 모듈을 import 하면 해당 모듈을 다 읽을 때까지 기다렸다가 같은 모듈 객체를 사용한다
+import importlib
+
+from PyQt5.QtCore import Qt, QObject, QThread, pyqtSignal, pyqtSlot
+
+from common import debug_print
+
+DEFERRED_MODULES = ('pandas', 'openpyxl', 'matplotlib.figure', 'matplotlib.backends.backend_qt5agg', 'data_handler',
+                    'cache', 'chart', 'qt_chart', 'loader', 'autosave', 'point_filter')
+
+
+class PreloadWorker(QObject):
+    finished = pyqtSignal()
+
+    @pyqtSlot()
+    def run(self):
+        # import 에 실패해도 끝났다고 알린다, 같은 오류는 GUI 스레드에서 해당 모듈을 사용할 때 다시 발생한다
+        for name in DEFERRED_MODULES:
+            try:
+                importlib.import_module(name)
+            except ImportError as e:
+                debug_print(f"preload {name} failed: {e}")
+        self.finished.emit()
+
+
+def start_preload(parent=None):
+    # 워커와 스레드를 만들어 import 를 시작, 스레드는 작업이 끝나면 스스로 정리된다
+    thread = QThread(parent)
+    worker = PreloadWorker()
+    worker.moveToThread(thread)
+
+    thread.started.connect(worker.run)
+    # 창을 닫을 때 GUI 스레드가 wait() 로 기다리는 중에도 스레드가 끝나도록 워커 스레드에서 바로 quit 호출
+    worker.finished.connect(thread.quit, Qt.DirectConnection)
+    thread.finished.connect(worker.deleteLater)
+    thread.finished.connect(thread.deleteLater)
+    thread.start()
+    return thread, worker
@@ -0,0 +1,539 @@
+# QGraphicsView 기반 사분면 차트, ChartCanvas(matplotlib)와 같은 시그널과 메서드를 제공하여 실행 중에 바꿔 쓸 수 있다
+# 정적인 요소(축, 점, 레이블)는 이미지 한 장(ChartLayer)에 모아서 그리고, 점은 numpy 로 이미지 버퍼에 한 번에 찍는다
+# 중앙선, 드래그 중인 점과 레이블은 별도의 item 이므로 움직일 때 바뀐 영역만 다시 그린다 (이미지의 해당 부분만 복사)
+# matplotlib 백엔드와 달리 점이 많아도 hexbin 으로 집계하지 않고 모든 점을 그린다, 확대/축소는 마우스 휠, 더블 클릭으로 원래대로
+import math
+
+import numpy as np
+from PyQt5.QtCore import Qt, QPointF, QRectF, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QFontMetricsF, QImage, QPainter, QPen
+from PyQt5.QtWidgets import QFrame, QGraphicsEllipseItem, QGraphicsItem, QGraphicsLineItem, QGraphicsScene, \
+    QGraphicsView
+
+import instrument
+from chart_base import ChartBase
+from common import debug_print, ANNOTAION_DEFAULT_SIZE, ANNOTAION_BIG_SIZE
+from spatial_index import GridIndex
+
+MARGINS = (70, 40, 20, 50)  # 그림 영역 바깥 여백 (왼쪽, 위, 오른쪽, 아래), 축 눈금과 제목 자리
+MARKER_RADIUS = 4  # 점 반지름 (픽셀), matplotlib scatter 기본 크기와 비슷하게
+PICK_RADIUS = 5  # 중앙선을 잡을 수 있는 거리 (픽셀)
+LABEL_PADDING = 3
+LABEL_ALPHA = 128  # 레이블 배경 투명도 (matplotlib 레이블의 alpha=0.5)
+ZOOM_STEP = 1.25  # 마우스 휠 한 칸의 확대/축소 비율
+TICK_COUNT = 6  # 축마다 표시할 대략적인 눈금 수
+
+
+def nice_ticks(low, high, count=TICK_COUNT):
+    # low ~ high 사이의 1, 2, 5 x 10^n 간격 눈금
+    span = high - low
+    if not span > 0 or not math.isfinite(span):
+        return []
+    raw = span / count
+    magnitude = 10 ** math.floor(math.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 5, 10) if m * magnitude >= raw)
+    start = math.ceil(low / step) * step
+    return [start + i * step for i in range(int((high - start) / step + 1e-9) + 1)]
+
+
+def tick_text(value):
+    return f'{value:g}'
+
+
+def disc_offsets(radius):
+    # 반지름 radius 원 안의 픽셀 위치 (dx, dy)
+    steps = np.arange(-radius, radius + 1)
+    dx, dy = np.meshgrid(steps, steps)
+    inside = dx ** 2 + dy ** 2 <= radius * (radius + 1)
+    return dx[inside], dy[inside]
+
+
+def label_color(color):
+    background = QColor(color)
+    background.setAlpha(LABEL_ALPHA)
+    return background
+
+
+def draw_label(painter, metrics, x, y, text, background):
+    # (x, y)를 글자의 왼쪽 기준선으로 하는 반투명 배경 레이블 (matplotlib annotate 와 같은 배치), 그린 영역 반환
+    rect = QRectF(x - LABEL_PADDING, y - metrics.ascent() - LABEL_PADDING,
+                  metrics.horizontalAdvance(text) + 2 * LABEL_PADDING, metrics.height() + 2 * LABEL_PADDING)
+    painter.fillRect(rect, background)
+    painter.drawText(QPointF(x, y), text)
+    return rect
+
+
+class ChartLayer(QGraphicsItem):
+    # 미리 그려둔 차트 이미지, 다시 그려야 하는 영역(exposedRect)만 복사한다
+    def __init__(self):
+        super().__init__()
+        self.image = QImage()
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+
+    def set_image(self, image):
+        self.prepareGeometryChange()
+        self.image = image
+        self.update()
+
+    def boundingRect(self):
+        return QRectF(0, 0, self.image.width(), self.image.height())
+
+    def paint(self, painter, option, widget=None):
+        rect = option.exposedRect
+        painter.drawImage(rect, self.image, rect)
+
+
+class LabelItem(QGraphicsItem):
+    # 드래그 중인 점의 레이블, 정적인 이미지의 레이블과 같은 모양
+    def __init__(self, text, color, font):
+        super().__init__()
+        self.text = text
+        self.background = label_color(color)
+        self.font = font
+        self.metrics = QFontMetricsF(font)
+
+    def boundingRect(self):
+        return QRectF(-LABEL_PADDING, -self.metrics.ascent() - LABEL_PADDING,
+                      self.metrics.horizontalAdvance(self.text) + 2 * LABEL_PADDING,
+                      self.metrics.height() + 2 * LABEL_PADDING)
+
+    def paint(self, painter, option, widget=None):
+        painter.setFont(self.font)
+        draw_label(painter, self.metrics, 0, 0, self.text, self.background)
+
+
+class QtChartCanvas(ChartBase, QGraphicsView):
+    # 공통 상태와 로직은 ChartBase, 여기서는 이미지와 item 으로 그리는 부분만 구현
+    point_selected = pyqtSignal(dict)
+    point_clicked = pyqtSignal(str)
+    point_dropped = pyqtSignal(str, float, float)
+    midline_moved = pyqtSignal(float, float)  # 중앙선 드래그 중, 드랍 시 (x_mid, y_mid)
+    plot_updated = pyqtSignal()  # 점 위치나 중앙선, 축 방향이 바뀌어 다시 그려졌을 때
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setScene(QGraphicsScene(self))
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.setFrameShape(QFrame.NoFrame)
+        self.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.setViewportUpdateMode(QGraphicsView.MinimalViewportUpdate)
+        self.setRenderHint(QPainter.Antialiasing)
+
+        self.init_chart_state()
+        self.xlim = (0, 1)  # 왼쪽, 오른쪽 끝의 X 값 (반전되면 큰 값이 왼쪽)
+        self.ylim = (0, 1)  # 아래, 위 끝의 Y 값
+
+        # 드래그 상태, 점을 드래그하는 동안 정적인 이미지에서 그 점을 빼고 item 으로 그린다
+        self.line_position = None  # 드래그 중인 중앙선 위치 (데이터 좌표), 움직이지 않았으면 None
+        self.prev_mouse = None
+        self.drag_index = None
+        self.drag_marker = None
+        self.drag_label = None
+        self.pixel_colors = None  # 점 색상 ARGB32 픽셀 값
+
+        self.label_font = QFont()
+        self.label_font.setPointSizeF(ANNOTAION_DEFAULT_SIZE)
+        self.big_label_font = QFont()
+        self.big_label_font.setPointSizeF(ANNOTAION_BIG_SIZE)
+        self.marker_offsets = disc_offsets(MARKER_RADIUS)
+
+        # 클릭 위치 검사용 공간 인덱스, 그릴 때 저장한 레이블 영역과 점 위치로 클릭 시 필요하면 생성
+        self.label_boxes = None
+        self.point_pixels = None
+        self.label_index = None
+        self.marker_index = None
+
+        self.layer = ChartLayer()
+        self.scene().addItem(self.layer)
+        line_pen = QPen(Qt.black, 1, Qt.DashLine)
+        self.hline = QGraphicsLineItem()
+        self.vline = QGraphicsLineItem()
+        for line in (self.hline, self.vline):
+            line.setPen(line_pen)
+            line.setZValue(1)
+            line.setVisible(False)
+            self.scene().addItem(line)
+
+    def make_toolbar(self, parent):
+        # 별도의 툴바 없이 마우스 휠로 확대/축소한다
+        return None
+
+    def clear_chart(self):
+        self.reset_points()
+        self.hline.setVisible(False)
+        self.vline.setVisible(False)
+
+    def reset_points(self):
+        super().reset_points()
+        self.pixel_colors = None
+        self.invalidate_hit_index()
+
+    def build_points(self, x_data, y_data):
+        # 데이터셋 또는 축 컬럼이 바뀐 경우 점 정보 전체를 새로 만든다
+        self.reset_points()
+        self.pixel_colors = np.array([QColor(color).rgba() for color in self.plotted_colors], dtype=np.uint32)
+        self.store_points(x_data, y_data)
+
+    def reset_view(self):
+        # 확대/축소한 범위를 차트 전체로
+        x_max, y_max = self.chart_size_x, self.chart_size_y
+        self.xlim = (x_max, 0) if self.is_x_reversed else (0, x_max)
+        self.ylim = (y_max, 0) if self.is_y_reversed else (0, y_max)
+
+    def view_limits(self):
+        return self.xlim, self.ylim
+
+    def apply_point_filter(self):
+        self.apply_level_of_detail()
+
+    def apply_level_of_detail(self):
+        # 점이 적으면 보이는 점의 레이블을 모두 표시하고, 많으면 보이는 영역의 화면 영역별 레이블 수를 제한한다
+        if self.plotted_x is None:
+            return
+        visible = self.visible_mask()
+        if not self.is_lod_active():
+            labelled = set(range(len(self.plotted_x)) if visible is None else np.flatnonzero(visible).tolist())
+            if self.highlighted_index is not None:
+                labelled.add(self.highlighted_index)
+        else:
+            _, labelled, _ = self.sample_labels()
+        self.visible_labels = labelled
+
+    def plot_rect(self):
+        # 점을 그리는 영역 (뷰 좌표 = scene 좌표)
+        left, top, right, bottom = MARGINS
+        return QRectF(left, top, max(self.viewport().width() - left - right, 1),
+                      max(self.viewport().height() - top - bottom, 1))
+
+    def to_pixels(self, x, y):
+        rect = self.plot_rect()
+        (x0, x1), (y0, y1) = self.xlim, self.ylim
+        px = rect.left() + (x - x0) / ((x1 - x0) or 1.0) * rect.width()
+        py = rect.bottom() - (y - y0) / ((y1 - y0) or 1.0) * rect.height()
+        return px, py
+
+    def to_data(self, px, py):
+        rect = self.plot_rect()
+        (x0, x1), (y0, y1) = self.xlim, self.ylim
+        return (x0 + (px - rect.left()) / rect.width() * (x1 - x0),
+                y0 + (rect.bottom() - py) / rect.height() * (y1 - y0))
+
+    def update_midlines(self):
+        # 중앙선을 그림 영역 안으로 잘라서 배치, 확대해서 중앙선이 영역 밖이면 숨긴다
+        if self.data is None:
+            return
+        rect = self.plot_rect()
+        (left, top), (right, bottom) = self.to_pixels(0, self.chart_size_y), self.to_pixels(self.chart_size_x, 0)
+        left, right = sorted((left, right))
+        top, bottom = sorted((top, bottom))
+        left, right = max(left, rect.left()), min(right, rect.right())
+        top, bottom = max(top, rect.top()), min(bottom, rect.bottom())
+        x, y = self.to_pixels(self.x_mid, self.y_mid)
+        self.hline.setLine(left, y, right, y)
+        self.hline.setVisible(bool(rect.top() <= y <= rect.bottom() and left < right))
+        self.vline.setLine(x, top, x, bottom)
+        self.vline.setVisible(bool(rect.left() <= x <= rect.right() and top < bottom))
+
+    @instrument.traced('qt_chart.render')
+    def draw(self):
+        # 축, 점, 레이블을 새 이미지에 그린다, 드래그 중인 점은 item 으로 그리므로 제외
+        instrument.count('chart.draws')
+        size = self.viewport().size()
+        image = QImage(size, QImage.Format_ARGB32_Premultiplied)
+        image.fill(Qt.white)
+
+        painter = QPainter(image)
+        self.draw_axes(painter)
+        painter.end()
+
+        self.invalidate_hit_index()
+        if self.plotted_x is not None:
+            self.draw_points(image)
+            painter = QPainter(image)
+            painter.setClipRect(self.plot_rect())
+            self.draw_labels(painter)
+            painter.end()
+        self.layer.set_image(image)
+
+    def draw_axes(self, painter):
+        rect = self.plot_rect()
+        painter.setPen(QPen(Qt.black, 1))
+        painter.drawRect(rect)
+        if self.data is None:
+            return
+
+        metrics = painter.fontMetrics()
+        for value in nice_ticks(*sorted(self.xlim)):
+            x, _ = self.to_pixels(value, 0)
+            painter.drawLine(QPointF(x, rect.bottom()), QPointF(x, rect.bottom() + 4))
+            text = tick_text(value)
+            painter.drawText(QPointF(x - metrics.horizontalAdvance(text) / 2, rect.bottom() + 6 + metrics.ascent()),
+                             text)
+        for value in nice_ticks(*sorted(self.ylim)):
+            _, y = self.to_pixels(0, value)
+            painter.drawLine(QPointF(rect.left() - 4, y), QPointF(rect.left(), y))
+            text = tick_text(value)
+            painter.drawText(QPointF(rect.left() - 6 - metrics.horizontalAdvance(text),
+                                     y + metrics.ascent() / 2 - 1), text)
+
+        # 제목과 축 이름 (matplotlib 백엔드와 같은 색)
+        title = 'Quadrant Chart'
+        painter.setPen(QColor('green'))
+        painter.drawText(QPointF(rect.center().x() - metrics.horizontalAdvance(title) / 2, rect.top() - 10), title)
+        painter.setPen(QColor('red'))
+        painter.drawText(QPointF(rect.center().x() - metrics.horizontalAdvance(self.x_label) / 2,
+                                 rect.bottom() + 10 + metrics.height() + metrics.ascent()), self.x_label)
+        painter.setPen(QColor('blue'))
+        painter.save()
+        painter.translate(rect.left() - 50, rect.center().y() + metrics.horizontalAdvance(self.y_label) / 2)
+        painter.rotate(-90)
+        painter.drawText(QPointF(0, 0), self.y_label)
+        painter.restore()
+
+    def draw_points(self, image):
+        # 점을 이미지 버퍼에 직접 찍는다, 원 안의 픽셀 위치(offset)마다 모든 점을 한 번에 처리하고
+        # 여러 점이 겹치는 픽셀은 나중 row 의 색을 사용 (matplotlib 과 같이 나중 점이 위)
+        px, py = self.to_pixels(self.plotted_x, self.plotted_y)
+        rect = self.plot_rect()
+        left, top = math.floor(rect.left()) + 1, math.floor(rect.top()) + 1  # 테두리 선 안쪽
+        right, bottom = math.ceil(rect.right()) - 1, math.ceil(rect.bottom()) - 1
+        radius = MARKER_RADIUS
+        visible = (px >= left - radius) & (px <= right + radius) & (py >= top - radius) & (py <= bottom + radius)
+        mask = self.visible_mask()
+        if mask is not None:
+            visible &= mask
+        if self.drag_index is not None:
+            visible[self.drag_index] = False
+
+        centers_x = np.rint(np.where(visible, px, 0)).astype(np.int64)
+        centers_y = np.rint(np.where(visible, py, 0)).astype(np.int64)
+        self.point_pixels = (centers_x, centers_y, visible)
+        ids = np.flatnonzero(visible)
+        if not len(ids) or right < left or bottom < top:
+            return
+
+        # 픽셀마다 맨 위에 있는 row 를 기록하는 버퍼, 영역 밖에 걸친 점까지 담도록 크게 만들어 경계 검사를 하지 않는다
+        width, height = right - left + 1, bottom - top + 1
+        pad = 2 * radius
+        stride = width + 2 * pad
+        owner = np.full((height + 2 * pad) * stride, -1, dtype=np.int32)
+        base = (centers_y[ids] - top + pad) * stride + (centers_x[ids] - left + pad)
+
+        # 중심 픽셀이 같은 점은 가장 나중 row 만 남긴다, 그러면 offset 하나를 처리할 때 같은 위치에 두 번 쓰지 않는다
+        base, last = np.unique(base[::-1], return_index=True)
+        ids = ids[::-1][last].astype(np.int32)
+        dx, dy = self.marker_offsets
+        for offset in (dy * stride + dx).tolist():
+            target = base + offset
+            owner[target] = np.maximum(owner[target], ids)
+
+        bits = image.bits()
+        bits.setsize(image.byteCount())
+        pixels = np.frombuffer(bits, dtype=np.uint32).reshape(image.height(), image.bytesPerLine() // 4)
+        region = owner.reshape(-1, stride)[pad:pad + height, pad:pad + width]
+        painted = region >= 0
+        pixels[top:top + height, left:left + width][painted] = self.pixel_colors[region[painted]]
+
+    def draw_labels(self, painter):
+        # 보이는 레이블을 row 순서대로 그리고 (나중 레이블이 위) 클릭 검사용 영역을 저장
+        boxes = np.full((len(self.plotted_x), 4), np.nan)
+        metrics = QFontMetricsF(self.label_font)
+        big_metrics = QFontMetricsF(self.big_label_font)
+        painter.setFont(self.label_font)
+        painter.setPen(Qt.black)
+        labels = sorted(self.visible_labels - {self.drag_index})
+        if not labels:
+            self.label_boxes = boxes
+            return
+        xs, ys = self.to_pixels(self.plotted_x[labels], self.plotted_y[labels])
+        for i, x, y in zip(labels, xs.tolist(), ys.tolist()):
+            if i == self.highlighted_index:
+                painter.setFont(self.big_label_font)
+                rect = draw_label(painter, big_metrics, x, y, str(self.plotted_keys[i]), label_color(self.point_colors[i]))
+                painter.setFont(self.label_font)
+            else:
+                rect = draw_label(painter, metrics, x, y, str(self.plotted_keys[i]), label_color(self.point_colors[i]))
+            boxes[i] = rect.left(), rect.top(), rect.right(), rect.bottom()
+        self.label_boxes = boxes
+
+    def invalidate_hit_index(self):
+        self.label_index = None
+        self.marker_index = None
+
+    def find_point(self, x, y):
+        # 클릭 위치에 있는 가장 위쪽 점의 위치(row), 레이블이 점보다 위에 그려지므로 먼저 검사
+        if self.plotted_x is None or self.point_pixels is None:
+            return None
+        if self.label_index is None:
+            self.label_index = GridIndex(self.label_boxes)
+            centers_x, centers_y, visible = self.point_pixels
+            boxes = np.column_stack([centers_x - MARKER_RADIUS, centers_y - MARKER_RADIUS,
+                                     centers_x + MARKER_RADIUS, centers_y + MARKER_RADIUS]).astype(np.float64)
+            boxes[~visible] = np.nan
+            self.marker_index = GridIndex(boxes)
+        i = self.label_index.topmost(x, y)
+        if i is None:
+            i = self.marker_index.topmost(x, y)
+        return i
+
+    def mousePressEvent(self, event):
+        pos = event.pos()
+        if self.data is None or not self.plot_rect().contains(QPointF(pos)):
+            return
+
+        debug_print("on_click >>>>>")
+
+        if event.button() == Qt.LeftButton:
+            line = self.hline.line()
+            if self.hline.isVisible() and abs(pos.y() - line.y1()) <= PICK_RADIUS \
+                    and line.x1() <= pos.x() <= line.x2():
+                self.dragging_line = self.hline
+            line = self.vline.line()
+            if self.vline.isVisible() and abs(pos.x() - line.x1()) <= PICK_RADIUS \
+                    and line.y1() <= pos.y() <= line.y2():
+                self.dragging_line = self.vline
+            self.prev_mouse = (pos.x(), pos.y())
+
+        i = self.find_point(pos.x(), pos.y())
+        if i is not None:
+            self.select_point(i)
+
+    def mouseMoveEvent(self, event):
+        # 다음 프레임까지 들어온 이동 이벤트는 마지막 것만 처리
+        pos = event.pos()
+        if not self.plot_rect().contains(QPointF(pos)):
+            return
+        if self.selected_point is not None or self.dragging_line is not None:
+            self.scheduler.schedule('motion', lambda: self.drag_to(pos.x(), pos.y()))
+
+    def drag_to(self, px, py):
+        x, y = self.to_data(px, py)
+        if self.selected_point is not None:
+            x, y = self.clamp_to_view(x, y)
+            if self.drag_marker is None:
+                self.start_point_drag()
+            self.drag_position = (x, y)
+            position = QPointF(*self.to_pixels(x, y))
+            self.drag_marker.setPos(position)
+            self.drag_label.setPos(position)
+            instrument.count('chart.item_moves')
+            return
+
+        # 중앙선은 item 위치만 바꾸고, 점과 레이블 이미지는 다시 그리지 않는다
+        if self.dragging_line is self.hline:
+            self.line_position = y
+            line = self.hline.line()
+            self.hline.setLine(line.x1(), py, line.x2(), py)
+            self.midline_moved.emit(self.x_mid, y)
+        elif self.dragging_line is self.vline:
+            self.line_position = x
+            line = self.vline.line()
+            self.vline.setLine(px, line.y1(), px, line.y2())
+            self.midline_moved.emit(x, self.y_mid)
+        instrument.count('chart.item_moves')
+
+    @instrument.traced('drag.start')
+    def start_point_drag(self):
+        # 선택된 점을 정적인 이미지에서 빼고 움직이는 item(점, 레이블)으로 대체
+        i = self.selected_index
+        self.drag_index = i
+        self.visible_labels.add(i)  # 레이블이 없던 점이면 이후 레이블 표시 갱신 대상에 포함
+        self.scheduler.cancel('draw')  # 여기서 바로 그리므로 대기 중인 다시 그리기는 필요 없다
+        self.draw()
+
+        color = QColor(self.point_colors[i])
+        self.drag_marker = QGraphicsEllipseItem(-MARKER_RADIUS, -MARKER_RADIUS, 2 * MARKER_RADIUS, 2 * MARKER_RADIUS)
+        self.drag_marker.setBrush(color)
+        self.drag_marker.setPen(QPen(Qt.NoPen))
+        self.drag_marker.setZValue(2)
+        font = self.big_label_font if i == self.highlighted_index else self.label_font
+        self.drag_label = LabelItem(str(self.plotted_keys[i]), color, font)
+        self.drag_label.setZValue(3)
+        for item in (self.drag_marker, self.drag_label):
+            self.scene().addItem(item)
+
+    def end_drag(self):
+        # 드래그 item 정리, 이후 다시 그리기는 호출한 쪽에서 수행
+        if self.drag_marker is not None:
+            self.scene().removeItem(self.drag_marker)
+            self.scene().removeItem(self.drag_label)
+            self.drag_marker = None
+            self.drag_label = None
+        self.drag_index = None
+        self.drag_position = None
+        self.line_position = None
+
+    def mouseReleaseEvent(self, event):
+        # 마우스 해제 (드랍) 이벤트 처리, 아직 처리되지 않은 이동 이벤트를 먼저 반영
+        self.scheduler.flush()
+        pos = event.pos()
+        inside = self.plot_rect().contains(QPointF(pos))
+        if self.selected_point is not None:
+            debug_print("on_release >>>>>")
+
+            # 마우스 커서가 전혀 움직이지 않았다면 드래그앤드랍 이벤트 무시
+            if self.prev_mouse == (pos.x(), pos.y()):
+                was_dragged = self.drag_marker is not None
+                self.end_drag()
+                if was_dragged:
+                    self.update_plot(False)
+                self.clear_selection()
+                return
+
+            # 차트 바깥에서 놓은 경우 마지막 드래그 위치 사용
+            if not inside:
+                if self.drag_position is None:
+                    self.end_drag()
+                    self.clear_selection()
+                    return
+                event_x, event_y = self.drag_position
+            else:
+                event_x, event_y = self.to_data(pos.x(), pos.y())
+            self.drop_point(event_x, event_y)
+            self.dragging_line = None
+
+        if event.button() == Qt.LeftButton and self.dragging_line is not None:
+            if self.line_position is not None:
+                if self.dragging_line is self.vline:
+                    self.x_mid = self.line_position
+                    debug_print(f"Vertical line dropped at x = {self.x_mid}")
+                else:
+                    self.y_mid = self.line_position
+                    debug_print(f"Horizontal line dropped at y = {self.y_mid}")
+                self.midline_moved.emit(self.x_mid, self.y_mid)
+            self.end_drag()
+            self.dragging_line = None
+
+    def clear_selection(self):
+        self.selected_point = None
+        self.selected_index = None
+        self.dragging_line = None
+
+    def wheelEvent(self, event):
+        # 커서 위치를 중심으로 확대/축소, 보이는 영역 기준으로 레이블 표시를 갱신
+        pos = event.pos()
+        if self.data is None or self.dragging_line is not None or self.selected_point is not None \
+                or not self.plot_rect().contains(QPointF(pos)):
+            return
+        factor = 1 / ZOOM_STEP if event.angleDelta().y() > 0 else ZOOM_STEP
+        x, y = self.to_data(pos.x(), pos.y())
+        self.xlim = tuple(x + (limit - x) * factor for limit in self.xlim)
+        self.ylim = tuple(y + (limit - y) * factor for limit in self.ylim)
+        self.update_midlines()
+        self.apply_level_of_detail()
+        self.request_redraw()
+
+    def mouseDoubleClickEvent(self, event):
+        # 확대/축소한 범위를 원래대로
+        if self.data is not None and self.selected_point is None:
+            self.reset_view()
+            self.update_midlines()
+            self.apply_level_of_detail()
+            self.request_redraw()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.setSceneRect(0, 0, self.viewport().width(), self.viewport().height())
+        self.update_midlines()
+        self.request_redraw()
@@ -0,0 +1,95 @@
+import math
+import random
+
+from matplotlib import lines
+
+# Qt 에 의존하지 않는 사분면 차트 배치 로직, ChartCanvas 와 batch_render 에서 함께 사용한다
+
+MIDLINE_STYLE = dict(color='black', linestyle='--')
+
+
+def random_color(rng=random):
+    r = lambda: rng.randint(0, 255)
+    return f'#{r():02x}{r():02x}{r():02x}'
+
+
+def generate_colors(count, seed=None):
+    # annotation 배경 색상 목록, seed 를 주면 항상 같은 색상
+    rng = random.Random(seed) if seed is not None else random
+    return [random_color(rng) for _ in range(count)]
+
+
+def chart_max_size(x_data, y_data):
+    # 차트 크기는 현재 데이터의 최대값 기준
+    return x_data.max(), y_data.max()
+
+
+def fit_midlines(x_max, y_max, x_mid, y_mid):
+    # 중앙선 위치 - 일반적인 경우
+    if x_mid is None or y_mid is None:
+        x_mid = x_max / 2
+        y_mid = y_max / 2
+
+    # 중앙선 위치 - 차트 바깥에 위치할 경우 가까운 안쪽으로 옮김
+    if x_mid >= x_max:
+        t = x_max * 0.99
+        x_mid = math.floor(t * 10) / 10
+    if y_mid >= y_max:
+        t = y_max * 0.99
+        y_mid = math.floor(t * 10) / 10
+
+    return x_mid, y_mid
+
+
+def create_midlines(axes):
+    hline = lines.Line2D([], [], **MIDLINE_STYLE)
+    vline = lines.Line2D([], [], **MIDLINE_STYLE)
+    axes.add_line(hline)
+    axes.add_line(vline)
+    return hline, vline
+
+
+def place_midlines(hline, vline, x_max, y_max, x_mid, y_mid):
+    hline.set_data([0, x_max], [y_mid, y_mid])
+    vline.set_data([x_mid, x_mid], [0, y_max])
+
+
+def set_quadrant_limits(axes, x_max, y_max, is_x_reversed, is_y_reversed):
+    # 사분면 X, Y 범위 설정
+    if is_x_reversed:
+        axes.set_xlim(x_max, 0)
+    else:
+        axes.set_xlim(0, x_max)
+
+    if is_y_reversed:
+        axes.set_ylim(y_max, 0)
+    else:
+        axes.set_ylim(0, y_max)
+
+
+def decorate_axes(axes, x_label, y_label):
+    axes.set_title('Quadrant Chart', color='green')
+    axes.set_xlabel(x_label, color='red')
+    axes.set_ylabel(y_label, color='blue')
+
+
+def add_label(axes, key, x, y, color):
+    return axes.annotate(key, (x, y), bbox=dict(facecolor=color, alpha=0.5))
+
+
+def draw_quadrant_chart(axes, x_data, y_data, keys, colors, x_label, y_label,
+                        x_mid=None, y_mid=None, is_x_reversed=False, is_y_reversed=False):
+    # 사분면 차트 전체를 한 번에 그린다 (정적인 출력용), 실제 사용된 중앙선 위치를 반환
+    x_max, y_max = chart_max_size(x_data, y_data)
+    x_mid, y_mid = fit_midlines(x_max, y_max, x_mid, y_mid)
+
+    hline, vline = create_midlines(axes)
+    place_midlines(hline, vline, x_max, y_max, x_mid, y_mid)
+
+    axes.scatter(x_data, y_data, c=colors)
+    for i, key in enumerate(keys):
+        add_label(axes, key, x_data[i], y_data[i], colors[i])
+
+    set_quadrant_limits(axes, x_max, y_max, is_x_reversed, is_y_reversed)
+    decorate_axes(axes, x_label, y_label)
+    return x_mid, y_mid
@@ -0,0 +1,68 @@
+from PyQt5.QtCore import pyqtSlot
+from PyQt5.QtWidgets import QGroupBox, QGridLayout, QLabel
+
+from quadrant_stats import QUADRANTS, QuadrantStats
+
+
+class QuadrantPanel(QGroupBox):
+    # 사분면별 점 개수와 X, Y 합계/평균 표시, 차트와 같은 위치 배치(축 반전 반영)
+    def __init__(self, parent=None):
+        super().__init__('Quadrants', parent)
+        self.stats = QuadrantStats()
+        self.x_label = 'X'
+        self.y_label = 'Y'
+        self.is_x_reversed = False
+        self.is_y_reversed = False
+        self.x_mid = None
+        self.y_mid = None
+
+        self.grid = QGridLayout(self)
+        self.labels = {quadrant: QLabel() for quadrant in QUADRANTS}
+        self.place_labels()
+        self.clear()
+
+    def place_labels(self):
+        # 오른쪽 위 = X, Y 모두 높은 사분면 (반전된 축은 반대쪽)
+        for (x_high, y_high), label in self.labels.items():
+            row = 0 if y_high != self.is_y_reversed else 1
+            column = 1 if x_high != self.is_x_reversed else 0
+            self.grid.addWidget(label, row, column)
+
+    def set_axes(self, x_label, y_label, is_x_reversed, is_y_reversed):
+        self.x_label = x_label
+        self.y_label = y_label
+        if (is_x_reversed, is_y_reversed) != (self.is_x_reversed, self.is_y_reversed):
+            self.is_x_reversed = is_x_reversed
+            self.is_y_reversed = is_y_reversed
+            self.place_labels()
+
+    def set_points(self, x, y):
+        self.stats.set_points(x, y)
+
+    @pyqtSlot(float, float)
+    def set_midlines(self, x_mid, y_mid):
+        # 드래그 중에는 움직이는 중앙선 축만 이진 탐색으로 다시 계산
+        moving = 'y' if x_mid == self.x_mid else 'x'
+        self.x_mid = x_mid
+        self.y_mid = y_mid
+        result = self.stats.quadrants(x_mid, y_mid, moving)
+        if result is None:
+            return
+        for quadrant, summary in result.items():
+            self.labels[quadrant].setText(self.describe(quadrant, summary))
+
+    def describe(self, quadrant, summary):
+        x_high, y_high = quadrant
+        title = f"{'High' if x_high else 'Low'} {self.x_label} / {'High' if y_high else 'Low'} {self.y_label}"
+        if not summary['count']:
+            return f"{title}\n0 items"
+        return (f"{title}\n{summary['count']} items\n"
+                f"{self.x_label}: sum {summary['sum_x']:.1f}, mean {summary['mean_x']:.2f}\n"
+                f"{self.y_label}: sum {summary['sum_y']:.1f}, mean {summary['mean_y']:.2f}")
+
+    def clear(self):
+        self.stats = QuadrantStats()
+        self.x_mid = None
+        self.y_mid = None
+        for label in self.labels.values():
+            label.setText('-')
@@ -0,0 +1,107 @@
+# 중앙선 기준 사분면별 점 개수, 합계, 평균 (Qt 없이 numpy 로 계산)
+# 점을 x, y 기준으로 미리 정렬하고 누적합을 만들어 두면, 중앙선 하나를 움직일 때마다 이진 탐색 한 번으로 다시 계산된다
+# 사분면 키는 (x 가 중앙선 이상인지, y 가 중앙선 이상인지), 중앙선 위의 점은 이상(높은 쪽)으로 센다
+import numpy as np
+
+QUADRANTS = ((True, True), (False, True), (False, False), (True, False))
+
+
+def quadrant_summary(count, sum_x, sum_y):
+    return {
+        'count': int(count),
+        'sum_x': float(sum_x),
+        'sum_y': float(sum_y),
+        'mean_x': float(sum_x / count) if count else None,
+        'mean_y': float(sum_y / count) if count else None
+    }
+
+
+class SortedAxis:
+    # 한 축 기준으로 정렬한 점과, 다른 축의 중앙선(split)에 대한 누적합
+    def __init__(self, values, other):
+        order = np.argsort(values, kind='stable')
+        self.values = values[order]
+        self.other = other[order]
+        self.split = None
+        self.prefix = None
+
+    def prepare(self, split):
+        # 다른 축 중앙선이 바뀐 경우에만 누적합을 다시 만든다 (드래그 시작 시 한 번)
+        if self.split == split and self.prefix is not None:
+            return
+        high = self.other >= split
+        zero = np.zeros(1)
+        self.prefix = {
+            'value': np.concatenate([zero, np.cumsum(self.values)]),
+            'other': np.concatenate([zero, np.cumsum(self.other)]),
+            'high_count': np.concatenate([zero, np.cumsum(high)]),
+            'high_value': np.concatenate([zero, np.cumsum(np.where(high, self.values, 0.0))]),
+            'high_other': np.concatenate([zero, np.cumsum(np.where(high, self.other, 0.0))])
+        }
+        self.split = split
+
+    def quadrants(self, mid):
+        # 이 축의 중앙선이 mid 일 때 {(이 축 이상, 다른 축 이상): (count, 이 축 합계, 다른 축 합계)}
+        k = int(np.searchsorted(self.values, mid, side='left'))  # [0, k) 는 mid 미만
+        p = self.prefix
+        n = len(self.values)
+
+        low_high = (p['high_count'][k], p['high_value'][k], p['high_other'][k])
+        low_all = (k, p['value'][k], p['other'][k])
+        high_high = (p['high_count'][n] - low_high[0], p['high_value'][n] - low_high[1],
+                     p['high_other'][n] - low_high[2])
+        high_all = (n - k, p['value'][n] - low_all[1], p['other'][n] - low_all[2])
+
+        def minus(a, b):
+            return tuple(x - y for x, y in zip(a, b))
+
+        return {
+            (True, True): high_high,
+            (False, True): low_high,
+            (False, False): minus(low_all, low_high),
+            (True, False): minus(high_all, high_high)
+        }
+
+
+class QuadrantStats:
+    def __init__(self):
+        self.x = None
+        self.y = None
+        self.by_x = None
+        self.by_y = None
+
+    def set_points(self, x, y):
+        # 점 좌표가 바뀌면 다시 정렬, 같으면 기존 정렬을 그대로 사용한다
+        # 차트 좌표는 DataHandler 배열을 그대로 참조하므로 비교를 위해 사본을 보관한다
+        x = np.array(x, dtype=np.float64)
+        y = np.array(y, dtype=np.float64)
+        if self.x is not None and np.array_equal(self.x, x) and np.array_equal(self.y, y):
+            return
+        valid = np.isfinite(x) & np.isfinite(y)
+        self.x = x
+        self.y = y
+        self.by_x = SortedAxis(x[valid], y[valid])
+        self.by_y = SortedAxis(y[valid], x[valid])
+
+    def compute(self, x_mid, y_mid):
+        # 정렬 없이 전체 점을 한 번 훑어서 계산 (검증, 한 번만 필요한 경우)
+        valid = np.isfinite(self.x) & np.isfinite(self.y)
+        x, y = self.x[valid], self.y[valid]
+        result = {}
+        for x_high, y_high in QUADRANTS:
+            mask = ((x >= x_mid) == x_high) & ((y >= y_mid) == y_high)
+            result[(x_high, y_high)] = quadrant_summary(np.count_nonzero(mask), x[mask].sum(), y[mask].sum())
+        return result
+
+    def quadrants(self, x_mid, y_mid, moving='x'):
+        # moving: 드래그 중인 중앙선 축, 나머지 축의 누적합은 고정된 채로 이진 탐색만 한다
+        if self.by_x is None:
+            return None
+        if moving == 'y':
+            self.by_y.prepare(x_mid)
+            counts = {(x_high, y_high): (count, sum_x, sum_y)
+                      for (y_high, x_high), (count, sum_y, sum_x) in self.by_y.quadrants(y_mid).items()}
+        else:
+            self.by_x.prepare(y_mid)
+            counts = self.by_x.quadrants(x_mid)
+        return {quadrant: quadrant_summary(*counts[quadrant]) for quadrant in QUADRANTS}
@@ -0,0 +1,74 @@
+import time
+from collections import deque
+
+from PyQt5.QtCore import QObject, QTimer
+
+import instrument
+from common import REDRAW_MAX_FPS
+
+
+class RedrawScheduler(QObject):
+    # 그리기 요청을 모아서 한 프레임에 한 번만 처리한다
+    # schedule(name, fn) 으로 요청하면 같은 이름의 대기 중인 요청은 마지막 것으로 대체된다 (대체된 수 = dropped)
+    # 프레임 간격은 max_fps 로 제한하고, 실제 처리된 프레임 수로 fps 를 계산한다
+    def __init__(self, max_fps=REDRAW_MAX_FPS, parent=None):
+        super().__init__(parent)
+        self.pending = {}
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.flush)
+        self.frame_interval = 0.0
+        self.set_max_fps(max_fps)
+        self.last_frame = 0.0
+        self.frame_times = deque()  # 최근 1초 동안 처리한 프레임 시각
+        self.requests = 0
+        self.dropped = 0
+        self.frames = 0
+
+    def set_max_fps(self, max_fps):
+        # 0 이하이면 제한 없이 다음 이벤트 루프에서 처리
+        self.frame_interval = 1.0 / max_fps if max_fps > 0 else 0.0
+
+    def schedule(self, name, fn):
+        self.requests += 1
+        if name in self.pending:
+            self.dropped += 1
+            instrument.count('redraw.dropped')
+        self.pending[name] = fn
+        if not self.timer.isActive():
+            wait = self.last_frame + self.frame_interval - time.perf_counter()
+            self.timer.start(max(int(wait * 1000), 0))
+
+    def cancel(self, name):
+        self.pending.pop(name, None)
+
+    def flush(self):
+        # 대기 중인 요청을 요청 순서대로 처리, 처리 중에 들어온 요청은 다음 프레임으로 넘긴다
+        self.timer.stop()
+        if not self.pending:
+            return
+        pending, self.pending = self.pending, {}
+        with instrument.span('redraw.frame'):
+            for fn in pending.values():
+                fn()
+
+        now = time.perf_counter()
+        self.last_frame = now
+        self.frames += 1
+        self.frame_times.append(now)
+        while self.frame_times and now - self.frame_times[0] > 1.0:
+            self.frame_times.popleft()
+        instrument.count('redraw.frames')
+
+        if self.pending and not self.timer.isActive():
+            self.timer.start(max(int(self.frame_interval * 1000), 0))
+
+    def fps(self):
+        # 최근 1초 동안 처리한 프레임 수
+        now = time.perf_counter()
+        while self.frame_times and now - self.frame_times[0] > 1.0:
+            self.frame_times.popleft()
+        return len(self.frame_times)
+
+    def stats(self):
+        return {'requests': self.requests, 'frames': self.frames, 'dropped': self.dropped, 'fps': self.fps()}
@@ -0,0 +1,67 @@
+import math
+from collections import defaultdict
+
+import numpy as np
+
+
+class GridIndex:
+    # 화면(픽셀) 좌표의 사각형 목록에 대한 균일 격자 인덱스
+    # 각 사각형을 겹치는 격자 칸에 등록해 두고, 클릭 위치의 칸에 있는 후보만 검사한다
+
+    def __init__(self, boxes, cell_size=None):
+        # boxes: (N, 4) 배열, 각 행은 x0, y0, x1, y1 (순서가 뒤집혀 있어도 됨)
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        self.x0 = np.minimum(boxes[:, 0], boxes[:, 2])
+        self.y0 = np.minimum(boxes[:, 1], boxes[:, 3])
+        self.x1 = np.maximum(boxes[:, 0], boxes[:, 2])
+        self.y1 = np.maximum(boxes[:, 1], boxes[:, 3])
+        valid = np.isfinite(self.x0) & np.isfinite(self.y0) & np.isfinite(self.x1) & np.isfinite(self.y1)
+
+        if cell_size is None:
+            # 사각형 크기의 중앙값을 격자 칸 크기로 사용하여 칸당 후보 수를 작게 유지
+            sizes = np.concatenate([(self.x1 - self.x0)[valid], (self.y1 - self.y0)[valid]])
+            cell_size = float(np.median(sizes)) if sizes.size else 1.0
+        self.cell_size = max(cell_size, 1.0)
+
+        self.cells = defaultdict(list)
+        cx0 = np.floor(self.x0 / self.cell_size)
+        cy0 = np.floor(self.y0 / self.cell_size)
+        cx1 = np.floor(self.x1 / self.cell_size)
+        cy1 = np.floor(self.y1 / self.cell_size)
+        for i in np.flatnonzero(valid):
+            for cx in range(int(cx0[i]), int(cx1[i]) + 1):
+                for cy in range(int(cy0[i]), int(cy1[i]) + 1):
+                    self.cells[(cx, cy)].append(i)
+
+    def __len__(self):
+        return len(self.x0)
+
+    def query(self, x, y):
+        # (x, y)를 포함하는 사각형의 인덱스 목록 (오름차순)
+        cell = (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+        candidates = self.cells.get(cell)
+        if not candidates:
+            return []
+        ids = np.asarray(candidates)
+        hit = (self.x0[ids] <= x) & (x <= self.x1[ids]) & (self.y0[ids] <= y) & (y <= self.y1[ids])
+        return ids[hit].tolist()
+
+    def topmost(self, x, y):
+        # 나중에 그려진(인덱스가 큰) 사각형이 위에 있으므로 가장 큰 인덱스를 반환, 없으면 None
+        hits = self.query(x, y)
+        return hits[-1] if hits else None
+
+
+def grid_sample(x, y, candidates, extent, grid, per_cell):
+    # 보이는 영역(extent: x0, x1, y0, y1)을 grid(가로, 세로) 칸으로 나누고 칸마다 앞쪽 row 부터 최대 per_cell 개 선택
+    # candidates: 대상 row 위치 배열(오름차순), 선택된 row 위치 배열 반환
+    x0, x1, y0, y1 = extent
+    columns, rows = grid
+    gx = np.clip(((x[candidates] - x0) / max(x1 - x0, 1e-12) * columns).astype(np.int64), 0, columns - 1)
+    gy = np.clip(((y[candidates] - y0) / max(y1 - y0, 1e-12) * rows).astype(np.int64), 0, rows - 1)
+    region = gy * columns + gx
+    order = np.argsort(region, kind='stable')
+    sorted_region = region[order]
+    group_start = np.searchsorted(sorted_region, sorted_region, side='left')
+    rank = np.arange(len(order)) - group_start
+    return candidates[order[rank < per_cell]]
@@ -0,0 +1,229 @@
+import numpy as np
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QFont
+
+import instrument
+from common import TEXT_COLUMN_LIST
+
+
+def display_text(value):
+    # 숫자 컬럼은 float64 로 저장되므로 정수 값은 소수점 없이 표시
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return str(value)
+
+
+class DataFrameTableModel(QAbstractTableModel):
+    # DataHandler 의 DataFrame 을 직접 참조하는 테이블 모델, 시작 직후 DataHandler 가 만들어지기 전에는 None (빈 테이블)
+    # 화면에 보이는 셀만 문자열로 변환하고, 편집 값은 DataHandler 에 바로 저장한다
+    # 필터가 설정되면 보이는 row 만 순서대로 보여준다, 화면 row 와 DataHandler row(원본 row)는 source_row/view_row 로 변환
+    # edited_cells, highlighted_row, 시그널의 row 는 모두 원본 row 기준
+    cell_edited = pyqtSignal(int, int)  # 사용자 편집으로 값이 바뀐 셀 (row, column)
+    invalid_input = pyqtSignal(int, int)  # 숫자 컬럼에 숫자가 아닌 값이 입력된 셀
+
+    def __init__(self, data_handler, parent=None):
+        super().__init__(parent)
+        self.data_handler = data_handler
+        self.read_only = False  # 로드 중 미리보기 데이터를 보여줄 때는 편집 불가
+        self.edited_cells = set()  # 차트 이동으로 변경된 셀, 강조 표시
+        self.highlighted_row = -1  # 차트에서 선택된 행, 강조 표시
+        self.visible_rows = None  # 필터로 보이는 원본 row 배열, None 이면 전체
+        self.view_rows = None  # 원본 row -> 화면 row, 숨겨진 row 는 -1
+
+        self.edited_background = QColor(Qt.yellow)
+        self.edited_foreground = QColor(Qt.darkBlue)
+        self.highlighted_background = QColor(Qt.green)
+        self.edited_font = QFont()
+        self.edited_font.setItalic(True)
+
+        # 같은 이벤트 루프 안에서 바뀐 셀은 모아서 dataChanged 한 번으로 알린다 (top, left, bottom, right)
+        self.pending_changes = None
+        self.change_timer = QTimer(self)
+        self.change_timer.setSingleShot(True)
+        self.change_timer.setInterval(0)
+        self.change_timer.timeout.connect(self.flush_changes)
+
+    def reset(self):
+        # 새 데이터가 로드되었을 때 모델 전체 갱신
+        self.beginResetModel()
+        self.pending_changes = None
+        self.change_timer.stop()
+        self.edited_cells.clear()
+        self.highlighted_row = -1
+        self.visible_rows = None
+        self.view_rows = None
+        self.endResetModel()
+
+    def set_visible_rows(self, rows):
+        # 필터 결과 반영 (rows: 보이는 원본 row 배열, None 이면 전체), 편집/강조 표시는 유지한다
+        self.beginResetModel()
+        self.pending_changes = None
+        self.change_timer.stop()
+        self.visible_rows = rows
+        if rows is None:
+            self.view_rows = None
+        else:
+            self.view_rows = np.full(self.data_handler.get_data().shape[0], -1, dtype=np.int64)
+            self.view_rows[rows] = np.arange(len(rows))
+        self.endResetModel()
+
+    def source_row(self, view_row):
+        if self.visible_rows is None:
+            return view_row
+        return int(self.visible_rows[view_row])
+
+    def view_row(self, row):
+        # 원본 row 의 화면 위치, 필터로 숨겨졌으면 -1
+        if self.view_rows is None:
+            return row
+        return int(self.view_rows[row])
+
+    def set_data_handler(self, data_handler, read_only=False):
+        # 보여줄 DataHandler 교체 (로드 중 미리보기 <-> 실제 데이터)
+        self.data_handler = data_handler
+        self.read_only = read_only
+        self.reset()
+
+    def rowCount(self, parent=QModelIndex()):
+        data = self.data_handler.get_data() if self.data_handler is not None else None
+        if parent.isValid() or data is None:
+            return 0
+        if self.visible_rows is not None:
+            return len(self.visible_rows)
+        return data.shape[0]
+
+    def columnCount(self, parent=QModelIndex()):
+        data = self.data_handler.get_data() if self.data_handler is not None else None
+        if parent.isValid() or data is None:
+            return 0
+        return data.shape[1]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return str(self.data_handler.get_data().columns[section])
+        return str(self.source_row(section) + 1)
+
+    def flags(self, index):
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        if not self.read_only and not self.is_formula_column(index.column()):
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = self.source_row(index.row()), index.column()
+
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return display_text(self.value(row, col))
+        if role == Qt.BackgroundRole:
+            if (row, col) in self.edited_cells:
+                return self.edited_background
+            if row == self.highlighted_row:
+                return self.highlighted_background
+        elif role == Qt.ForegroundRole:
+            if (row, col) in self.edited_cells:
+                return self.edited_foreground
+        elif role == Qt.FontRole:
+            if (row, col) in self.edited_cells:
+                return self.edited_font
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        # 테이블에서 직접 편집한 값을 검증 후 저장
+        if role != Qt.EditRole or not index.isValid():
+            return False
+        row, col = self.source_row(index.row()), index.column()
+
+        if self.is_numeric_column(col):
+            # 숫자만 입력받는 컬럼이면 숫자인지 확인, 아니면 0 처리
+            # 0 도 바뀐 값이므로 차트가 갱신되도록 cell_edited 를 먼저 알리고 경고한다
+            try:
+                value = float(value)
+            except ValueError:
+                self.write_value(row, col, 0)
+                self.cell_edited.emit(row, col)
+                self.invalid_input.emit(row, col)
+                return True
+
+        self.write_value(row, col, value)
+        self.cell_edited.emit(row, col)
+        return True
+
+    def value(self, row, col):
+        # 수식 컬럼은 계산된 값, 그 외에는 DataFrame 값
+        formula_values = self.data_handler.get_formula_values()
+        if col in formula_values:
+            return formula_values[col][row]
+        return self.data_handler.get_data().iat[row, col]
+
+    def mark_changed(self, top, left, bottom=None, right=None):
+        # 바뀐 영역(화면 row 기준)을 기존 대기 영역과 합치고 다음 이벤트 루프에서 알린다
+        bottom = top if bottom is None else bottom
+        right = left if right is None else right
+        if self.pending_changes is not None:
+            pending_top, pending_left, pending_bottom, pending_right = self.pending_changes
+            top, left = min(top, pending_top), min(left, pending_left)
+            bottom, right = max(bottom, pending_bottom), max(right, pending_right)
+        self.pending_changes = (top, left, bottom, right)
+        if not self.change_timer.isActive():
+            self.change_timer.start()
+
+    def mark_row_changed(self, row, left, right=None):
+        # 원본 row 한 줄의 변경, 필터로 숨겨진 row 는 알리지 않는다
+        view_row = self.view_row(row)
+        if view_row >= 0:
+            self.mark_changed(view_row, left, view_row, right)
+
+    def flush_changes(self):
+        self.change_timer.stop()
+        if self.pending_changes is None:
+            return
+        top, left, bottom, right = self.pending_changes
+        self.pending_changes = None
+        self.dataChanged.emit(self.index(top, left), self.index(bottom, right))
+        instrument.count('table.change_batches')
+
+    def write_value(self, row, col, value):
+        self.data_handler.set_value(row, col, value)
+        self.mark_row_changed(row, col)
+
+        # 같은 row 에서 이 값에 의존하는 수식 셀만 다시 계산하여 표시
+        changed = self.data_handler.recalculate_row(row, col)
+        for formula_col in changed:
+            self.mark_row_changed(row, formula_col)
+        instrument.count('table.cells_touched', 1 + len(changed))
+
+    def set_edited_value(self, row, col, value):
+        # 차트 이동으로 변경된 값 저장, 셀 스타일을 변경하여 표시
+        if self.is_formula_column(col):
+            return
+        self.edited_cells.add((row, col))
+        self.write_value(row, col, value)
+
+    def set_highlighted_row(self, row):
+        previous_row = self.highlighted_row
+        self.highlighted_row = row
+        last_column = self.columnCount() - 1
+        if previous_row != -1:
+            self.mark_row_changed(previous_row, 0, last_column)
+        if row != -1:
+            self.mark_row_changed(row, 0, last_column)
+
+    def clear_styles(self):
+        # 테이블에 적용된 강조 표시를 모두 제거
+        if not self.edited_cells and self.highlighted_row == -1:
+            return
+        self.edited_cells.clear()
+        self.highlighted_row = -1
+        self.mark_changed(0, 0, self.rowCount() - 1, self.columnCount() - 1)
+
+    def is_formula_column(self, col):
+        details = self.data_handler.get_column_info().get(col)
+        return details is not None and details['is_formula']
+
+    def is_numeric_column(self, col):
+        details = self.data_handler.get_column_info().get(col)
+        return details is not None and details['name'] not in TEXT_COLUMN_LIST
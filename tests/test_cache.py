@@ -0,0 +1,77 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from cache import WorkbookCache
+
+
+def make_data():
+    data = pd.DataFrame({'Key': np.array(['K-1', 'K-2', 'K-3'], dtype=object), 'X': [1.5, 2.5, 3.5]},
+                        index=range(1, 4))
+    column_info = {0: {'name': 'Key', 'alphabet': 'A', 'is_formula': False},
+                   1: {'name': 'X', 'alphabet': 'B', 'is_formula': False}}
+    return data, column_info, {2: np.array([3.0, 5.0, 7.0])}
+
+
+def write_file(path, content):
+    with open(path, 'wb') as f:
+        f.write(content)
+    return str(path)
+
+
+def store(cache, file_path, sheet_name='Sheet1'):
+    cached, key = cache.load(file_path, sheet_name)
+    assert cached is None
+    cache.store(key, *make_data(), sheet_name)
+    return key[0]
+
+
+def test_hit_returns_stored_columns(tmp_path):
+    file_path = write_file(tmp_path / 'a.xlsx', b'workbook a')
+    cache = WorkbookCache(str(tmp_path / 'cache'))
+    store(cache, file_path)
+
+    # 새 객체도 manifest 에서 같은 항목을 찾는다
+    cached, _ = WorkbookCache(str(tmp_path / 'cache')).load(file_path, 'Sheet1')
+    data, column_info, formula_values, sheet_name = cached
+    expected, expected_info, expected_formulas = make_data()
+    assert list(data.columns) == ['Key', 'X']
+    assert list(data.index) == [1, 2, 3]
+    assert data['Key'].tolist() == expected['Key'].tolist()
+    assert np.array_equal(data['X'].to_numpy(), expected['X'].to_numpy())
+    assert column_info == expected_info
+    assert np.array_equal(formula_values[2], expected_formulas[2])
+    assert sheet_name == 'Sheet1'
+
+
+def test_miss_on_other_sheet_and_changed_file(tmp_path):
+    file_path = write_file(tmp_path / 'a.xlsx', b'workbook a')
+    cache = WorkbookCache(str(tmp_path / 'cache'))
+    name = store(cache, file_path)
+    assert cache.load(file_path, 'Sheet2')[0] is None
+
+    # 내용이 바뀌면 크기와 수정 시각이 달라져 해시를 다시 계산하고, 다른 항목이 된다
+    write_file(file_path, b'workbook a, edited')
+    os.utime(file_path, ns=(0, 1_000_000_000))
+    cached, key = cache.load(file_path, 'Sheet1')
+    assert cached is None
+    assert key[0] != name
+
+
+def test_evicts_least_recently_used(tmp_path):
+    cache = WorkbookCache(str(tmp_path / 'cache'))
+    files = [write_file(tmp_path / f'{i}.xlsx', f'workbook {i}'.encode()) for i in range(3)]
+    names = [store(cache, file_path) for file_path in files]
+    entry_bytes = cache.manifest[names[0]]['bytes']
+
+    # 첫 번째 항목을 가장 최근에 사용한 것으로 만들고, 두 항목만 들어가는 한도에서 새 항목 저장
+    for i, name in enumerate(names):
+        cache.manifest[name]['last_used'] = [3.0, 1.0, 2.0][i]
+    cache.max_bytes = entry_bytes * 2 + entry_bytes // 2
+    name = store(cache, write_file(tmp_path / '3.xlsx', b'workbook 3'))
+
+    assert set(cache.manifest) == {names[0], name}
+    assert not os.path.isdir(cache.entry_dir(names[1]))
+    assert not os.path.isdir(cache.entry_dir(names[2]))
+    assert set(WorkbookCache(str(tmp_path / 'cache')).manifest) == {names[0], name}
@@ -0,0 +1,151 @@
+import zipfile
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import pytest
+
+from data_handler import DataHandler, unsupported_parts, write_patches
+from formula import evaluate_formulas
+
+
+def make_handler(rows=5):
+    # 컬럼 문자: A=Key, B=Summary, C, D 숫자, E=C+D, F=E*2, G=F-C (연쇄 수식)
+    data = pd.DataFrame({
+        'Key': [f'K-{i}' for i in range(rows)],
+        'Summary': [f'item {i}' for i in range(rows)],
+        'Impact': np.arange(rows, dtype=np.float64),
+        'Score': np.arange(rows, dtype=np.float64) * 10,
+        'Sum': ['=C2+D2'] * rows,
+        'Double': ['=E2*2'] * rows,
+        'Diff': ['=F2-C2'] * rows,
+    })
+    handler = DataHandler()
+    handler.set_data(data)
+    handler.calculate_formulas()
+    return handler
+
+
+def test_dependent_columns_follow_chain_in_order():
+    handler = make_handler()
+    assert handler.dependent_columns(2) == [4, 5, 6]
+    assert handler.dependent_columns(3) == [4, 5, 6]
+    assert handler.dependent_columns(4) == [5, 6]
+    assert handler.dependent_columns(1) == []
+
+
+def test_recalculate_row_updates_only_that_row():
+    handler = make_handler()
+    before = {index: values.copy() for index, values in handler.formula_values.items()}
+    handler.set_value(2, 2, 7.5)
+    changed = handler.recalculate_row(2, 2)
+
+    assert changed == [4, 5, 6]
+    assert handler.formula_values[4][2] == 27.5
+    assert handler.formula_values[5][2] == 55.0
+    assert handler.formula_values[6][2] == 47.5
+    for index, values in before.items():
+        others = np.arange(len(values)) != 2
+        assert np.array_equal(handler.formula_values[index][others], values[others])
+
+    # 전체를 다시 계산한 결과와 같다
+    expected = evaluate_formulas(handler.data, handler.formulas)
+    for index, values in expected.items():
+        assert np.array_equal(handler.formula_values[index], values)
+
+
+def test_recalculate_row_without_change():
+    handler = make_handler()
+    handler.set_value(1, 3, 10.0)  # 원래 값과 같다
+    assert handler.recalculate_row(1, 3) == []
+
+
+def test_formula_result_becoming_float_is_written_in_place():
+    # 정수 컬럼을 참조하는 수식의 결과가 셀 편집으로 소수가 되어도 테이블과 차트가 보는 배열이 바뀌지 않는다
+    data = pd.DataFrame({'Key': ['K-0', 'K-1'], 'Count': np.array([1, 2], dtype=np.int64), 'Twice': ['=B2*2'] * 2})
+    handler = DataHandler()
+    handler.set_data(data)
+    handler.calculate_formulas()
+    view = handler.get_table_data(['Key', 'Twice'])
+    assert handler.formula_values[2].dtype == np.float64
+
+    handler.set_value(1, 1, 2.25)
+    assert handler.recalculate_row(1, 1) == [2]
+    assert view.iat[1, 1] == 4.5
+    assert view['Twice'].tolist() == [2.0, 4.5]
+
+
+def test_table_data_follows_key_edits(tmp_path):
+    # 파일에서 읽은 Key/Summary 컬럼도 사본이 아닌 저장된 배열을 참조한다
+    path = tmp_path / 'book.csv'
+    path.write_text('Key,Summary,Impact,Effort\nK-0,first,1,2\nK-1,second,3,4\n', encoding='utf-8')
+    handler = DataHandler()
+    handler.load_data(str(path))
+    view = handler.get_table_data(['Impact', 'Effort', 'Key', 'Summary'])
+
+    handler.set_value(1, 0, 'K-9')
+    handler.set_value(0, 1, 'renamed')
+    handler.set_value(0, 2, 5.5)
+    assert view['Key'].tolist() == ['K-0', 'K-9']
+    assert view.iat[0, 3] == 'renamed'
+    assert view.iat[0, 0] == 5.5
+    assert handler.get_row('K-9') == 1
+
+
+def make_workbook(path):
+    wb = openpyxl.Workbook()
+    wb.active.title = 'First'
+    wb.active.append(['Key', 'Score'])
+    wb.active.append(['K-1', 1])
+    second = wb.create_sheet('Second')
+    second.append(['Key', 'Score'])
+    second.append(['K-1', 10])
+    wb.save(path)
+    return str(path)
+
+
+def test_full_and_streaming_load_give_same_columns(tmp_path):
+    # 기존 전체 로드(성능 비교용)도 숫자 컬럼은 float64, 텍스트와 수식 컬럼은 object 로 읽는다
+    path = tmp_path / 'book.xlsx'
+    wb = openpyxl.Workbook()
+    for row in (['Key', 'Summary', 'Impact', 'Effort', 'Sum'], ['K-1', 'first', 1, 2.5, '=C2+D2'],
+                ['K-2', None, 3, None, '=C3+D3']):
+        wb.active.append(row)
+    wb.save(path)
+
+    frames = []
+    for streaming in (False, True):
+        handler = DataHandler()
+        handler.load_data(str(path), streaming=streaming)
+        frames.append(handler.get_data())
+    full, streamed = frames
+    assert [str(dtype) for dtype in full.dtypes] == ['object', 'object', 'float64', 'float64', 'object']
+    assert list(full.dtypes) == list(streamed.dtypes)
+    assert list(full.index) == [1, 2]
+    assert full.equals(streamed)
+
+
+def test_write_patches_writes_named_sheet(tmp_path):
+    source = make_workbook(tmp_path / 'book.xlsx')
+    write_patches(source, str(tmp_path / 'out.xlsx'), {'Second': [(0, 1, 20)]})
+    wb = openpyxl.load_workbook(tmp_path / 'out.xlsx')
+    assert wb['Second'].cell(row=2, column=2).value == 20
+    assert wb['First'].cell(row=2, column=2).value == 1
+
+
+def test_write_patches_rejects_missing_sheet(tmp_path):
+    # 없는 시트의 편집을 다른 시트에 쓰지 않고, 파일도 만들지 않는다
+    source = make_workbook(tmp_path / 'book.xlsx')
+    with pytest.raises(ValueError, match='Renamed'):
+        write_patches(source, str(tmp_path / 'out.xlsx'), {'First': [(0, 1, 2)], 'Renamed': [(0, 1, 3)]})
+    assert not (tmp_path / 'out.xlsx').exists()
+
+
+def test_unsupported_parts(tmp_path):
+    source = make_workbook(tmp_path / 'book.xlsx')
+    assert unsupported_parts(source) == []
+
+    with zipfile.ZipFile(source, 'a') as archive:
+        archive.writestr('xl/charts/chart1.xml', '<chartSpace/>')
+        archive.writestr('xl/media/image1.png', b'')
+    assert unsupported_parts(source) == ['xl/charts/', 'xl/media/']
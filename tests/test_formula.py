@@ -0,0 +1,98 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from formula import Formula, FormulaError, build_dependents, compile_formulas, evaluate_formulas, formula_order, \
+    round_half
+
+
+def column_info(*formulas):
+    # A, B 는 숫자 컬럼, 이후 컬럼은 주어진 수식
+    info = {0: {'alphabet': 'A', 'name': 'A', 'is_formula': False, 'formula': 1},
+            1: {'alphabet': 'B', 'name': 'B', 'is_formula': False, 'formula': 2}}
+    for i, text in enumerate(formulas, start=2):
+        info[i] = {'alphabet': chr(65 + i), 'name': chr(65 + i), 'is_formula': True, 'formula': text}
+    return info
+
+
+def columns_of(a, b):
+    arrays = {0: np.asarray(a, dtype=np.float64), 1: np.asarray(b, dtype=np.float64)}
+    return lambda index: arrays[index]
+
+
+def test_parse_references_and_precedence():
+    formula = Formula('=A2+B2*2', column_info())
+    assert formula.references == {0, 1}
+    result = formula.evaluate(columns_of([1, 2], [3, 4]), 2)
+    assert result.tolist() == [7, 10]
+    assert result.dtype == np.float64
+
+
+def test_parentheses_unary_and_absolute_references():
+    formula = Formula('=-($A$2+B2)/2', column_info())
+    assert formula.evaluate(columns_of([1, 2], [2, 5]), 2).tolist() == [-1.5, -3.5]
+
+
+@pytest.mark.parametrize('text', ['=A2+Z2', '=A2+', '=(A2+B2', '=A2 % B2', '=A2 B2'])
+def test_invalid_formula(text):
+    with pytest.raises(FormulaError):
+        Formula(text, column_info())
+
+
+def test_unknown_reference_compiles_to_none():
+    formulas = compile_formulas(column_info('=A2+Q2'))
+    assert formulas[2] is None
+
+
+def test_division_by_zero_gives_zero():
+    formula = Formula('=A2/B2', column_info())
+    assert formula.evaluate(columns_of([1, 4], [0, 2]), 2).tolist() == [0.0, 2.0]
+
+
+def test_non_numeric_cell_gives_zero():
+    data = pd.DataFrame({'A': [1.0, 2.0], 'B': ['x', '3']})
+    formulas = compile_formulas(column_info('=A2+B2'))
+    assert evaluate_formulas(data, formulas)[2].tolist() == [0.0, 5.0]
+
+
+def test_round_half_matches_python_round():
+    # np.round 과 결과가 다른 경계 값 (1.05 는 10진수로 1.0500000000000000444...)
+    values = np.array([1.05, 0.15, 2.25, -1.05, 0.35, 12.3449, np.nan])
+    expected = [round(float(value), 1) for value in values[:-1]]
+    result = round_half(values, 1)
+    assert result[:-1].tolist() == expected
+    assert np.isnan(result[-1])
+
+
+def test_evaluate_rounds_like_python():
+    rng = np.random.default_rng(0)
+    a = np.round(rng.uniform(-100, 100, 2000), 2)
+    b = np.round(rng.uniform(0.5, 20, 2000), 2)
+    result = Formula('=A2/B2', column_info()).evaluate(lambda index: (a, b)[index], len(a))
+    assert result.tolist() == [round(float(x) / float(y), 1) for x, y in zip(a, b)]
+
+
+def test_formula_order_puts_references_first():
+    formulas = compile_formulas(column_info('=D2*2', '=A2+B2', '=C2-D2'))
+    order, cyclic = formula_order(formulas)
+    assert order.index(3) < order.index(2) < order.index(4)
+    assert cyclic == set()
+
+
+def test_formula_order_reports_cycles():
+    formulas = compile_formulas(column_info('=D2+1', '=C2+1', '=A2'))
+    order, cyclic = formula_order(formulas)
+    assert cyclic == {2, 3}
+    assert order == [4]
+
+
+def test_build_dependents():
+    formulas = compile_formulas(column_info('=A2+B2', '=C2*2', '=A2+Z2'))
+    assert build_dependents(formulas) == {0: {2}, 1: {2}, 2: {3}}
+
+
+def test_chained_formulas_use_computed_results():
+    data = pd.DataFrame({'A': [1.0, 2.0], 'B': [3.0, 4.0], 'C': ['=A2+B2'] * 2, 'D': ['=C2*2'] * 2})
+    results = evaluate_formulas(data, compile_formulas(column_info('=A2+B2', '=C2*2')))
+    assert results[2].tolist() == [4.0, 6.0]
+    assert results[3].tolist() == [8.0, 12.0]
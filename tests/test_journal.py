@@ -0,0 +1,60 @@
+import numpy as np
+
+from journal import Journal, journal_path
+
+
+def test_append_and_read_back(tmp_path):
+    journal = Journal(str(tmp_path / 'book.xlsx'))
+    assert not journal.has_records()
+    assert journal.append('Sheet1', 'K-1', 'Score', np.float64(1.5), 2.5) == 1
+    assert journal.append('Sheet1', 'K-2', 'Key', 'K-2', 'K-9') == 2
+    journal.close()
+
+    records = Journal(str(tmp_path / 'book.xlsx')).records()
+    assert [record['seq'] for record in records] == [1, 2]
+    assert records[0] == {'seq': 1, 'sheet': 'Sheet1', 'key': 'K-1', 'column': 'Score', 'old': 1.5, 'new': 2.5}
+    assert records[1]['new'] == 'K-9'
+
+
+def test_reopen_continues_sequence(tmp_path):
+    journal = Journal(str(tmp_path / 'book.xlsx'))
+    journal.append('Sheet1', 'K-1', 'Score', 1, 2)
+    journal.append('Sheet1', 'K-1', 'Score', 2, 3)
+    journal.close()
+
+    journal = Journal(str(tmp_path / 'book.xlsx'))
+    assert journal.seq == 2
+    assert journal.append('Sheet1', 'K-1', 'Score', 3, 4) == 3
+    journal.close()
+
+
+def test_torn_last_line_is_dropped(tmp_path):
+    # 기록 도중 종료되어 마지막 줄이 잘린 경우
+    journal = Journal(str(tmp_path / 'book.xlsx'))
+    journal.append('Sheet1', 'K-1', 'Score', 1, 2)
+    journal.append('Sheet1', 'K-2', 'Score', 5, 6)
+    journal.close()
+    path = journal_path(str(tmp_path / 'book.xlsx'))
+    with open(path, 'rb') as f:
+        content = f.read()
+    with open(path, 'wb') as f:
+        f.write(content[:-10])
+
+    journal = Journal(str(tmp_path / 'book.xlsx'))
+    assert [record['key'] for record in journal.records()] == ['K-1']
+    assert journal.seq == 1
+
+
+def test_compact_keeps_later_records(tmp_path):
+    journal = Journal(str(tmp_path / 'book.xlsx'))
+    for value in range(3):
+        journal.append('Sheet1', 'K-1', 'Score', value, value + 1)
+    journal.compact(2)
+    assert [record['seq'] for record in journal.records()] == [3]
+
+    # 이어서 기록한 편집도 남는다
+    journal.append('Sheet1', 'K-1', 'Score', 3, 4)
+    journal.compact(3)
+    assert [record['seq'] for record in journal.records()] == [4]
+    journal.compact(4)
+    assert not journal.has_records()
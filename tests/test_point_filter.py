@@ -0,0 +1,110 @@
+import operator
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_handler import DataHandler
+from point_filter import filter_mask, numeric_values, parse_filter
+from text_index import TokenIndex, tokenize
+
+WORDS = ['alpha', 'alps', 'beta', 'bet', 'gamma', 'Gam', 'delta', 'del_1', '한글', '한국']
+
+
+def make_columns(rows, seed=0):
+    rng = np.random.default_rng(seed)
+    return {name: [' '.join(rng.choice(WORDS, rng.integers(0, 4)).tolist()) for _ in range(rows)]
+            for name in ('Key', 'Summary')}
+
+
+def brute_force(columns, rows, terms):
+    # 모든 검색어에 대해, 그 검색어로 시작하는 단어가 어느 컬럼에든 있는 row
+    result = []
+    for row in range(rows):
+        words = set().union(*(tokenize(values[row]) for values in columns.values()))
+        if all(any(word.startswith(term) for word in words) for term in terms):
+            result.append(row)
+    return result
+
+
+def test_tokenize():
+    assert tokenize('Fix login-Page, v2.0 로그인') == {'fix', 'login', 'page', 'v2', '0', '로그인'}
+    assert tokenize(12.5) == {'12', '5'}
+
+
+@pytest.mark.parametrize('terms', [['al'], ['alp'], ['bet', 'gam'], ['del_'], ['한'], ['x'], ['a', 'b', 'd']])
+def test_mask_matches_brute_force(terms):
+    columns = make_columns(200)
+    index = TokenIndex(columns, 200)
+    assert np.flatnonzero(index.mask(terms)).tolist() == brute_force(columns, 200, terms)
+
+
+def test_mask_without_terms():
+    assert TokenIndex(make_columns(5), 5).mask([]) is None
+
+
+def test_update_matches_rebuilt_index():
+    # 셀 편집을 반영한 색인은 처음부터 다시 만든 색인과 같다
+    columns = make_columns(50)
+    index = TokenIndex(columns, 50)
+    rng = np.random.default_rng(1)
+    for _ in range(200):
+        name = ('Key', 'Summary')[rng.integers(2)]
+        row = int(rng.integers(50))
+        value = ' '.join(rng.choice(WORDS + ['zeta', 'omega'], rng.integers(0, 3)).tolist())
+        columns[name][row] = value
+        index.update(name, row, value)
+
+    rebuilt = TokenIndex(columns, 50)
+    assert index.tokens == rebuilt.tokens
+    assert index.postings.keys() == rebuilt.postings.keys()
+    for token, rows in rebuilt.postings.items():
+        assert index.postings[token].tolist() == rows.tolist()
+    index.update('Impact', 0, 'ignored')  # 색인하지 않는 컬럼
+    assert index.tokens == rebuilt.tokens
+
+
+def test_parse_filter():
+    # 없는 컬럼의 조건은 단어로 나눠서 검색어가 된다
+    columns = {'Impact', 'Effort', 'Score', 'Key'}
+    terms, conditions = parse_filter('Impact>=2.5 login Effort!=-1 Score<.5 Missing>3 Key=7', columns)
+    assert terms == ['login', '3', 'missing']
+    assert conditions == [('Impact', operator.ge, 2.5), ('Effort', operator.ne, -1.0), ('Score', operator.lt, 0.5),
+                          ('Key', operator.eq, 7.0)]
+
+
+@pytest.mark.parametrize('text', ['Impact>', 'Impact>=abc', 'Impact=>3', 'Impact>3x'])
+def test_parse_filter_malformed_conditions_are_terms(text):
+    terms, conditions = parse_filter(text, {'Impact'})
+    assert conditions == []
+    assert terms == sorted(tokenize(text))
+
+
+def test_numeric_values():
+    values = np.array([1.0, 2.0])
+    assert numeric_values(values) is values
+    result = numeric_values(np.array(['1.5', 'x', 3], dtype=object))
+    assert result[0] == 1.5 and np.isnan(result[1]) and result[2] == 3.0
+
+
+def test_filter_mask():
+    data = pd.DataFrame({
+        'Key': ['LOGIN-1', 'LOGIN-2', 'PAY-1', 'PAY-2'],
+        'Summary': ['fix login page', 'login timeout', 'refund', 'login with pay'],
+        'Impact': [1.0, 5.0, 7.0, 9.0],
+        'Effort': [2.0, 2.0, 8.0, 1.0],
+        'Score': ['=C2*D2'] * 4,
+    })
+    handler = DataHandler()
+    handler.set_data(data)
+    handler.calculate_formulas()
+
+    assert filter_mask(handler, '') is None
+    assert filter_mask(handler, 'login').tolist() == [True, True, False, True]
+    assert filter_mask(handler, 'login Impact>=5').tolist() == [False, True, False, True]
+    assert filter_mask(handler, 'Score>9').tolist() == [False, True, True, False]  # 수식은 계산 결과로 비교
+
+    x, y = data['Impact'].to_numpy(), data['Effort'].to_numpy()
+    points = (x, y, 5.0, 2.0)
+    assert filter_mask(handler, '', (True, True), points).tolist() == [False, True, True, False]
+    assert filter_mask(handler, 'pay', (True, False), points).tolist() == [False, False, False, True]
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from quadrant_stats import QUADRANTS, QuadrantStats
+
+
+def brute_force(x, y, x_mid, y_mid):
+    # 점마다 사분면을 정해서 센다, 중앙선 위의 점은 높은 쪽
+    result = {quadrant: [0, 0.0, 0.0] for quadrant in QUADRANTS}
+    for px, py in zip(x, y):
+        if not (np.isfinite(px) and np.isfinite(py)):
+            continue
+        entry = result[(bool(px >= x_mid), bool(py >= y_mid))]
+        entry[0] += 1
+        entry[1] += px
+        entry[2] += py
+    return result
+
+
+def assert_matches(summary, expected):
+    # 합계는 누적합의 차이로 구하므로 빈 사분면에도 아주 작은 오차가 남는다
+    for quadrant in QUADRANTS:
+        count, sum_x, sum_y = expected[quadrant]
+        assert summary[quadrant]['count'] == count
+        assert summary[quadrant]['sum_x'] == pytest.approx(sum_x, abs=1e-6)
+        assert summary[quadrant]['sum_y'] == pytest.approx(sum_y, abs=1e-6)
+        if count:
+            assert summary[quadrant]['mean_x'] == pytest.approx(sum_x / count)
+        else:
+            assert summary[quadrant]['mean_x'] is None
+
+
+@pytest.mark.parametrize('moving', ['x', 'y'])
+def test_quadrants_match_brute_force(moving):
+    # 소수 첫째 자리 값이라 중앙선 위에 놓이는 점이 많다
+    rng = np.random.default_rng(1)
+    x = np.round(rng.uniform(0, 100, 500), 1)
+    y = np.round(rng.uniform(0, 100, 500), 1)
+    x[::37] = np.nan
+    stats = QuadrantStats()
+    stats.set_points(x, y)
+    for x_mid, y_mid in [(50.0, 50.0), (x[1], y[2]), (-1.0, 101.0), (101.0, -1.0)] + \
+            [tuple(mid) for mid in np.round(rng.uniform(0, 100, (30, 2)), 1)]:
+        expected = brute_force(x, y, x_mid, y_mid)
+        assert_matches(stats.quadrants(x_mid, y_mid, moving), expected)
+        assert_matches(stats.compute(x_mid, y_mid), expected)
+
+
+def test_moved_points_are_resorted():
+    stats = QuadrantStats()
+    x = np.array([10.0, 20.0, 30.0])
+    y = np.array([10.0, 20.0, 30.0])
+    stats.set_points(x, y)
+    assert stats.quadrants(15.0, 15.0)[(True, True)]['count'] == 2
+
+    # 같은 배열을 바꿔서 다시 넘겨도 보관한 사본과 비교하여 다시 정렬한다
+    x[0], y[0] = 40.0, 40.0
+    stats.set_points(x, y)
+    assert stats.quadrants(15.0, 15.0)[(True, True)]['count'] == 3
+    assert stats.quadrants(15.0, 15.0)[(False, False)]['count'] == 0
+
+
+def test_no_points():
+    assert QuadrantStats().quadrants(0.0, 0.0) is None
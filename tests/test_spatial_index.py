@@ -0,0 +1,44 @@
+import numpy as np
+
+from spatial_index import GridIndex
+
+
+def brute_force(boxes, x, y):
+    x0, x1 = np.minimum(boxes[:, 0], boxes[:, 2]), np.maximum(boxes[:, 0], boxes[:, 2])
+    y0, y1 = np.minimum(boxes[:, 1], boxes[:, 3]), np.maximum(boxes[:, 1], boxes[:, 3])
+    return np.flatnonzero((x0 <= x) & (x <= x1) & (y0 <= y) & (y <= y1)).tolist()
+
+
+def test_query_matches_brute_force():
+    rng = np.random.default_rng(0)
+    corners = rng.uniform(0, 500, (300, 2))
+    boxes = np.column_stack([corners, corners + rng.uniform(2, 40, (300, 2))])
+    index = GridIndex(boxes)
+    for x, y in rng.uniform(-10, 550, (500, 2)):
+        assert index.query(x, y) == brute_force(boxes, x, y)
+
+
+def test_topmost_returns_last_drawn():
+    index = GridIndex([[0, 0, 10, 10], [5, 5, 15, 15], [100, 100, 110, 110]])
+    assert index.topmost(7, 7) == 1
+    assert index.topmost(2, 2) == 0
+    assert index.topmost(50, 50) is None
+
+
+def test_reversed_corners_and_nan_boxes():
+    # 반전된 축에서는 모서리 순서가 뒤집히고, 숨긴 점은 NaN
+    index = GridIndex([[10, 10, 0, 0], [np.nan, np.nan, np.nan, np.nan]])
+    assert len(index) == 2
+    assert index.query(5, 5) == [0]
+
+
+def test_box_spanning_many_cells():
+    index = GridIndex([[0, 0, 2, 2], [0, 0, 200, 3]], cell_size=2)
+    assert index.query(150, 1) == [1]
+    assert index.query(1, 1) == [0, 1]
+
+
+def test_empty_index():
+    index = GridIndex(np.empty((0, 4)))
+    assert len(index) == 0
+    assert index.topmost(1, 1) is None
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+from PyQt5.QtCore import QCoreApplication
+
+from data_handler import DataHandler
+from table_model import DataFrameTableModel
+
+
+@pytest.fixture(scope='module')
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def make_model():
+    # 컬럼 문자: A=Key, B=Summary, C, D 숫자, E=C+D
+    data = pd.DataFrame({
+        'Key': np.array(['K-0', 'K-1', 'K-2'], dtype=object),
+        'Summary': np.array(['a', 'b', 'c'], dtype=object),
+        'Impact': [1.0, 2.0, 3.0],
+        'Score': [10.0, 20.0, 30.0],
+        'Sum': ['=C2+D2'] * 3,
+    })
+    handler = DataHandler()
+    handler.set_data(data)
+    handler.calculate_formulas()
+    model = DataFrameTableModel(handler)
+    edited, invalid = [], []
+    model.cell_edited.connect(lambda row, col: edited.append((row, col)))
+    model.invalid_input.connect(lambda row, col: invalid.append((row, col)))
+    return model, handler, edited, invalid
+
+
+def test_numeric_input_emits_cell_edited(app):
+    model, handler, edited, invalid = make_model()
+    assert model.setData(model.index(1, 3), '42.5')
+    assert handler.get_data().iat[1, 3] == 42.5
+    assert handler.get_formula_values()[4][1] == 44.5
+    assert edited == [(1, 3)]
+    assert invalid == []
+
+
+def test_invalid_input_writes_zero_and_emits_cell_edited(app):
+    # 0 으로 바뀐 값도 차트에 반영되어야 하므로 cell_edited 와 invalid_input 을 모두 알린다
+    model, handler, edited, invalid = make_model()
+    assert model.setData(model.index(1, 3), 'abc')
+    assert handler.get_data().iat[1, 3] == 0
+    assert handler.get_formula_values()[4][1] == 2.0
+    assert model.data(model.index(1, 3)) == '0'
+    assert edited == [(1, 3)]
+    assert invalid == [(1, 3)]
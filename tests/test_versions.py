@@ -0,0 +1,97 @@
+import numpy as np
+import pytest
+
+from versions import VersionTimeline, fill_missing, load_version
+
+
+def version(name, rows):
+    # rows: [(Key, x, y, Summary)]
+    return {'file': name, 'keys': [row[0] for row in rows], 'summaries': [row[3] for row in rows],
+            'x': np.array([row[1] for row in rows], dtype=np.float64),
+            'y': np.array([row[2] for row in rows], dtype=np.float64)}
+
+
+def random_versions(count, seed=0):
+    rng = np.random.default_rng(seed)
+    versions = []
+    for i in range(count):
+        keys = [f'K-{k}' for k in rng.choice(40, 30)]  # 버전마다 일부 Key 만 있고 중복도 있다
+        versions.append(version(f'v{i}', [(key, *rng.uniform(0, 100, 2).round(1), f'{key} v{i}') for key in keys]))
+    return versions
+
+
+def test_join_matches_dictionary_lookup():
+    versions = random_versions(5)
+    timeline = VersionTimeline(versions)
+
+    # 모든 버전의 Key 를 처음 나온 순서대로, 버전 안의 중복 Key 는 첫 번째 row
+    keys = list(dict.fromkeys(key for v in versions for key in v['keys']))
+    assert timeline.keys == keys
+    for i, v in enumerate(versions):
+        first = {}
+        for row, key in enumerate(v['keys']):
+            first.setdefault(key, row)
+        for position, key in enumerate(keys):
+            assert timeline.present[i, position] == (key in first)
+            if key in first:
+                assert timeline.x[i, position] == v['x'][first[key]]
+                assert timeline.y[i, position] == v['y'][first[key]]
+
+    summaries = {}
+    for v in versions:
+        summaries.update({key: summary for key, summary in reversed(list(zip(v['keys'], v['summaries'])))})
+    assert timeline.summaries == [summaries[key] for key in keys]
+
+
+def test_missing_versions_are_filled_from_neighbours():
+    values = np.array([[np.nan, 1.0], [2.0, np.nan], [np.nan, np.nan], [4.0, 5.0]])
+    present = ~np.isnan(values)
+    # 이전 버전 값, 처음 버전처럼 이전이 없으면 이후 버전 값
+    assert fill_missing(values, present).tolist() == [[2.0, 1.0], [2.0, 1.0], [2.0, 1.0], [4.0, 5.0]]
+
+
+def test_frame_interpolates_between_versions():
+    timeline = VersionTimeline([
+        version('v0', [('A', 0.0, 10.0, ''), ('B', 50.0, 50.0, '')]),
+        version('v1', [('A', 10.0, 30.0, ''), ('C', 20.0, 20.0, '')]),
+        version('v2', [('A', 30.0, 30.0, ''), ('C', 40.0, 0.0, '')]),
+    ])
+    assert timeline.keys == ['A', 'B', 'C']
+
+    x, y, visible = timeline.frame(0.25)
+    assert x.tolist() == pytest.approx([2.5, 50.0, 20.0])
+    assert y.tolist() == pytest.approx([15.0, 50.0, 20.0])
+    assert visible.tolist() == [True, True, True]  # 사라지는 B 와 나타나는 C 는 전환 중에 보인다
+
+    x, y, visible = timeline.frame(1.5)
+    assert x.tolist() == pytest.approx([20.0, 50.0, 30.0])
+    assert visible.tolist() == [True, False, True]
+
+    # 버전 위치에서는 그 버전에 있는 항목만, 범위 밖은 처음과 마지막 버전
+    assert timeline.frame(0)[2].tolist() == [True, True, False]
+    assert timeline.frame(2)[2].tolist() == [True, False, True]
+    assert timeline.frame(-1)[0].tolist() == timeline.frame(0)[0].tolist()
+    assert timeline.frame(5)[0].tolist() == [30.0, 50.0, 40.0]
+
+    assert timeline.quadrant_moves(25.0, 25.0).tolist() == [1, 2]
+    assert timeline.bounds() == (50.0, 50.0)
+
+
+def test_single_version():
+    timeline = VersionTimeline([version('v0', [('A', 1.0, 2.0, 'a')])])
+    x, y, visible = timeline.frame(0.7)
+    assert (x.tolist(), y.tolist(), visible.tolist()) == ([1.0], [2.0], [True])
+    assert timeline.quadrant_moves(0.0, 0.0).tolist() == []
+
+
+def test_load_version(tmp_path):
+    path = tmp_path / 'week1.csv'
+    path.write_text('Key,Summary,Impact,Effort,Score\nK-1,a,1,2,=C2+D2\nK-2,b,3,4,=C3+D3\n', encoding='utf-8')
+    loaded = load_version(str(path), 'Impact', 'Score', use_cache=False)
+    assert loaded['keys'] == ['K-1', 'K-2']
+    assert loaded['summaries'] == ['a', 'b']
+    assert loaded['x'].tolist() == [1.0, 3.0]
+    assert loaded['y'].tolist() == [3.0, 7.0]
+
+    with pytest.raises(ValueError, match='Missing'):
+        load_version(str(path), 'Impact', 'Missing', use_cache=False)
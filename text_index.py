@@ -0,0 +1,80 @@
+# 텍스트 컬럼(Key, Summary) 단어 색인: 단어 -> 그 단어가 들어 있는 row 위치(0부터 시작) 배열
+# 검색어로 시작하는 단어를 정렬된 단어 목록에서 이진 탐색으로 찾고, 결과는 row 수 길이의 bool 배열(mask)로 돌려준다
+import bisect
+import re
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r'\w+')
+
+
+def tokenize(value):
+    # 대소문자 구분 없이 단어 단위로 나눈다
+    return set(TOKEN_PATTERN.findall(str(value).lower()))
+
+
+class TokenIndex:
+    def __init__(self, columns, row_count):
+        # columns: {컬럼 이름: 값 목록}
+        self.row_count = row_count
+        self.row_tokens = {}  # 컬럼 이름 -> row 별 단어 집합, 셀 편집 시 이전 단어를 찾기 위해 보관
+        postings = {}
+        for name, values in columns.items():
+            tokens_by_row = [tokenize(value) for value in values]
+            self.row_tokens[name] = tokens_by_row
+            for row, tokens in enumerate(tokens_by_row):
+                for token in tokens:
+                    postings.setdefault(token, []).append(row)
+
+        # 여러 컬럼에 같은 단어가 있으면 row 가 중복되므로 정렬하면서 합친다
+        self.postings = {token: np.unique(np.array(rows, dtype=np.int64)) for token, rows in postings.items()}
+        self.tokens = sorted(self.postings)
+
+    def row_words(self, row, skip=None):
+        # row 의 모든 텍스트 컬럼 단어, skip 컬럼은 제외
+        words = set()
+        for name, tokens_by_row in self.row_tokens.items():
+            if name != skip:
+                words |= tokens_by_row[row]
+        return words
+
+    def update(self, name, row, value):
+        # 셀 하나가 바뀌었을 때 해당 row 의 단어만 색인에서 빼고 더한다
+        if name not in self.row_tokens:
+            return
+        others = self.row_words(row, skip=name)
+        old = self.row_tokens[name][row]
+        new = tokenize(value)
+        self.row_tokens[name][row] = new
+
+        for token in old - new - others:
+            rows = self.postings[token]
+            rows = rows[rows != row]
+            if len(rows):
+                self.postings[token] = rows
+            else:
+                del self.postings[token]
+                del self.tokens[bisect.bisect_left(self.tokens, token)]
+        for token in new - old - others:
+            rows = self.postings.get(token)
+            if rows is None:
+                self.postings[token] = np.array([row], dtype=np.int64)
+                bisect.insort(self.tokens, token)
+            else:
+                self.postings[token] = np.insert(rows, np.searchsorted(rows, row), row)
+
+    def matching_tokens(self, term):
+        # term 으로 시작하는 단어들
+        start = bisect.bisect_left(self.tokens, term)
+        end = bisect.bisect_left(self.tokens, term + '\uffff')
+        return self.tokens[start:end]
+
+    def mask(self, terms):
+        # 모든 검색어를 만족하는(각 검색어로 시작하는 단어가 있는) row, 검색어가 없으면 None
+        result = None
+        for term in terms:
+            found = np.zeros(self.row_count, dtype=bool)
+            for token in self.matching_tokens(term):
+                found[self.postings[token]] = True
+            result = found if result is None else result & found
+        return result
@@ -0,0 +1,129 @@
+# 같은 통합 문서의 여러 버전(주간 스냅샷 등) 비교
+# 버전마다 별도 프로세스에서 DataHandler 로 읽고, Key 기준 hash join 으로 (버전 수, Key 수) 좌표 배열을 만든 뒤
+# 재생 프레임은 이웃한 두 버전 좌표를 배열 연산으로 선형 보간한다 (Qt 없이 numpy 로 계산)
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from cache import WorkbookCache
+from common import debug_print
+from data_handler import DataHandler, list_sheets
+from point_filter import numeric_values
+
+
+def load_version(file_path, x_column, y_column, sheet_name=None, use_cache=True):
+    # 프로세스 풀 작업 단위, 프로세스 간 전달 크기를 줄이기 위해 Key, Summary 와 축 값 배열만 돌려준다
+    # sheet_name 이 없는 버전은 첫 번째 시트를 읽는다
+    if sheet_name is not None and sheet_name not in list_sheets(file_path):
+        sheet_name = None
+
+    cache = None
+    if use_cache:
+        try:
+            cache = WorkbookCache()
+        except OSError as e:
+            debug_print(f"cache disabled: {e}")
+
+    handler = DataHandler()
+    handler.load_data(file_path, cache=cache, sheet_name=sheet_name)
+    if not handler.get_formula_values():
+        handler.calculate_formulas()
+
+    data = handler.get_data()
+    missing = [name for name in ('Key', x_column, y_column) if name not in data.columns]
+    if missing:
+        raise ValueError(f"{os.path.basename(file_path)}: missing columns {', '.join(map(str, missing))}")
+
+    def values(name):
+        return np.array(numeric_values(handler.column_values(data.columns.get_loc(name))), dtype=np.float64)
+
+    return {
+        'file': file_path,
+        'keys': data['Key'].tolist(),
+        'summaries': data['Summary'].tolist() if 'Summary' in data.columns else [''] * data.shape[0],
+        'x': values(x_column),
+        'y': values(y_column)
+    }
+
+
+def load_versions(file_paths, x_column, y_column, sheet_name=None, workers=None, progress=None):
+    # 여러 버전을 병렬로 읽어서 file_paths 순서대로 반환, progress(완료 수, 전체 수)
+    # GUI 프로세스는 스레드를 사용하므로 fork 대신 spawn 으로 워커 프로세스를 만든다
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        futures = [executor.submit(load_version, path, x_column, y_column, sheet_name) for path in file_paths]
+        for done, _ in enumerate(as_completed(futures), 1):
+            if progress is not None:
+                progress(done, len(futures))
+        return [future.result() for future in futures]
+
+
+def fill_missing(values, present):
+    # 버전에 없는 항목의 좌표는 가장 가까운 이전 버전(없으면 이후 버전) 값으로 채운다, 나타나고 사라질 때 제자리에 있도록
+    steps = np.arange(values.shape[0])[:, None]
+    forward = np.maximum.accumulate(np.where(present, steps, -1), axis=0)
+    backward = np.minimum.accumulate(np.where(present, steps, values.shape[0])[::-1], axis=0)[::-1]
+    source = np.where(forward >= 0, forward, backward)
+    return np.take_along_axis(values, source, axis=0)
+
+
+class VersionTimeline:
+    def __init__(self, versions):
+        # Key 기준 hash join: 모든 버전의 Key 합집합에 위치를 정하고, 버전별 row 를 합집합 위치로 옮긴다
+        # 한 버전에 같은 Key 가 여러 개면 첫 번째 row 사용 (DataHandler.key_index 와 같은 기준)
+        self.files = [version['file'] for version in versions]
+        key_position = {}
+        for version in versions:
+            for key in version['keys']:
+                key_position.setdefault(key, len(key_position))
+        self.keys = list(key_position)
+
+        shape = (len(versions), len(self.keys))
+        x = np.full(shape, np.nan)
+        y = np.full(shape, np.nan)
+        self.present = np.zeros(shape, dtype=bool)
+        summaries = np.empty(len(self.keys), dtype=object)
+        summaries[:] = ''
+        for i, version in enumerate(versions):
+            positions = np.fromiter((key_position[key] for key in version['keys']), dtype=np.int64,
+                                    count=len(version['keys']))
+            # 뒤에서부터 넣으면 같은 위치에 마지막으로 들어가는 값이 첫 번째 row 의 값
+            reverse = positions[::-1]
+            x[i, reverse] = version['x'][::-1]
+            y[i, reverse] = version['y'][::-1]
+            self.present[i, reverse] = True
+            version_summaries = np.empty(len(version['summaries']), dtype=object)
+            version_summaries[:] = version['summaries']
+            summaries[reverse] = version_summaries[::-1]  # 마지막 버전의 Summary 사용
+        self.summaries = summaries.tolist()
+
+        self.x = fill_missing(x, self.present)
+        self.y = fill_missing(y, self.present)
+
+    def __len__(self):
+        return len(self.files)
+
+    def frame(self, t):
+        # t: 0 ~ 버전 수 - 1 사이의 실수, 이웃한 두 버전 좌표를 선형 보간한 (x, y, 표시 여부)
+        last = len(self.files) - 1
+        t = min(max(t, 0.0), last)
+        if last == 0:
+            return self.x[0], self.y[0], self.present[0]
+        i = min(int(t), last - 1)
+        frac = t - i
+        x = self.x[i] + (self.x[i + 1] - self.x[i]) * frac
+        y = self.y[i] + (self.y[i + 1] - self.y[i]) * frac
+        visible = (self.present[i] & (frac < 1)) | (self.present[i + 1] & (frac > 0))
+        return x, y, visible
+
+    def quadrant_moves(self, x_mid, y_mid):
+        # 이웃한 버전 사이에 사분면이 바뀐 항목 수 (두 버전 모두에 있는 항목만), 길이는 버전 수 - 1
+        quadrant = (self.x >= x_mid) * 2 + (self.y >= y_mid)
+        moved = (quadrant[1:] != quadrant[:-1]) & self.present[1:] & self.present[:-1]
+        return moved.sum(axis=1)
+
+    def bounds(self):
+        # 모든 버전을 포함하는 차트 크기
+        return np.nanmax(self.x), np.nanmax(self.y)